@@ -277,6 +277,30 @@ class TrayApp(wx.App):
             else:
                 self.log.warning("⚠️ Impossible de démarrer le gestionnaire micro")
 
+            # Surveillance des blocages de la boucle wx
+            try:
+                from core.ui_monitor import get_ui_monitor
+
+                get_ui_monitor().start()
+            except Exception as e:
+                self.log.warning(f"⚠️ Moniteur de boucle wx indisponible: {e}")
+
+            # Suivi de la fenêtre active par événements (Windows), sinon TTL
+            try:
+                from core.context_tracker import get_context_tracker
+
+                get_context_tracker().start_event_hook()
+            except Exception as e:
+                self.log.warning(f"⚠️ Hook de changement de fenêtre indisponible: {e}")
+
+            # Mise en veille des grammaires inutilisées
+            try:
+                from core.hibernation import get_hibernation
+
+                get_hibernation().start()
+            except Exception as e:
+                self.log.warning(f"⚠️ Mise en veille des grammaires indisponible: {e}")
+
             # Final update with completion
             self._safe_update_progress("✅ Prêt! Démarrage terminé", 100)
 
@@ -589,6 +613,7 @@ class TaskBarIcon(wx.adv.TaskBarIcon):
         menu.Append(1, "Show Status")
         menu.Append(2, "GUI Grammar Manager")
         menu.Append(3, "Reload Grammars")
+        menu.Append(6, "Wake Grammars")
         menu.AppendSeparator()
         menu.Append(4, "Restart")
         menu.Append(5, "Quit")
@@ -598,6 +623,7 @@ class TaskBarIcon(wx.adv.TaskBarIcon):
         self.Bind(wx.EVT_MENU, self.on_menu_item, id=3)
         self.Bind(wx.EVT_MENU, self.on_menu_item, id=4)
         self.Bind(wx.EVT_MENU, self.on_menu_item, id=5)
+        self.Bind(wx.EVT_MENU, self.on_menu_item, id=6)
         return menu
 
     def set_icon(self):
@@ -627,6 +653,8 @@ class TaskBarIcon(wx.adv.TaskBarIcon):
             self.restart_app()
         elif eid == 5:
             self.quit_app()
+        elif eid == 6:
+            self.wake_grammars()
 
     def open_grammar_manager(self):
         """Open or show the grammar manager window."""
@@ -672,31 +700,81 @@ class TaskBarIcon(wx.adv.TaskBarIcon):
 
     def show_status(self):
         """Show current application status."""
-        from core import LOADED
+        from core import LOADED, LOADED_INFO
+        from core.grammar_loader import load_info_text
 
         if LOADED:
-            grammar_list = "\n".join([f"• {name}" for name in LOADED.keys()])
-            message = f"FTNatlink is running in background.\n\nLoaded grammars ({len(LOADED)}):\n{grammar_list}"
+            # Slowest imports first, with allocations and grammar/rule counts
+            lines = load_info_text()
+            lines += [name for name in LOADED if name not in LOADED_INFO]
+            grammar_list = "\n".join(f"• {line}" for line in lines)
+            total_ms = sum(info["import_ms"] for info in LOADED_INFO.values())
+            total_kb = sum(info["alloc_bytes"] for info in LOADED_INFO.values()) / 1024
+            message = (
+                f"FTNatlink is running in background.\n\nLoaded grammars ({len(LOADED)}, "
+                f"{total_ms:.0f} ms, {total_kb:.0f} KB at import):\n{grammar_list}"
+            )
         else:
             message = (
                 "FTNatlink is running in background.\n\nNo grammars currently loaded."
             )
 
+        try:
+            from core.async_runtime import get_async_runtime
+
+            runtime = get_async_runtime()
+            if runtime.running:
+                pending = runtime.pending_counts()
+                details = ", ".join(f"{addon}: {n}" for addon, n in sorted(pending.items()))
+                message += f"\n\nAsync tasks pending: {sum(pending.values())}"
+                if details:
+                    message += f" ({details})"
+        except Exception as e:
+            self.log.warning(f"Async runtime status unavailable: {e}")
+
+        try:
+            from core.ui_monitor import get_ui_monitor
+
+            message += f"\n\n{get_ui_monitor().status_text()}"
+        except Exception as e:
+            self.log.warning(f"UI monitor status unavailable: {e}")
+
+        try:
+            from core.grammar_cache import get_grammar_cache
+
+            message += f"\n\n{get_grammar_cache().status_text()}"
+        except Exception as e:
+            self.log.warning(f"Grammar cache status unavailable: {e}")
+
+        try:
+            from core.hibernation import get_hibernation
+
+            message += f"\n\n{get_hibernation().status_text()}"
+        except Exception as e:
+            self.log.warning(f"Hibernation status unavailable: {e}")
+
         wx.MessageBox(message, "FTNatlink Status", wx.OK | wx.ICON_INFORMATION)
 
+    def wake_grammars(self):
+        """Resume hibernated grammars."""
+        try:
+            from core.hibernation import get_hibernation
+
+            names = get_hibernation().resume()
+            self.log.info(f"Woke {len(names)} hibernated grammar(s)")
+        except Exception as e:
+            self.log.error(f"Error waking grammars: {e}")
+
     def reload_grammars(self):
         """Reload all grammars."""
         try:
-            from core.grammar_loader import load_grammars
+            from core.grammar_loader import reload_grammars
             from core import LOADED
 
             self.log.info("Reloading grammars...")
 
-            # Clear existing grammars first
-            LOADED.clear()
-
-            # Reload grammars
-            load_grammars()
+            # Unload (modules purged) then load again
+            reload_grammars()
 
             # Log results
             if LOADED:
@@ -784,6 +862,18 @@ class TaskBarIcon(wx.adv.TaskBarIcon):
             if hasattr(app, "stop_background_task"):
                 app.stop_background_task()
 
+            from core.ui_monitor import get_ui_monitor
+
+            get_ui_monitor().stop()
+
+            from core.hibernation import get_hibernation
+
+            get_hibernation().stop()
+
+            from core.context_tracker import get_context_tracker
+
+            get_context_tracker().stop_event_hook()
+
             # Clean up grammar window if it exists
             if self.grammar_window:
                 self.grammar_window.Destroy()
@@ -820,4 +910,8 @@ class TaskBarIcon(wx.adv.TaskBarIcon):
 # et une interface plus complète
 
 if __name__ == "__main__":
+    # Requis pour les processus du pool d'actions dans l'exécutable PyInstaller
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     main()
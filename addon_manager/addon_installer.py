@@ -150,11 +150,22 @@ def install_addon(addon_path):
         log.info("🧹 Cleaned up temporary files")
 
         log.info(f"Successfully installed addon '{addon_name}' v{addon_version}")
+
+        # Compare the new commands with the other installed addons
+        conflicts = None
+        try:
+            from core.conflict_detector import check_installed_addon
+
+            conflicts = check_installed_addon(dest_dir)
+        except Exception as e:
+            log.warning(f"Conflict check skipped: {e}")
+
         return {
             "id": addon_id,
             "name": addon_name,
             "version": addon_version,
             "files_installed": len(python_files),
+            "conflicts": conflicts,
         }
 
     except Exception as e:
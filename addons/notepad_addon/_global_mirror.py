@@ -16,28 +16,43 @@ current_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(current_dir))
 
 from core.logHandler import log
+from core.text_pipeline import (
+    TailState,
+    clean_text,
+    apply_commands,
+    capitalize_sentences,
+    update_tail_state,
+    format_utterance,
+)
+from core.vocabulary import get_vocabulary
 
 log.info(">>> [_global_mirror] module loading...")
 
-from dragonfly import (
-    Grammar,
-    MappingRule,
-    Dictation,
-    Function,
-    Text,
-    Key,
-    Clipboard,
-    AppContext,
-    Window,
-)
 import time, re
 
+# dragonfly est requis pour les grammaires ; sans lui (Linux, benchmarks) seul
+# le pipeline texte est disponible, la sortie passant par le backend d'injection
+try:
+    from dragonfly import (
+        Grammar,
+        MappingRule,
+        Dictation,
+        IntegerRef,
+        Function,
+        List,
+        ListRef,
+    )
+
+    HAVE_DRAGONFLY = True
+except ImportError:
+    HAVE_DRAGONFLY = False
+
 # -----------------------------
 # Réglages principaux
 # -----------------------------
 BROWSERS = ("chrome", "msedge", "firefox")  # exécutables sans .exe
 ENABLED_BROWSERS_ONLY = False  # n'agir que dans le navigateur - Désactivé pour test
-INJECTION_MODE = "keys_slow"  # "paste" | "keys" | "keys_slow" | "mixed"
+INJECTION_MODE = "keys_slow"  # "paste" | "keys" | "keys_slow" | "mixed" (hors profil calibré)
 SPACE_FIX = True
 ENTER_STROKE = "enter"  # ou "s-enter" selon l'éditeur web
 DEBUG_LOG = True  # Activé pour debug
@@ -55,13 +70,8 @@ def _dbg(msg):
 AUTO_CAPITALIZE_SENTENCES = True
 PREPEND_SPACE_IF_NEEDED = True
 
-# État persistant
-_prev_ended_with_space = True
-_prev_ended_with_newline = False
-_prev_ended_sentence = True
-_prev_last_char = ""  # dernier caractère non-blanc injecté
-_has_injected_once = False
-_force_capital_next = True  # <-- majuscule forcée sur toute première dictée du champ
+# État persistant (fin du dernier envoi, majuscule forcée sur la première dictée du champ)
+_STATE = TailState()
 
 # Pilotage micro via Natlink
 try:
@@ -72,144 +82,132 @@ except Exception:
     HAVE_NATLINK = False
 
 # -----------------------------
-# Clipboard helpers (compat)
+# Presse-papiers (courtier partagé : sauvegarde/restauration différée)
 # -----------------------------
-try:
-    _CLIP = Clipboard()  # certaines versions exigent l'instance
-except Exception:
-    _CLIP = None
+from core.clipboard_broker import get_clipboard_broker
+from core.word_selection import plan_selection, SelectionReport
+from core.injection_journal import InjectionJournal, diff_suffix
+from core.key_compiler import compile_keys, key_macro
+from core.injection_pacing import profile_for
+from core.injection_backend import get_backend
+from core.context_tracker import (
+    get_context_tracker,
+    app_predicate,
+    ContextTrackingMixin,
+)
+from core.word_harvest import WordHarvest
+from core.action_pool import heavy_action
+from core.hibernation import get_hibernation
 
+_BROKER = get_clipboard_broker()
 
-def _clip_set(s: str):
-    try:
-        if _CLIP:
-            _CLIP.set_text(s)
-        else:
-            try:
-                Clipboard.set_text(content=s)
-            except TypeError:
-                Clipboard.set_text(s)
-    except Exception:
-        pass
+# Mots récemment dictés par fenêtre : vocabulaire fermé des cibles de sélection
+_HARVEST = WordHarvest(List("notepad_addon_cibles") if HAVE_DRAGONFLY else None)
 
 
-def _clip_get() -> str:
-    try:
-        if _CLIP:
-            return _CLIP.get_text() or ""
-        else:
-            return Clipboard.get_text() or ""
-    except Exception:
-        return ""
+def _on_context_change(old, new):
+    _HARVEST.activate(new.handle)
+
+
+get_context_tracker().add_listener(_on_context_change)
+
+
+def teardown():
+    """Appelé par le loader au déchargement : retire ce que le module a enregistré."""
+    tracker = get_context_tracker()
+    tracker.remove_listener(_on_context_change)
+    if HAVE_DRAGONFLY:
+        tracker.unbind_grammar(dictation_grammar)
 
 
 # -----------------------------
 # Helpers texte
 # -----------------------------
 def _clean_text(s: str) -> str:
-    if not SPACE_FIX:
-        return s
-    # Espaces mal placés autour de ponctuation
-    s = s.replace(" ,", ",").replace(" .", ".").replace(" ;", ";").replace(" :", ":")
-    s = s.replace(" !", "!").replace(" ?", "?").replace(" )", ")").replace("( ", "(")
-    # Ajoute espace manquant après ponctuation si collée
-    s = re.sub(r"([,;:!?])(?!\s)", r"\1 ", s)
-    s = re.sub(r"([\.?!…])(?!\s)", r"\1 ", s)
-    # Fix apostrophe (jamais d’espace après ')
-    s = re.sub(r"'\s+([a-zà-öø-ÿ])", r"'\1", s)
-    # Réduit espaces multiples
-    s = re.sub(r" {2,}", " ", s)
-    return s
+    return clean_text(s) if SPACE_FIX else s
 
 
 def _apply_commands_to_text(s: str) -> str:
-    patterns = [
-        (r"(?i)\b(?:a|à)\s+la\s+ligne\b", "\n"),
-        (r"(?i)\bretour(?:\s+à\s+la\s+ligne)?\b", "\n"),
-        (r"(?i)\bnouvelle?\s+ligne\b", "\n"),
-        (r"(?i)\bnouveau\s+paragraphe\b", "\n\n"),
-        (r"(?i)\btabulation\b", "\t"),
-        (r"(?i)\bligne\s+suivante\b", "\n"),
-        (r"(?i)\bsaut\s+de\s+ligne\b", "\n"),
-        (r"(?i)\bretour\s+ligne\b", "\n"),
-        (r"(?i)\baller\s+à\s+la\s+ligne\b", "\n"),
-    ]
-    out = s
-    for pat, rep in patterns:
-        out = re.sub(pat, rep, out)
-    return out
-
-
-def _delete_prev_word(times=1, pause=0.01):
-    for _ in range(times):
-        Key("c-backspace").execute()
-        time.sleep(pause / 2)
-        Key("cs-left").execute()
-        time.sleep(pause / 2)
-        Key("backspace").execute()
-        time.sleep(pause / 2)
-
-
-def _delete_prev_char(times=1, pause=0.005):
-    for _ in range(times):
-        Key("backspace").execute()
-        time.sleep(pause)
+    return apply_commands(s)
+
+
+def _delete_prev_word(times=1, pause=None):
+    if pause is None:
+        pause = _current_profile().step_delay
+    compile_keys(*(("c-backspace", "cs-left", "backspace") * times), pause=pause).execute()
+
+
+def _delete_prev_char(times=1, pause=None):
+    if pause is None:
+        pause = _current_profile().step_delay
+    compile_keys(f"backspace:{times}", pause=pause).execute()
 
 
 # -----------------------------
 # Envoi / injection
 # -----------------------------
 def _send_text_paste(s: str):
-    old = None
-    try:
-        old = _clip_get()
-        _clip_set(s)
-        Key("c-v").execute()
-        time.sleep(0.005)
-    finally:
-        _clip_set(old or "")
+    _BROKER.paste(s, compile_keys("c-v").execute)
 
 
 def _send_text_keys(s: str):
-    Text(s).execute()
+    get_backend().text(s)
 
 
 def _send_text_keys_slow(s: str, delay=0.01):
+    backend = get_backend()
     for ch in s:
         if ch == "\n":
-            Key(ENTER_STROKE).execute()
+            compile_keys(ENTER_STROKE).execute()
         elif ch == "\t":
-            Key("tab").execute()
+            compile_keys("tab").execute()
         else:
-            Text(ch).execute()
+            backend.text(ch)
         if delay:
-            time.sleep(delay)
+            backend.sleep(delay)
+
+
+def _current_profile():
+    # Profil de rythme calibré pour l'application au premier plan (ou valeurs par défaut)
+    try:
+        return profile_for(get_context_tracker().current().executable)
+    except Exception:
+        return profile_for("")
 
 
 def _inject_text(s: str):
+    profile = _current_profile()
+    mode = profile.mode if profile.calibrated else INJECTION_MODE
     try:
-        if INJECTION_MODE == "paste":
+        if mode == "paste":
             _send_text_paste(s)
-        elif INJECTION_MODE == "keys":
+        elif mode == "keys":
             _send_text_keys(s)
-        elif INJECTION_MODE == "keys_slow":
-            _send_text_keys_slow(s)
+        elif mode == "keys_slow":
+            _send_text_keys_slow(s, delay=profile.char_delay)
         else:
             try:
                 _send_text_paste(s)
             except Exception:
-                _send_text_keys_slow(s)
+                _send_text_keys_slow(s, delay=profile.char_delay)
     except Exception:
         try:
-            Text(s).execute()
+            get_backend().text(s)
         except Exception:
             pass
 
 
+def _window_key():
+    # Identifiant de la fenêtre au premier plan (clé du journal d'injections)
+    try:
+        return get_context_tracker().current().handle
+    except Exception:
+        return None
+
+
 def _in_browser() -> bool:
     try:
-        exe = (Window.get_foreground().executable or "").lower()
-        return any(exe.endswith(b + ".exe") for b in BROWSERS)
+        return app_predicate(*BROWSERS)(get_context_tracker().current())
     except Exception:
         return False
 
@@ -217,57 +215,22 @@ def _in_browser() -> bool:
 # -----------------------------
 # Capitalisation / état de fin
 # -----------------------------
-_SENT_END_CHARS = ".!?…"
-
-
-def _first_alpha_index(s: str) -> int:
-    for i, ch in enumerate(s):
-        if ch.isalpha():
-            return i
-    return -1
-
-
 def _capitalize_sentences(s: str) -> str:
-    # Majuscule au tout début (1er envoi / début de nouvelle phrase/ligne)
-    if (
-        _force_capital_next
-        or _prev_ended_sentence
-        or _prev_ended_with_newline
-        or (not _has_injected_once)
-    ):
-        i = _first_alpha_index(s)
-        if i >= 0:
-            s = s[:i] + s[i].upper() + s[i + 1 :]
-
-    # Majuscule après ., !, ?, … + espaces/«(" éventuels
-    def _cap_after(m):
-        prefix = m.group(1)
-        letter = m.group(2)
-        return prefix + letter.upper()
-
-    s = re.sub(r'([\.!\?…]\s+[«"(\[]*\s*)([a-zà-öø-ÿ])', _cap_after, s)
-    return s
+    return capitalize_sentences(s, _STATE)
 
 
 def _update_tail_state(injected_text: str):
     """Mémorise comment se termine le dernier envoi (espace, retour, fin de phrase, dernier char)."""
-    global _prev_ended_with_space, _prev_ended_with_newline, _prev_ended_sentence, _prev_last_char, _force_capital_next
-    if not injected_text:
-        return
-    last_char = injected_text[-1]
-    _prev_ended_with_newline = last_char == "\n"
-    _prev_ended_with_space = last_char.isspace()
+    update_tail_state(_STATE, injected_text)
+
 
-    i = len(injected_text) - 1
-    while i >= 0 and injected_text[i].isspace():
-        i -= 1
-    last_non_space = injected_text[i] if i >= 0 else ""
-    _prev_last_char = last_non_space
-    _prev_ended_sentence = last_non_space in _SENT_END_CHARS
+def _tail_state() -> dict:
+    """Instantané de l'état de fin (dict compatible avec le journal d'injections)."""
+    return _STATE.to_dict()
 
-    # Si on a effectivement injecté une lettre, on ne force plus la majuscule la prochaine fois
-    if any(ch.isalpha() for ch in injected_text):
-        _force_capital_next = False
+
+def _restore_tail_state(state: dict):
+    _STATE.restore(state)
 
 
 # -----------------------------
@@ -289,6 +252,10 @@ _COMMAND_PATTERNS = [
     r"^haut de page$",
     r"^bas de page$",
 ]
+# Phrase de réveil de core.hibernation (grammaire à part) : ne pas la taper
+_WAKE_PHRASE = (get_hibernation().config.get("wake_phrase") or "").strip().lower()
+if _WAKE_PHRASE:
+    _COMMAND_PATTERNS.append("^" + r"\s+".join(map(re.escape, _WAKE_PHRASE.split())) + "$")
 _COMMAND_VERBS = [
     "ouvrir",
     "lancer",
@@ -303,6 +270,7 @@ _COMMAND_VERBS = [
     "couper",
     "supprimer",
     "effacer",
+    "corriger",
     "annuler",
     "rétablir",
     "enregistrer",
@@ -326,7 +294,7 @@ def _looks_like_command(s: str) -> bool:
     if re.match(
         r"^(cliquer|clique|cliquez|cliquer sur|clique sur|"
         r"sélectionner|selectionner|"
-        r"copier|coller|couper|supprimer|effacer|"
+        r"copier|coller|couper|supprimer|effacer|corriger|"
         r"ouvrir|lancer|afficher|basculer|activer|désactiver|fermer|"
         r"annuler|rétablir|retablir|enregistrer|imprimer|rechercher|"
         r"aller|déplacer|deplacer)\b",
@@ -357,86 +325,54 @@ def _first_token(s: str) -> str:
 
 
 def _get_selection_text() -> str:
-    # Copie la sélection active sans rien modifier d'autre
-    old = _clip_get()
-    try:
-        Key("c-c").execute()
-        time.sleep(0.01)
-        return _clip_get()
-    finally:
-        _clip_set(old or "")
+    # Copie la sélection active ; le presse-papiers utilisateur est restauré après la rafale
+    return _BROKER.copy_selection(compile_keys("c-c").execute)
+
+
+def _select_word(target: str, direction: str, max_words: int = 12):
+    # Une seule sélection de N mots + une seule copie, puis recherche locale
+    word = _first_token(target)
+    if not _norm_word(word):
+        return None
+    report = SelectionReport(word, direction)
+
+    grab = f"cs-left:{max_words}" if direction == "left" else f"cs-right:{max_words}"
+    compile_keys(grab).execute()
+    get_backend().sleep(_current_profile().select_delay)
+    report.add_keys([grab, "c-c"])
+    window_text = _get_selection_text()
+
+    plan = plan_selection(window_text, word, direction)
+    if plan.keys:
+        compile_keys(*plan.keys).execute()
+        report.add_keys(plan.keys)
+
+    report.finish(plan.found)
+    log.info(f"[_global_mirror] sélection {report}")
+    return report
 
 
 def _select_word_left(target: str, max_words: int = 12):
-    target = _norm_word(_first_token(target))
-    if not target:
-        return
-    moves = 0
-    success = False
-    for _ in range(max_words):
-        Key("c-left").execute()
-        time.sleep(0.006)  # début mot précédent
-        Key("cs-right").execute()
-        time.sleep(0.006)  # sélectionner mot courant
-        sel = _norm_word(_get_selection_text())
-        if sel == target:
-            success = True
-            break
-        Key("left").execute()
-        time.sleep(0.004)  # reculer d'un caractère pour enchaîner
-        moves += 1
-    if not success:
-        for _ in range(moves):
-            Key("c-right").execute()
+    return _select_word(target, "left", max_words)
 
 
 def _select_word_right(target: str, max_words: int = 12):
-    target = _norm_word(_first_token(target))
-    if not target:
-        return
-    moves = 0
-    success = False
-    for _ in range(max_words):
-        Key("cs-right").execute()
-        time.sleep(0.006)
-        sel = _norm_word(_get_selection_text())
-        if sel == target:
-            success = True
-            break
-        Key("right").execute()
-        time.sleep(0.004)
-        moves += 1
-    if not success:
-        for _ in range(moves):
-            Key("c-left").execute()
+    return _select_word(target, "right", max_words)
 
 
 # -----------------------------
 # Notepad function
 # -----------------------------
+# Lancement du Bloc-notes (Popen + fichier temporaire) hors du thread du moteur
+_open_notepad = heavy_action("core.desktop_actions:open_notepad_with_text")
+
+
 def open_notepad_with_text():
     """Open Notepad with French text"""
-    import subprocess
-    import tempfile
-
+    log.info("[_global_mirror] Commande 'ouvrir bloc-notes' exécutée!")
+    _dbg("open_notepad_with_text called")
     try:
-        log.info("[_global_mirror] Commande 'ouvrir bloc-notes' exécutée!")
-        _dbg("open_notepad_with_text called")
-        # Create a temporary file containing the French text and open it in Notepad.
-        text = "salut comment ça va, c'est Sendhil"
-
-        # Use a temp file so Notepad opens a file containing the text.
-        # We write UTF-8 with BOM so Notepad (on Windows) displays accented characters correctly.
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False, encoding="utf-8"
-        ) as tf:
-            # Write BOM for Notepad to auto-detect UTF-8
-            tf.write("\ufeff")
-            tf.write(text)
-            temp_path = tf.name
-
-        subprocess.Popen(["notepad.exe", temp_path])
-        log.info(f"Notepad launched successfully with file: {temp_path}")
+        _open_notepad()
     except Exception as e:
         log.error(f"Failed to open Notepad: {e}")
 
@@ -444,12 +380,19 @@ def open_notepad_with_text():
 # -----------------------------
 # Action principale (avec correctif espace AVANT ponctuation)
 # -----------------------------
-_LEADING_PUNCT = set(",.;:!?)]}%»\"'")
+def _format_for_injection(s: str) -> str:
+    # 1) vocabulaire + nettoyage, 2) espace auto, 3) majuscule auto
+    return format_utterance(
+        s,
+        _STATE,
+        space_fix=SPACE_FIX,
+        prepend_space=PREPEND_SPACE_IF_NEEDED,
+        auto_capitalize=AUTO_CAPITALIZE_SENTENCES,
+        vocabulary=get_vocabulary().automaton(),
+    )
 
 
 def mirror_text(texte=None):
-    global _has_injected_once, _force_capital_next
-
     _dbg(f"mirror_text called with: {texte}")
     log.info(f"[_global_mirror] mirror_text appelé avec: '{texte}'")
 
@@ -464,48 +407,80 @@ def mirror_text(texte=None):
         # Laisser Dragon exécuter ses commandes natives (ex: "Cliquer Valider")
         return
 
-    # 1) nettoyage + commandes inline (retours/tab…)
-    s = _clean_text(s)
-    s = _apply_commands_to_text(s)
-
-    # 2) espace auto sans lecture du champ
-    if PREPEND_SPACE_IF_NEEDED and s:
-        wants_space = (
-            not s[0].isspace()
-            and s[0] not in _LEADING_PUNCT
-            and _has_injected_once
-            and not _prev_ended_with_space
-            and not _prev_ended_with_newline
-        )
-        if wants_space:
-            s = " " + s
-            s = _clean_text(s)
-
-    # 3) majuscule auto (début, après fin de phrase, après retour, OU si flag forcé)
-    if AUTO_CAPITALIZE_SENTENCES:
-        s = _capitalize_sentences(s)
-
-    # 4) injection + mise à jour d'état
+    s = _format_for_injection(s)
+
+    # 4) injection + mise à jour d'état (journalisée pour annulation exacte)
+    state_before = _tail_state()
     _inject_text(s)
     _update_tail_state(s)
-    _has_injected_once = True
-    # si on vient d'injecter uniquement de la ponctuation, on peut garder _force_capital_next à True
+    _STATE.has_injected_once = True
+    _JOURNAL.record(_window_key(), s, state_before)
+    _HARVEST.harvest(_window_key(), s)
+    # si on vient d'injecter uniquement de la ponctuation, on peut garder force_capital_next à True
+
+
+# -----------------------------
+# Annulation exacte / correction minimale (journal d'injections)
+# -----------------------------
+_JOURNAL = InjectionJournal()
+
+
+def undo_dictation(n=1):
+    """Efface exactement les n dernières dictées injectées dans la fenêtre courante."""
+    entries = _JOURNAL.pop(_window_key(), n)
+    if not entries:
+        return False
+    count = sum(len(e.text) for e in entries)
+    _dbg(f"undo_dictation: {len(entries)} dictée(s), {count} caractère(s)")
+    compile_keys(f"backspace:{count}").execute()
+    # L'état de fin redevient celui d'avant la plus ancienne dictée effacée
+    _restore_tail_state(entries[-1].state_before)
+    return True
+
+
+def scratch_that():
+    # Sans journal (ex: texte tapé à la main), on retombe sur l'effacement du mot précédent
+    if not undo_dictation(1):
+        _delete_prev_word(1)
+
+
+def correct_dictation(texte=None):
+    """Remplace la dernière dictée en n'envoyant que le suffixe qui diffère."""
+    s = (str(texte) if texte is not None else "").strip()
+    if not s:
+        return
+    key = _window_key()
+    last = _JOURNAL.last(key)
+    if last is None:
+        mirror_text(s)
+        return
+
+    _restore_tail_state(last.state_before)
+    new_text = _format_for_injection(s)
+    backspaces, suffix = diff_suffix(last.text, new_text)
+    _dbg(f"correct_dictation: -{backspaces} +{suffix!r}")
+    if backspaces:
+        compile_keys(f"backspace:{backspaces}").execute()
+    if suffix:
+        _inject_text(suffix)
+    _update_tail_state(new_text)
+    _STATE.has_injected_once = True
+    _JOURNAL.replace_last(key, new_text)
 
 
 # -----------------------------
 # Commandes explicites
 # -----------------------------
 def cmd_line():
-    Key(ENTER_STROKE).execute()
+    compile_keys(ENTER_STROKE).execute()
 
 
 def cmd_new_paragraph():
-    Key(ENTER_STROKE).execute()
-    Key(ENTER_STROKE).execute()
+    compile_keys(ENTER_STROKE, ENTER_STROKE).execute()
 
 
 def cmd_tab():
-    Key("tab").execute()
+    compile_keys("tab").execute()
 
 
 def go_to_sleep():
@@ -556,117 +531,127 @@ def reload_grammars():
 # Small helpers used to replace multi-expression lambdas
 def _do_enter():
     _dbg("Commande: enter")
-    Key(ENTER_STROKE).execute()
+    compile_keys(ENTER_STROKE).execute()
 
 
 def _do_enter_twice():
     _dbg("Commande: enter x2")
-    Key(ENTER_STROKE).execute()
-    Key(ENTER_STROKE).execute()
+    compile_keys(ENTER_STROKE, ENTER_STROKE).execute()
 
 
 def _do_tab():
     _dbg("Commande: tabulation")
-    Key("tab").execute()
-
-
-# -----------------------------
-# Control grammar (explicit commands)
-# -----------------------------
-class ControlRule(MappingRule):
-    mapping = {
-        # Retours/paragraphes
-        "nouvelle ligne": Function(_do_enter),
-        "ligne suivante": Function(_do_enter),
-        "saut de ligne": Function(_do_enter),
-        "retour ligne": Function(_do_enter),
-        "aller à la ligne": Function(_do_enter),
-        "retour": Function(_do_enter),
-        "retour à la ligne": Function(_do_enter),
-        "nouveau paragraphe": Function(_do_enter_twice),
-        "tabulation": Function(_do_tab),
-        # Test command
-        "ouvrir bloc-notes": Function(open_notepad_with_text),
-        # Effacements rapides
-        "effacer ça": Function(lambda: _delete_prev_word(1)),
-        "efface ça": Function(lambda: _delete_prev_word(1)),
-        "effacer cela": Function(lambda: _delete_prev_word(1)),
-        "supprimer ça": Function(lambda: _delete_prev_word(1)),
-        "supprime ça": Function(lambda: _delete_prev_word(1)),
-        # Sélections basiques
-        "sélectionner le mot précédent": Function(lambda: Key("cs-left").execute()),
-        "sélectionner le mot suivant": Function(lambda: Key("cs-right").execute()),
-        "sélectionner tout": Function(lambda: Key("c-a").execute()),
-        # Sélection par contenu (autour du curseur) — variantes tolérantes
-        "sélectionner <cible> à gauche": Function(
-            lambda cible: _select_word_left(cible)
-        ),
-        "selectionner <cible> a gauche": Function(
-            lambda cible: _select_word_left(cible)
-        ),
-        "sélectionner le mot <cible> à gauche": Function(
-            lambda cible: _select_word_left(cible)
-        ),
-        "selectionner le mot <cible> a gauche": Function(
-            lambda cible: _select_word_left(cible)
-        ),
-        "sélectionner <cible> vers la gauche": Function(
-            lambda cible: _select_word_left(cible)
-        ),
-        "sélectionner <cible> à droite": Function(
-            lambda cible: _select_word_right(cible)
-        ),
-        "selectionner <cible> a droite": Function(
-            lambda cible: _select_word_right(cible)
-        ),
-        "sélectionner le mot <cible> à droite": Function(
-            lambda cible: _select_word_right(cible)
-        ),
-        "selectionner le mot <cible> a droite": Function(
-            lambda cible: _select_word_right(cible)
-        ),
-        "sélectionner <cible> vers la droite": Function(
-            lambda cible: _select_word_right(cible)
-        ),
-        # Notepad commands
-        "melvin": Function(open_notepad_with_text),
-        # Grammar control
-        "décharger grammaires": Function(force_unload_grammars),
-        "recharger grammaires": Function(reload_grammars),
-        "arrêter grammaires": Function(force_unload_grammars),
-        # Micro
-        "au repos": Function(go_to_sleep),
-        "reveil": Function(wake_up),
-    }
-    extras = [Dictation("cible")]
-    defaults = {}
-
-
-control_grammar = Grammar("notepad_addon_control", context=None)
-control_grammar.add_rule(ControlRule())
-control_grammar.load()
+    compile_keys("tab").execute()
+
+
+if HAVE_DRAGONFLY:
+    # -----------------------------
+    # Control grammar (explicit commands)
+    # -----------------------------
+    class ControlRule(MappingRule):
+        mapping = {
+            # Retours/paragraphes
+            "nouvelle ligne": Function(_do_enter),
+            "ligne suivante": Function(_do_enter),
+            "saut de ligne": Function(_do_enter),
+            "retour ligne": Function(_do_enter),
+            "aller à la ligne": Function(_do_enter),
+            "retour": Function(_do_enter),
+            "retour à la ligne": Function(_do_enter),
+            "nouveau paragraphe": Function(_do_enter_twice),
+            "tabulation": Function(_do_tab),
+            # Test command
+            "ouvrir bloc-notes": Function(open_notepad_with_text),
+            # Effacements rapides (exacts si la dictée est dans le journal)
+            "effacer ça": Function(scratch_that),
+            "efface ça": Function(scratch_that),
+            "effacer cela": Function(scratch_that),
+            "supprimer ça": Function(scratch_that),
+            "supprime ça": Function(scratch_that),
+            "scratch that": Function(scratch_that),
+            "undo <n>": Function(lambda n: undo_dictation(n)),
+            "effacer <n> dictées": Function(lambda n: undo_dictation(n)),
+            # Correction : ne renvoie que la partie qui diffère
+            "corriger <texte>": Function(correct_dictation),
+            "correction <texte>": Function(correct_dictation),
+            # Sélections basiques
+            "sélectionner le mot précédent": key_macro("cs-left").as_action(),
+            "sélectionner le mot suivant": key_macro("cs-right").as_action(),
+            "sélectionner tout": key_macro("c-a").as_action(),
+            # Sélection par contenu (autour du curseur) — variantes tolérantes
+            "sélectionner <cible> à gauche": Function(
+                lambda cible: _select_word_left(cible)
+            ),
+            "selectionner <cible> a gauche": Function(
+                lambda cible: _select_word_left(cible)
+            ),
+            "sélectionner le mot <cible> à gauche": Function(
+                lambda cible: _select_word_left(cible)
+            ),
+            "selectionner le mot <cible> a gauche": Function(
+                lambda cible: _select_word_left(cible)
+            ),
+            "sélectionner <cible> vers la gauche": Function(
+                lambda cible: _select_word_left(cible)
+            ),
+            "sélectionner <cible> à droite": Function(
+                lambda cible: _select_word_right(cible)
+            ),
+            "selectionner <cible> a droite": Function(
+                lambda cible: _select_word_right(cible)
+            ),
+            "sélectionner le mot <cible> à droite": Function(
+                lambda cible: _select_word_right(cible)
+            ),
+            "selectionner le mot <cible> a droite": Function(
+                lambda cible: _select_word_right(cible)
+            ),
+            "sélectionner <cible> vers la droite": Function(
+                lambda cible: _select_word_right(cible)
+            ),
+            # Notepad commands
+            "melvin": Function(open_notepad_with_text),
+            # Grammar control
+            "décharger grammaires": Function(force_unload_grammars),
+            "recharger grammaires": Function(reload_grammars),
+            "arrêter grammaires": Function(force_unload_grammars),
+            # Micro
+            "au repos": Function(go_to_sleep),
+            "reveil": Function(wake_up),
+        }
+        extras = [
+            ListRef("cible", _HARVEST.target),
+            Dictation("texte"),
+            IntegerRef("n", 1, 21),
+        ]
+        defaults = {"n": 1}
+
+    class TrackedGrammar(ContextTrackingMixin, Grammar):
+        # Chaque début d'énoncé met à jour le suivi de fenêtre partagé
+        pass
 
-# -----------------------------
-# Grammaire de dictée
-# -----------------------------
-# Contexte étendu - fonctionne partout si ENABLED_BROWSERS_ONLY est False
-if ENABLED_BROWSERS_ONLY:
-    browser_context = None
-    for b in BROWSERS:
-        ctx = AppContext(executable=b)
-        browser_context = ctx if browser_context is None else (browser_context | ctx)
+    control_grammar = TrackedGrammar("notepad_addon_control", context=None)
+    control_grammar.add_rule(ControlRule())
+    control_grammar.load()
+
+    # -----------------------------
+    # Grammaire de dictée
+    # -----------------------------
+    class MirrorRule(MappingRule):
+        mapping = {"<texte>": Function(mirror_text)}
+        extras = [Dictation("texte")]
+        defaults = {}
+
+    dictation_grammar = Grammar("notepad_addon_dictation", context=None)
+    dictation_grammar.add_rule(MirrorRule())
+    dictation_grammar.load()
+    # Limité aux navigateurs : activé/désactivé au changement de fenêtre par le
+    # suivi de contexte, plutôt qu'un AppContext réévalué à chaque énoncé.
+    # Avec ENABLED_BROWSERS_ONLY = False le miroir reste actif partout : aucune
+    # liaison (bind_grammar n'agit donc que si le drapeau est levé)
+    if ENABLED_BROWSERS_ONLY:
+        get_context_tracker().bind_grammar(dictation_grammar, app_predicate(*BROWSERS))
+
+    log.info(">>> [notepad_addon] loaded OK (Always ON, non-exclusive)")
 else:
-    browser_context = None  # Fonctionne partout
-
-
-class MirrorRule(MappingRule):
-    mapping = {"<texte>": Function(mirror_text)}
-    extras = [Dictation("texte")]
-    defaults = {}
-
-
-dictation_grammar = Grammar("notepad_addon_dictation", context=browser_context)
-dictation_grammar.add_rule(MirrorRule())
-dictation_grammar.load()
-
-log.info(">>> [notepad_addon] loaded OK (Always ON, non-exclusive)")
+    log.warning(">>> [notepad_addon] dragonfly absent - grammaires non chargées")
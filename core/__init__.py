@@ -8,7 +8,8 @@ from .grammar_loader import (
     list_grammars,
     unload_grammars,
     reload_grammars,
-    LOADED
+    LOADED,
+    LOADED_INFO
 )
 from .fake_natlink_runtime import natlinkmain, MockGrammar
 
@@ -18,6 +19,7 @@ __all__ = [
     'unload_grammars',
     'reload_grammars',
     'LOADED',
+    'LOADED_INFO',
     'natlinkmain',
     'MockGrammar'
 ]
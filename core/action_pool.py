@@ -0,0 +1,378 @@
+"""
+Pool de processus pour les actions de grammaire lourdes
+Une action déclarée lourde (`heavy_action`) est exécutée dans un processus de
+travail : le thread du moteur rend la main aussitôt et la reconnaissance
+continue. Chaque appel a un délai maximal : le pool d'un appel bloqué est
+terminé aussitôt (ses autres appels en cours échouent avec ActionAborted) et
+les nouveaux appels partent dans un pool neuf. Le pool est démarré par un
+thread à part (à la création d'une action lourde, donc au chargement de
+l'addon) : un appel qui arrive avant qu'il soit prêt attend dans une file,
+le thread du moteur ne lance jamais d'interpréteur. Les processus sont
+recyclés après `maxtasksperchild` tâches et la latence de chaque action est
+enregistrée.
+"""
+
+import atexit
+import importlib
+import inspect
+import multiprocessing
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+
+from .logHandler import log
+
+ACTION_POOL_ENABLED = True  # False : les actions lourdes s'exécutent sur place
+DEFAULT_TIMEOUT = 10.0
+
+
+class ActionTimeout(Exception):
+    """L'action a dépassé son délai ; son processus a été tué."""
+
+
+class ActionAborted(Exception):
+    """Le pool a été arrêté (ou tué avec un appel bloqué) avant la fin de l'action."""
+
+
+def resolve_target(target):
+    """Retourne la fonction désignée par "module:fonction"."""
+    module_name, _, attr = target.partition(":")
+    obj = importlib.import_module(module_name)
+    for part in attr.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _run_target(target, args, kwargs):
+    # Exécuté dans le processus de travail
+    start = time.perf_counter()
+    result = resolve_target(target)(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _python_executable():
+    """
+    Interpréteur des processus de travail. Sous Natlink, sys.executable est
+    le processus hôte de Dragon : on relance alors le python de l'installation.
+    """
+    exe = Path(sys.executable)
+    if getattr(sys, "frozen", False) or exe.name.lower().startswith("python"):
+        return None  # valeur par défaut de multiprocessing
+    for name in ("pythonw.exe", "python.exe", "python3", "python"):
+        candidate = Path(sys.exec_prefix) / name
+        if candidate.exists():
+            return str(candidate)
+    return None
+
+
+class ActionStats:
+    """Latence et issue des appels d'une action."""
+
+    __slots__ = ("calls", "errors", "timeouts", "total", "max", "last")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, latency, outcome="ok"):
+        self.calls += 1
+        if outcome == "error":
+            self.errors += 1
+        elif outcome == "timeout":
+            self.timeouts += 1
+        self.total += latency
+        self.last = latency
+        self.max = max(self.max, latency)
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "avg_ms": (self.total / self.calls * 1000) if self.calls else 0.0,
+            "max_ms": self.max * 1000,
+            "last_ms": self.last * 1000,
+        }
+
+
+class ActionPool:
+    """
+    Pool de processus avec délai par appel et recyclage automatique.
+
+    Args:
+        processes: nombre de processus de travail
+        maxtasksperchild: tâches avant remplacement d'un processus
+        poll_interval: période de vérification des délais (secondes)
+    """
+
+    def __init__(self, processes=2, maxtasksperchild=50, poll_interval=0.05):
+        self.processes = processes
+        self.maxtasksperchild = maxtasksperchild
+        self.poll_interval = poll_interval
+        self._pool = None
+        self._pending = {}  # id -> (future, nom, départ, échéance, pool)
+        self._waiting = []  # appels reçus avant que le pool soit prêt
+        self._starter = None  # thread qui démarre le pool
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._monitor = None
+        self._stats = {}
+
+    # -----------------------------
+    # Cycle de vie
+    # -----------------------------
+    def _create_pool(self):
+        ctx = multiprocessing.get_context("spawn")
+        executable = _python_executable()
+        if executable:
+            ctx.set_executable(executable)
+        start = time.perf_counter()
+        pool = ctx.Pool(self.processes, maxtasksperchild=self.maxtasksperchild)
+        log.info(
+            f"[action_pool] {self.processes} processus démarrés en "
+            f"{(time.perf_counter() - start) * 1000:.0f} ms"
+        )
+        return pool
+
+    def _start_pool(self):
+        # Thread du démarreur : le lancement des interpréteurs se fait hors verrou
+        try:
+            pool = self._create_pool()
+        except Exception as e:
+            log.error(f"[action_pool] démarrage impossible: {e}")
+            with self._lock:
+                waiting, self._waiting = self._waiting, []
+                self._starter = None
+            for future, *_ in waiting:
+                future.set_exception(ActionAborted(f"pool indisponible: {e}"))
+            return
+        with self._lock:
+            self._starter = None
+            if self._stop.is_set():
+                waiting, self._waiting = self._waiting, []
+            else:
+                self._pool = pool
+                pool = None
+                for call in self._waiting:
+                    self._dispatch(*call)
+                self._waiting, waiting = [], []
+                if self._monitor is None or not self._monitor.is_alive():
+                    self._monitor = threading.Thread(
+                        target=self._watch, daemon=True, name="ActionPoolMonitor"
+                    )
+                    self._monitor.start()
+        if pool is not None:
+            pool.terminate()  # arrêté pendant le démarrage
+        for future, *_ in waiting:
+            future.set_exception(ActionAborted("pool arrêté"))
+
+    def _ensure_starting(self):
+        # Sous self._lock : démarre le pool en arrière-plan s'il n'existe pas
+        if self._pool is None and self._starter is None:
+            self._stop.clear()
+            self._starter = threading.Thread(
+                target=self._start_pool, daemon=True, name="ActionPoolStarter"
+            )
+            self._starter.start()
+        return self._starter
+
+    def warm(self, wait=False):
+        """Démarre les processus à l'avance, en arrière-plan (wait : attendre qu'ils soient prêts)."""
+        with self._lock:
+            starter = self._ensure_starting()
+        if wait and starter is not None:
+            starter.join()
+
+    def shutdown(self):
+        self._stop.set()
+        with self._lock:
+            pool, self._pool = self._pool, None
+            pending, self._pending = self._pending, {}
+            waiting, self._waiting = self._waiting, []
+        if pool is not None:
+            pool.terminate()
+        for future, *_ in list(pending.values()) + waiting:
+            if not future.done():
+                future.set_exception(ActionAborted("pool arrêté"))
+
+    # -----------------------------
+    # Soumission
+    # -----------------------------
+    def submit(self, target, args=(), kwargs=None, timeout=DEFAULT_TIMEOUT, name=None):
+        """
+        Exécute `target` ("module:fonction") dans un processus de travail.
+
+        Returns:
+            concurrent.futures.Future du résultat
+        """
+        future = Future()
+        call = (future, name or target, target, tuple(args), dict(kwargs or {}), timeout)
+        with self._lock:
+            if self._pool is None:
+                # Pool pas encore prêt : l'appel part dès son démarrage
+                self._waiting.append(call)
+                self._ensure_starting()
+            else:
+                self._dispatch(*call)
+        return future
+
+    def _dispatch(self, future, name, target, args, kwargs, timeout):
+        # Sous self._lock ; le délai court à partir de l'envoi au pool
+        call_id = self._next_id
+        self._next_id += 1
+        started = time.perf_counter()
+        deadline = started + timeout if timeout else None
+        self._pending[call_id] = (future, name, started, deadline, self._pool)
+        self._pool.apply_async(
+            _run_target,
+            (target, args, kwargs),
+            callback=lambda res, cid=call_id: self._finish(cid, result=res),
+            error_callback=lambda exc, cid=call_id: self._finish(cid, error=exc),
+        )
+
+    def _finish(self, call_id, result=None, error=None):
+        with self._lock:
+            entry = self._pending.pop(call_id, None)
+        if entry is None:
+            return  # déjà expirée ou annulée
+        future, name, started, _, _ = entry
+        latency = time.perf_counter() - started
+        if error is not None:
+            self._record(name, latency, "error")
+            log.error(f"[action_pool] {name} a échoué: {error}")
+            future.set_exception(error)
+        else:
+            value, _ = result
+            self._record(name, latency)
+            future.set_result(value)
+
+    def _record(self, name, latency, outcome="ok"):
+        with self._lock:
+            self._stats.setdefault(name, ActionStats()).record(latency, outcome)
+
+    # -----------------------------
+    # Délais
+    # -----------------------------
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            self._check_deadlines(time.perf_counter())
+
+    def _check_deadlines(self, now):
+        # Impossible de tuer un seul processus d'un Pool : le pool de l'appel
+        # bloqué est terminé tout de suite, et les autres appels qu'il portait
+        # échouent (les nouveaux appels vont dans un pool neuf)
+        with self._lock:
+            timed_out = [
+                self._pending.pop(cid)
+                for cid, entry in list(self._pending.items())
+                if entry[3] is not None and now > entry[3]
+            ]
+            killed = []
+            for entry in timed_out:
+                pool = entry[4]
+                if pool is self._pool:
+                    self._pool = None
+                if pool not in killed:
+                    killed.append(pool)
+            aborted = [
+                self._pending.pop(cid)
+                for cid, entry in list(self._pending.items())
+                if entry[4] in killed
+            ]
+
+        for pool in killed:
+            pool.terminate()
+        for future, name, started, _, _ in timed_out:
+            self._record(name, now - started, "timeout")
+            log.warning(
+                f"[action_pool] {name} bloquée depuis {now - started:.1f} s - processus tué"
+            )
+            future.set_exception(ActionTimeout(name))
+        for future, name, started, _, _ in aborted:
+            self._record(name, now - started, "error")
+            log.warning(f"[action_pool] {name} interrompue : pool tué avec une action bloquée")
+            future.set_exception(ActionAborted(name))
+
+    # -----------------------------
+    # Statistiques
+    # -----------------------------
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending) + len(self._waiting)
+
+    def get_stats(self):
+        """{nom d'action: {calls, errors, timeouts, avg_ms, max_ms, last_ms}}"""
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+
+_POOL = None
+
+
+def get_action_pool():
+    """Pool d'actions partagé (démarré au premier appel)."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ActionPool(processes=2)
+        atexit.register(_POOL.shutdown)
+    return _POOL
+
+
+class HeavyAction:
+    """
+    Appelable à passer à dragonfly `Function` : exécute la cible dans le pool
+    et rend la main aussitôt (le résultat est un Future).
+
+    La signature de la cible est exposée pour que `Function` ne transmette
+    que les extras qu'elle accepte (les objets du moteur ne sont pas envoyés).
+    """
+
+    def __init__(self, target, timeout=DEFAULT_TIMEOUT, inline=None):
+        self.target = target
+        self.timeout = timeout
+        self.inline = (not ACTION_POOL_ENABLED) if inline is None else inline
+        self._function = resolve_target(target)
+        try:
+            self.__signature__ = inspect.signature(self._function)
+        except (TypeError, ValueError):
+            self.__signature__ = None  # fonction native sans signature : aucun filtrage
+        self.__name__ = getattr(self._function, "__name__", target)
+        if not self.inline:
+            # Déclarée au chargement de l'addon : le pool démarre maintenant, en arrière-plan
+            get_action_pool().warm()
+
+    def __call__(self, *args, **kwargs):
+        if self.__signature__ is not None:
+            params = self.__signature__.parameters
+            if not any(p.kind == p.VAR_KEYWORD for p in params.values()):
+                kwargs = {k: v for k, v in kwargs.items() if k in params}
+
+        if not self.inline:
+            try:
+                return get_action_pool().submit(
+                    self.target, args, kwargs, timeout=self.timeout
+                )
+            except Exception as e:
+                log.error(f"[action_pool] pool indisponible, exécution sur place: {e}")
+
+        pool = get_action_pool()
+        start = time.perf_counter()
+        try:
+            result = self._function(*args, **kwargs)
+        except Exception:
+            pool._record(self.target, time.perf_counter() - start, "error")
+            raise
+        pool._record(self.target, time.perf_counter() - start)
+        return result
+
+
+def heavy_action(target, timeout=DEFAULT_TIMEOUT, inline=None):
+    """Déclare une action lourde "module:fonction" exécutée hors du thread du moteur."""
+    return HeavyAction(target, timeout=timeout, inline=inline)
@@ -0,0 +1,31 @@
+"""
+Emplacements des fichiers de données FTNatlink (cache, index...)
+Même règle que les logs : dossier utilisateur en mode exécutable,
+dossier du projet en mode script.
+"""
+
+import sys
+from pathlib import Path
+
+
+def get_data_dir(name="cache"):
+    """
+    Retourne (et crée) le dossier de données `name`.
+
+    Args:
+        name: Sous-dossier (ex: "cache", "logs")
+
+    Returns:
+        Path: Dossier existant, ou le dossier courant en dernier recours
+    """
+    try:
+        if hasattr(sys, "_MEIPASS"):
+            # Running as executable - use user directory
+            data_dir = Path.home() / "AppData" / "Local" / "FTNatlink" / name
+        else:
+            # Running as script - use project directory
+            data_dir = Path(__file__).parent / name
+        data_dir.mkdir(parents=True, exist_ok=True)
+        return data_dir
+    except Exception:
+        return Path.cwd()
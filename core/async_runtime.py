@@ -0,0 +1,215 @@
+"""
+Boucle asyncio partagée pour les actions de grammaire `async def`
+La boucle tourne dans un thread dédié ; le thread du moteur ne fait que
+planifier la coroutine et rend la main aussitôt. Chaque addon a une limite de
+tâches simultanées, ses tâches peuvent être annulées (ex: au déchargement) et
+le nombre de tâches en attente est exposé pour le statut.
+
+    async def lancer(texte):
+        ...
+
+    mapping = {"lancer <texte>": AsyncFunction(lancer)}
+"""
+
+import asyncio
+import inspect
+import threading
+from pathlib import Path
+
+from .logHandler import log
+
+DEFAULT_ADDON_LIMIT = 4
+
+
+def addon_of(function):
+    """Nom de l'addon (dossier du module) qui définit `function`."""
+    module_file = getattr(function, "__globals__", {}).get("__file__")
+    if module_file:
+        return Path(module_file).parent.name
+    return getattr(function, "__module__", None) or "default"
+
+
+class AsyncRuntime:
+    """Boucle asyncio dans un thread, limites de concurrence par addon."""
+
+    def __init__(self, default_limit=DEFAULT_ADDON_LIMIT):
+        self.default_limit = default_limit
+        self._limits = {}
+        self._semaphores = {}  # créés dans le thread de la boucle
+        self._tasks = {}  # addon -> set(asyncio.Task)
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "cancelled": 0}
+
+    # -----------------------------
+    # Cycle de vie
+    # -----------------------------
+    def start(self):
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
+            ready = threading.Event()
+
+            def run():
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+                self._loop = loop
+                ready.set()
+                loop.run_forever()
+                loop.close()
+
+            self._thread = threading.Thread(target=run, daemon=True, name="AsyncRuntime")
+            self._thread.start()
+            ready.wait()
+            log.info("[async_runtime] boucle asyncio démarrée")
+            return self._loop
+
+    @property
+    def running(self):
+        return self._loop is not None
+
+    def stop(self):
+        """Annule toutes les tâches puis arrête la boucle."""
+        loop = self._loop
+        if loop is None:
+            return
+        self.cancel()
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=2.0)
+        self._loop = None
+        self._semaphores = {}
+
+    def set_addon_limit(self, addon, limit):
+        """Nombre maximal de tâches simultanées pour `addon` (appliqué aux prochains sémaphores)."""
+        self._limits[addon] = limit
+
+    # -----------------------------
+    # Planification
+    # -----------------------------
+    def submit(self, coroutine_function, args=(), kwargs=None, addon="default"):
+        """
+        Planifie `coroutine_function(*args, **kwargs)` sans bloquer.
+
+        Returns:
+            concurrent.futures.Future (annulable avec .cancel())
+        """
+        loop = self.start()
+        with self._lock:
+            self.stats["submitted"] += 1
+        coroutine = self._run(coroutine_function, tuple(args), dict(kwargs or {}), addon)
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    async def _run(self, coroutine_function, args, kwargs, addon):
+        task = asyncio.current_task()
+        with self._lock:
+            self._tasks.setdefault(addon, set()).add(task)
+        name = getattr(coroutine_function, "__name__", "coroutine")
+        try:
+            async with self._semaphore(addon):
+                result = await coroutine_function(*args, **kwargs)
+            self._count("completed")
+            return result
+        except asyncio.CancelledError:
+            self._count("cancelled")
+            raise
+        except Exception as e:
+            self._count("failed")
+            log.error(f"[async_runtime] {addon}.{name} a échoué: {e}")
+            raise
+        finally:
+            with self._lock:
+                self._tasks[addon].discard(task)
+
+    def _semaphore(self, addon):
+        semaphore = self._semaphores.get(addon)
+        if semaphore is None:
+            limit = self._limits.get(addon, self.default_limit)
+            semaphore = self._semaphores[addon] = asyncio.Semaphore(limit)
+        return semaphore
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    # -----------------------------
+    # Annulation / statut
+    # -----------------------------
+    def cancel(self, addon=None):
+        """Annule les tâches d'un addon (toutes si `addon` est None) ; retourne leur nombre."""
+        loop = self._loop
+        if loop is None:
+            return 0
+        with self._lock:
+            addons = list(self._tasks) if addon is None else [addon]
+            tasks = [t for a in addons for t in self._tasks.get(a, ())]
+        for task in tasks:
+            loop.call_soon_threadsafe(task.cancel)
+        if tasks:
+            log.info(f"[async_runtime] {len(tasks)} tâche(s) annulée(s) ({addon or 'toutes'})")
+        return len(tasks)
+
+    def pending_counts(self):
+        """{addon: tâches en cours ou en attente de leur tour}"""
+        with self._lock:
+            return {addon: len(tasks) for addon, tasks in self._tasks.items() if tasks}
+
+    def pending_total(self):
+        return sum(self.pending_counts().values())
+
+
+_RUNTIME = None
+
+
+def get_async_runtime():
+    """Boucle asyncio partagée (démarrée au premier appel planifié)."""
+    global _RUNTIME
+    if _RUNTIME is None:
+        _RUNTIME = AsyncRuntime()
+    return _RUNTIME
+
+
+class AsyncAction:
+    """
+    Appelable synchrone autour d'une coroutine, pour dragonfly `Function`.
+    Expose la signature de la coroutine pour que `Function` ne transmette que
+    les extras attendus ; l'appel retourne un Future sans attendre la fin.
+    """
+
+    def __init__(self, coroutine_function, addon=None):
+        if not inspect.iscoroutinefunction(coroutine_function):
+            raise TypeError(f"{coroutine_function!r} n'est pas une fonction async")
+        self.function = coroutine_function
+        self.addon = addon or addon_of(coroutine_function)
+        self.__signature__ = inspect.signature(coroutine_function)
+        self.__name__ = coroutine_function.__name__
+
+    def __call__(self, *args, **kwargs):
+        params = self.__signature__.parameters
+        if not any(p.kind == p.VAR_KEYWORD for p in params.values()):
+            kwargs = {k: v for k, v in kwargs.items() if k in params}
+        return get_async_runtime().submit(self.function, args, kwargs, addon=self.addon)
+
+
+def async_action(coroutine_function=None, addon=None, limit=None):
+    """
+    Enveloppe (ou décorateur) rendant une coroutine appelable depuis le moteur.
+
+        @async_action(limit=1)
+        async def sauvegarder(texte): ...
+    """
+
+    def wrap(function):
+        action = AsyncAction(function, addon)
+        if limit is not None:
+            get_async_runtime().set_addon_limit(action.addon, limit)
+        return action
+
+    return wrap(coroutine_function) if coroutine_function is not None else wrap
+
+
+def AsyncFunction(coroutine_function, addon=None, limit=None, **defaults):
+    """Équivalent de dragonfly `Function` pour une coroutine."""
+    from dragonfly import Function
+
+    return Function(async_action(coroutine_function, addon, limit), **defaults)
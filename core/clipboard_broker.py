@@ -0,0 +1,311 @@
+"""
+Courtier de presse-papiers pour l'injection de texte
+Sauvegarde le presse-papiers de l'utilisateur une seule fois par rafale et le
+restaure paresseusement après une période de calme.
+"""
+
+import threading
+import time
+
+from .logHandler import log
+
+
+class ClipboardBackend:
+    """Interface minimale d'accès au presse-papiers système."""
+
+    def get_text(self) -> str:
+        raise NotImplementedError
+
+    def set_text(self, text: str):
+        raise NotImplementedError
+
+    def get_sequence_number(self):
+        """Numéro de séquence du presse-papiers, ou None si la plateforme n'en fournit pas."""
+        return None
+
+
+class SystemClipboardBackend(ClipboardBackend):
+    """Presse-papiers Windows via dragonfly (+ numéro de séquence pywin32 si disponible)."""
+
+    def __init__(self):
+        from dragonfly import Clipboard
+
+        self._clipboard_cls = Clipboard
+        try:
+            self._clip = Clipboard()  # certaines versions exigent l'instance
+        except Exception:
+            self._clip = None
+
+        try:
+            import win32clipboard
+
+            self._sequence_fn = win32clipboard.GetClipboardSequenceNumber
+        except Exception:
+            self._sequence_fn = None
+
+    def get_text(self) -> str:
+        try:
+            if hasattr(self._clipboard_cls, "get_system_text"):
+                return self._clipboard_cls.get_system_text() or ""
+            if self._clip:
+                return self._clip.get_text() or ""
+            return self._clipboard_cls.get_text() or ""
+        except Exception:
+            return ""
+
+    def set_text(self, text: str):
+        try:
+            if hasattr(self._clipboard_cls, "set_system_text"):
+                self._clipboard_cls.set_system_text(text)
+            elif self._clip:
+                self._clip.set_text(text)
+            else:
+                try:
+                    self._clipboard_cls.set_text(content=text)
+                except TypeError:
+                    self._clipboard_cls.set_text(text)
+        except Exception:
+            pass
+
+    def get_sequence_number(self):
+        if not self._sequence_fn:
+            return None
+        try:
+            return self._sequence_fn()
+        except Exception:
+            return None
+
+
+class InjectionClipboardBackend(ClipboardBackend):
+    """Presse-papiers du backend d'injection courant (dragonfly ou enregistrement)."""
+
+    def get_text(self) -> str:
+        from .injection_backend import get_backend
+
+        return get_backend().clipboard_get()
+
+    def set_text(self, text: str):
+        from .injection_backend import get_backend
+
+        get_backend().clipboard_set(text)
+
+    def get_sequence_number(self):
+        from .injection_backend import get_backend
+
+        return get_backend().clipboard_sequence()
+
+
+class MemoryClipboardBackend(ClipboardBackend):
+    """Presse-papiers en mémoire (tests Linux / développement sans Windows)."""
+
+    def __init__(self, text="", with_sequence=True):
+        self.text = text
+        self.sequence = 1
+        self.with_sequence = with_sequence
+        self.reads = 0
+        self.writes = 0
+
+    def get_text(self) -> str:
+        self.reads += 1
+        return self.text
+
+    def set_text(self, text: str):
+        self.writes += 1
+        self.text = text
+        self.sequence += 1
+
+    def get_sequence_number(self):
+        return self.sequence if self.with_sequence else None
+
+
+class ClipboardBroker:
+    """
+    Regroupe les accès au presse-papiers d'une rafale d'injections/sélections.
+
+    - Le contenu de l'utilisateur est lu une seule fois au début de la rafale.
+    - La restauration est différée de `quiet_period` secondes après le dernier accès.
+    - Le numéro de séquence (si disponible) évite les lectures redondantes et
+      empêche d'écraser un contenu copié par l'utilisateur entre-temps.
+    """
+
+    def __init__(
+        self,
+        backend,
+        quiet_period=0.4,
+        copy_timeout=0.15,
+        copy_settle=0.01,
+        sleep=time.sleep,
+    ):
+        self.backend = backend
+        self.quiet_period = quiet_period
+        self.copy_timeout = copy_timeout
+        self.copy_settle = copy_settle
+        self._sleep = sleep
+
+        self._lock = threading.RLock()
+        self._timer = None
+        self._timer_generation = 0
+        self._saved_text = None  # contenu utilisateur à restaurer
+        self._owned_seq = None  # séquence après notre dernière écriture/copie
+        self._owned_text = None
+        self._known_seq = None  # séquence d'un contenu déjà lu (évite une relecture)
+        self._known_text = None
+
+        self.stats = {
+            "bursts": 0,
+            "reads": 0,
+            "skipped_reads": 0,
+            "writes": 0,
+            "skipped_writes": 0,
+            "restores": 0,
+            "skipped_restores": 0,
+        }
+
+    # -----------------------------
+    # API publique
+    # -----------------------------
+    def paste(self, text: str, send_paste, settle=0.005):
+        """Place `text` dans le presse-papiers et déclenche `send_paste` (ex: Ctrl+V)."""
+        with self._lock:
+            self._begin_burst()
+            self._write(text)
+            send_paste()
+            if settle:
+                self._sleep(settle)
+            self._schedule_restore()
+
+    def copy_selection(self, send_copy) -> str:
+        """Copie la sélection active via `send_copy` (ex: Ctrl+C) et retourne son texte."""
+        with self._lock:
+            self._begin_burst()
+            before = self.backend.get_sequence_number()
+            send_copy()
+
+            if before is None:
+                self._sleep(self.copy_settle)
+                text = self._read()
+            else:
+                seq = self._wait_sequence_change(before)
+                if seq == before:
+                    # Rien n'a été copié (sélection vide) : inutile de relire
+                    self.stats["skipped_reads"] += 1
+                    text = ""
+                else:
+                    text = self._read()
+
+            self._owned_seq = self.backend.get_sequence_number()
+            self._owned_text = text
+            self._schedule_restore()
+            return text
+
+    def restore_now(self):
+        """Restaure immédiatement le presse-papiers de l'utilisateur."""
+        with self._lock:
+            self._cancel_timer()
+            self._restore()
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats)
+
+    # -----------------------------
+    # Interne
+    # -----------------------------
+    def _read(self) -> str:
+        self.stats["reads"] += 1
+        return self.backend.get_text() or ""
+
+    def _begin_burst(self):
+        seq = self.backend.get_sequence_number()
+
+        if self._saved_text is not None:
+            # Rafale en cours : relire seulement si quelqu'un d'autre a écrit entre-temps
+            if seq is None or seq == self._owned_seq:
+                return
+            log.debug("[clipboard] contenu externe détecté pendant la rafale")
+
+        self.stats["bursts"] += 1
+        if seq is not None and seq == self._known_seq:
+            self.stats["skipped_reads"] += 1
+            self._saved_text = self._known_text
+        else:
+            self._saved_text = self._read()
+            self._known_seq = seq
+            self._known_text = self._saved_text
+
+    def _write(self, text: str):
+        seq = self.backend.get_sequence_number()
+        if seq is not None and seq == self._owned_seq and text == self._owned_text:
+            self.stats["skipped_writes"] += 1
+            return
+        self.stats["writes"] += 1
+        self.backend.set_text(text)
+        self._owned_seq = self.backend.get_sequence_number()
+        self._owned_text = text
+
+    def _wait_sequence_change(self, before, poll=0.002):
+        # Nombre de sondages borné (et non une échéance horaire) : compatible horloge virtuelle
+        seq = before
+        for _ in range(max(1, int(self.copy_timeout / poll))):
+            if seq != before:
+                break
+            self._sleep(poll)
+            seq = self.backend.get_sequence_number()
+        return seq
+
+    def _schedule_restore(self):
+        self._cancel_timer()
+        self._timer = threading.Timer(
+            self.quiet_period, self._on_quiet, args=(self._timer_generation,)
+        )
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self):
+        # Un minuteur déjà déclenché mais bloqué sur le verrou devient caduc
+        self._timer_generation += 1
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_quiet(self, generation):
+        with self._lock:
+            if generation != self._timer_generation:
+                return
+            self._timer = None
+            self._restore()
+
+    def _restore(self):
+        if self._saved_text is None:
+            return
+
+        seq = self.backend.get_sequence_number()
+        if seq is not None and self._owned_seq is not None and seq != self._owned_seq:
+            # L'utilisateur a copié autre chose depuis : ne pas l'écraser
+            self.stats["skipped_restores"] += 1
+            self._known_seq = None
+            self._known_text = None
+        else:
+            self.stats["restores"] += 1
+            self.backend.set_text(self._saved_text)
+            self._known_seq = self.backend.get_sequence_number()
+            self._known_text = self._saved_text
+
+        self._saved_text = None
+        self._owned_seq = None
+        self._owned_text = None
+
+
+_BROKER = None
+
+
+def get_clipboard_broker():
+    """Retourne le courtier partagé (presse-papiers du backend d'injection courant)."""
+    global _BROKER
+    if _BROKER is None:
+        from .injection_backend import get_backend
+
+        _BROKER = ClipboardBroker(
+            InjectionClipboardBackend(), sleep=lambda s: get_backend().sleep(s)
+        )
+    return _BROKER
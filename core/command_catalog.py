@@ -0,0 +1,440 @@
+"""
+Catalogue des commandes vocales, extrait statiquement des sources des addons
+Les fichiers sont analysés avec `ast` sans être exécutés (aucun
+`grammar.load()`, aucun accès au moteur) :
+  - MappingRule : clés de `mapping` et `extras` (classe ou appel MappingRule(...))
+  - CompoundRule : `spec`
+  - GrammarBase natlink : règles exportées de `gramSpec`, mots testés dans gotResults
+Les commandes sont rangées dans une base sqlite avec recherche plein texte
+(FTS5, ou LIKE si FTS5 est absent) ; seule la source dont le hash a changé
+est réanalysée.
+
+Usage:
+    python -m core.command_catalog [update|stats|list [addon]|search <texte>]
+"""
+
+import ast
+import hashlib
+import re
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+from .app_paths import get_data_dir
+from .logHandler import log
+
+CATALOG_VERSION = 1
+ACTION_WIDTH = 80
+
+_REF_RE = re.compile(r"<(\w+)>")
+# "<nom> exported = corps ;" dans un gramSpec natlink
+_GRAMSPEC_RULE_RE = re.compile(r"<(\w+)>\s+exported\s*=\s*(.*?);", re.S)
+
+
+class CommandEntry:
+    """Une commande extraite d'un fichier source."""
+
+    __slots__ = ("spec", "kind", "rule", "action", "extras", "line")
+
+    def __init__(self, spec, kind, rule, action="", extras="", line=0):
+        self.spec = spec
+        self.kind = kind
+        self.rule = rule
+        self.action = action
+        self.extras = extras
+        self.line = line
+
+
+# -----------------------------
+# Extraction (ast)
+# -----------------------------
+def _base_names(node):
+    names = []
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            names.append(base.attr)
+    return names
+
+
+def _source(node):
+    text = " ".join(ast.unparse(node).split())
+    return text if len(text) <= ACTION_WIDTH else text[: ACTION_WIDTH - 3] + "..."
+
+
+def _describe_extra(node):
+    """("nom", "Type(détail)") pour Dictation("texte"), IntegerRef("n", 1, 21)..."""
+    if not isinstance(node, ast.Call):
+        return None
+    func = node.func
+    kind = func.id if isinstance(func, ast.Name) else getattr(func, "attr", "?")
+    if not node.args or not isinstance(node.args[0], ast.Constant):
+        return None
+    name = node.args[0].value
+    details = [
+        str(arg.value) for arg in node.args[1:] if isinstance(arg, ast.Constant)
+    ]
+    if kind == "IntegerRef" and len(details) == 2:
+        return name, f"IntegerRef({details[0]}-{details[1]})"
+    return name, kind
+
+
+def _extras_of(node, constants):
+    """{nom: description} d'une liste d'extras littérale (ou d'une constante du module)."""
+    if isinstance(node, ast.Name):
+        node = constants.get(node.id)
+    if not isinstance(node, (ast.List, ast.Tuple)):
+        return {}
+    extras = {}
+    for element in node.elts:
+        described = _describe_extra(element)
+        if described:
+            extras[described[0]] = described[1]
+    return extras
+
+
+def _mapping_entries(mapping, extras, rule, constants):
+    if isinstance(mapping, ast.Name):
+        mapping = constants.get(mapping.id)
+    if not isinstance(mapping, ast.Dict):
+        return []
+    entries = []
+    for key, value in zip(mapping.keys, mapping.values):
+        if not (isinstance(key, ast.Constant) and isinstance(key.value, str)):
+            continue
+        used = [f"{name}:{extras[name]}" for name in _REF_RE.findall(key.value) if name in extras]
+        entries.append(
+            CommandEntry(key.value, "mapping", rule, _source(value), ", ".join(used), key.lineno)
+        )
+    return entries
+
+
+def _gramspec_entries(text, rule_class, line):
+    return [
+        CommandEntry(" ".join(body.split()), "gramspec", f"{rule_class}.{name}", "", "", line)
+        for name, body in _GRAMSPEC_RULE_RE.findall(text)
+    ]
+
+
+def _words_tested(function):
+    """Mots comparés dans gotResults : `"hello" in words`, `words[0] == "test"`."""
+    words = []
+    for node in ast.walk(function):
+        if not isinstance(node, ast.Compare):
+            continue
+        for operand in [node.left] + node.comparators:
+            if isinstance(operand, ast.Constant) and isinstance(operand.value, str):
+                words.append((operand.value, node.lineno))
+    return words
+
+
+def extract_commands(source, filename="<addon>"):
+    """Liste des CommandEntry d'un fichier source, sans l'exécuter."""
+    tree = ast.parse(source, filename)
+
+    # Constantes de module (dict/list littéraux) référencées par les règles
+    constants = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if isinstance(target, ast.Name):
+                constants[target.id] = node.value
+
+    entries = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            bases = _base_names(node)
+            attributes = {}
+            for statement in node.body:
+                if isinstance(statement, ast.Assign):
+                    for target in statement.targets:
+                        if isinstance(target, ast.Name):
+                            attributes[target.id] = statement.value
+
+            if any(b.endswith("MappingRule") for b in bases) and "mapping" in attributes:
+                extras = _extras_of(attributes.get("extras"), constants)
+                entries += _mapping_entries(attributes["mapping"], extras, node.name, constants)
+            elif any(b.endswith("CompoundRule") for b in bases):
+                spec = attributes.get("spec")
+                if isinstance(spec, ast.Constant) and isinstance(spec.value, str):
+                    entries.append(CommandEntry(spec.value, "compound", node.name, "", "", spec.lineno))
+            elif any(b.endswith("GrammarBase") for b in bases):
+                spec = attributes.get("gramSpec")
+                if isinstance(spec, ast.Constant) and isinstance(spec.value, str):
+                    entries += _gramspec_entries(spec.value, node.name, spec.lineno)
+                for statement in node.body:
+                    if isinstance(statement, ast.FunctionDef) and statement.name.startswith("gotResults"):
+                        for word, line in _words_tested(statement):
+                            entries.append(
+                                CommandEntry(word, "words", f"{node.name}.{statement.name}", "", "", line)
+                            )
+
+        elif isinstance(node, ast.Call):
+            # MappingRule(mapping={...}, extras=[...], name="...")
+            func = node.func
+            name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", "")
+            if not name.endswith("MappingRule"):
+                continue
+            keywords = {k.arg: k.value for k in node.keywords if k.arg}
+            if "mapping" not in keywords:
+                continue
+            rule = keywords.get("name")
+            rule = rule.value if isinstance(rule, ast.Constant) else name
+            extras = _extras_of(keywords.get("extras"), constants)
+            entries += _mapping_entries(keywords["mapping"], extras, rule, constants)
+
+    return entries
+
+
+def _hash_file(path):
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+
+# -----------------------------
+# Catalogue sqlite
+# -----------------------------
+class CommandCatalog:
+    """Base des commandes extraites, mise à jour par hash de fichier."""
+
+    def __init__(self, db_path=None):
+        self.db_path = Path(db_path) if db_path else get_data_dir("cache") / "command_catalog.sqlite"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.fts = self._create_schema()
+
+    def _create_schema(self):
+        conn = self._conn
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != CATALOG_VERSION:
+            conn.executescript(
+                """
+                DROP TABLE IF EXISTS files;
+                DROP TABLE IF EXISTS commands;
+                DROP TABLE IF EXISTS commands_fts;
+                """
+            )
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY, addon TEXT, hash TEXT, mtime_ns INTEGER, size INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS commands (
+                id INTEGER PRIMARY KEY, path TEXT, addon TEXT, grammar TEXT, rule TEXT,
+                kind TEXT, spec TEXT, action TEXT, extras TEXT, line INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS commands_path ON commands (path);
+            """
+        )
+        conn.execute(f"PRAGMA user_version = {CATALOG_VERSION}")
+        try:
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS commands_fts USING fts5("
+                "spec, rule, addon, action, tokenize = 'unicode61 remove_diacritics 2')"
+            )
+            fts = True
+        except sqlite3.OperationalError:
+            fts = False  # sqlite sans FTS5 : recherche LIKE
+        conn.commit()
+        return fts
+
+    def update(self, files=None):
+        """
+        Réanalyse les fichiers nouveaux ou modifiés, oublie les fichiers disparus.
+
+        Returns:
+            dict: {"scanned", "parsed", "removed", "commands", "seconds"}
+        """
+        if files is None:
+            from .grammar_loader import collect_grammar_files
+
+            files = collect_grammar_files()
+        start = time.perf_counter()
+        parsed = 0
+        with self._lock:
+            conn = self._conn
+            known = {
+                row[0]: row[1:]
+                for row in conn.execute("SELECT path, hash, mtime_ns, size FROM files")
+            }
+            current = set()
+            for file in files:
+                path = str(Path(file).resolve())
+                current.add(path)
+                try:
+                    stat = Path(path).stat()
+                except OSError:
+                    continue
+                previous = known.get(path)
+                if previous and previous[1:] == (stat.st_mtime_ns, stat.st_size):
+                    continue  # inchangé, pas besoin de hasher
+                digest = _hash_file(path)
+                if previous and previous[0] == digest:
+                    conn.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?",
+                        (stat.st_mtime_ns, stat.st_size, path),
+                    )
+                    continue
+                self._replace_file(path, digest, stat)
+                parsed += 1
+
+            removed = [path for path in known if path not in current]
+            for path in removed:
+                self._delete_file(path)
+            conn.commit()
+            total = conn.execute("SELECT COUNT(*) FROM commands").fetchone()[0]
+
+        seconds = time.perf_counter() - start
+        if parsed or removed:
+            log.info(
+                f"[command_catalog] {parsed} fichier(s) analysé(s), {len(removed)} retiré(s), "
+                f"{total} commande(s) en {seconds * 1000:.0f} ms"
+            )
+        return {
+            "scanned": len(current),
+            "parsed": parsed,
+            "removed": len(removed),
+            "commands": total,
+            "seconds": seconds,
+        }
+
+    def _delete_file(self, path):
+        conn = self._conn
+        if self.fts:
+            conn.execute(
+                "DELETE FROM commands_fts WHERE rowid IN (SELECT id FROM commands WHERE path = ?)",
+                (path,),
+            )
+        conn.execute("DELETE FROM commands WHERE path = ?", (path,))
+        conn.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def _replace_file(self, path, digest, stat):
+        conn = self._conn
+        self._delete_file(path)
+        file = Path(path)
+        addon = file.parent.name
+        try:
+            entries = extract_commands(file.read_text(encoding="utf-8"), path)
+        except (SyntaxError, UnicodeDecodeError) as e:
+            log.warning(f"[command_catalog] {file.name} non analysable: {e}")
+            entries = []
+        for entry in entries:
+            cursor = conn.execute(
+                "INSERT INTO commands (path, addon, grammar, rule, kind, spec, action, extras, line) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (path, addon, file.stem, entry.rule, entry.kind, entry.spec, entry.action, entry.extras, entry.line),
+            )
+            if self.fts:
+                conn.execute(
+                    "INSERT INTO commands_fts (rowid, spec, rule, addon, action) VALUES (?, ?, ?, ?, ?)",
+                    (cursor.lastrowid, entry.spec, entry.rule, addon, entry.action),
+                )
+        conn.execute(
+            "INSERT INTO files (path, addon, hash, mtime_ns, size) VALUES (?, ?, ?, ?, ?)",
+            (path, addon, digest, stat.st_mtime_ns, stat.st_size),
+        )
+
+    _COLUMNS = "c.spec, c.addon, c.grammar, c.rule, c.kind, c.action, c.extras, c.path, c.line"
+
+    def _rows(self, sql, params):
+        keys = ("spec", "addon", "grammar", "rule", "kind", "action", "extras", "path", "line")
+        with self._lock:
+            return [dict(zip(keys, row)) for row in self._conn.execute(sql, params)]
+
+    def list_commands(self, addon=None, limit=None):
+        sql = f"SELECT {self._COLUMNS} FROM commands c"
+        params = []
+        if addon:
+            sql += " WHERE c.addon = ?"
+            params.append(addon)
+        sql += " ORDER BY c.addon, c.grammar, c.spec"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._rows(sql, params)
+
+    def search(self, text, limit=200):
+        """Commandes dont la phrase, la règle, l'addon ou l'action contient tous les mots de `text` (préfixes)."""
+        words = re.findall(r"\w+", text)
+        if not words:
+            return self.list_commands(limit=limit)
+        if self.fts:
+            query = " ".join('"' + w.replace('"', "") + '"*' for w in words)
+            return self._rows(
+                f"SELECT {self._COLUMNS} FROM commands_fts f JOIN commands c ON c.id = f.rowid "
+                "WHERE commands_fts MATCH ? ORDER BY rank LIMIT ?",
+                (query, limit),
+            )
+        clauses = " AND ".join(
+            "(c.spec LIKE ? OR c.rule LIKE ? OR c.addon LIKE ? OR c.action LIKE ?)" for _ in words
+        )
+        params = [f"%{w}%" for w in words for _ in range(4)]
+        return self._rows(
+            f"SELECT {self._COLUMNS} FROM commands c WHERE {clauses} ORDER BY c.spec LIMIT ?",
+            params + [limit],
+        )
+
+    def get_stats(self):
+        with self._lock:
+            files = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            commands = self._conn.execute("SELECT COUNT(*) FROM commands").fetchone()[0]
+        return {"files": files, "commands": commands, "fts": self.fts, "path": str(self.db_path)}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_CATALOG = None
+
+
+def get_command_catalog():
+    """Catalogue partagé (base dans le dossier cache)."""
+    global _CATALOG
+    if _CATALOG is None:
+        _CATALOG = CommandCatalog()
+    return _CATALOG
+
+
+def _print_rows(rows):
+    for row in rows:
+        extras = f"  [{row['extras']}]" if row["extras"] else ""
+        print(f"{row['addon']}/{row['grammar']}:{row['line']}  {row['spec']}{extras}  -> {row['action'] or row['kind']}")
+
+
+def main():
+    """Point d'entrée CLI"""
+    args = sys.argv[1:]
+    catalog = get_command_catalog()
+    command = args[0] if args else "update"
+    if command == "update":
+        result = catalog.update()
+        print(
+            f"{result['scanned']} fichier(s), {result['parsed']} analysé(s), "
+            f"{result['removed']} retiré(s) : {result['commands']} commande(s) "
+            f"en {result['seconds'] * 1000:.0f} ms"
+        )
+    elif command == "stats":
+        catalog.update()
+        stats = catalog.get_stats()
+        print(
+            f"{stats['path']}: {stats['commands']} commande(s) dans {stats['files']} fichier(s) "
+            f"(recherche {'FTS5' if stats['fts'] else 'LIKE'})"
+        )
+    elif command == "list":
+        catalog.update()
+        _print_rows(catalog.list_commands(args[1] if len(args) > 1 else None))
+    elif command == "search" and len(args) > 1:
+        catalog.update()
+        start = time.perf_counter()
+        rows = catalog.search(" ".join(args[1:]))
+        _print_rows(rows)
+        print(f"{len(rows)} résultat(s) en {(time.perf_counter() - start) * 1000:.1f} ms")
+    else:
+        print(__doc__.strip().split("Usage:")[1].strip())
+
+
+if __name__ == "__main__":
+    main()
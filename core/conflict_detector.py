@@ -0,0 +1,337 @@
+"""
+Détection des conflits entre grammaires
+Toutes les specs des addons (addons/ et grammars/ installés) sont développées
+en phrases normalisées (minuscules, sans accents, extras remplacés par leur
+type : <Dictation>, <IntegerRef>, <ListRef>...) et rangées dans un arbre de
+préfixes commun. On y repère, entre fichiers différents :
+  - exact    : même phrase dans deux grammaires
+  - prefix   : une commande est le début d'une autre ("retour" / "retour à la ligne")
+  - dictation: une spec terminée par une dictée capture les phrases d'une autre
+    (la grammaire de dictée "<texte>" capture tout)
+Les specs extraites sont mises en cache par hash de fichier ; à
+l'installation d'un addon, seuls ses fichiers sont comparés aux autres.
+
+Usage:
+    python -m core.conflict_detector [dossier_addon ...]
+"""
+
+import hashlib
+import pickle
+import sys
+from pathlib import Path
+
+from .app_paths import get_data_dir
+from .logHandler import log
+
+GRAMMAR_DIR = Path(__file__).parent.parent / "grammars"
+CACHE_VERSION = 1
+MAX_PHRASES_PER_SPEC = 512  # au-delà, les phrases d'une spec sont tronquées
+DICTATION = "<Dictation>"
+
+
+def collect_installed_files():
+    """Fichiers de grammaire de addons/ (chargés par le loader) et de grammars/ (installés)."""
+    from .grammar_loader import collect_grammar_files
+
+    files = list(collect_grammar_files())
+    if GRAMMAR_DIR.exists():
+        for folder in GRAMMAR_DIR.iterdir():
+            if folder.is_dir():
+                files += [f for f in folder.glob("*.py") if not f.name.startswith("__")]
+    return files
+
+
+def _captures(suffix, rest):
+    """Une dictée suivie de `suffix` couvre-t-elle `rest` (au moins un mot dicté) ?"""
+    if len(rest) <= len(suffix) or rest[0] == DICTATION:
+        return False
+    return not suffix or rest[-len(suffix) :] == suffix
+
+
+def _label(path):
+    path = Path(path)
+    return f"{path.parent.name}/{path.stem}"
+
+
+class Conflict:
+    __slots__ = ("kind", "phrase", "a", "b")
+
+    def __init__(self, kind, phrase, a, b):
+        self.kind = kind
+        self.phrase = phrase  # phrase normalisée concernée
+        self.a = a  # (fichier, règle, spec) qui capture / le plus court
+        self.b = b
+
+    def key(self):
+        return (self.kind, self.a, self.b) if self.a <= self.b or self.kind != "exact" else (self.kind, self.b, self.a)
+
+    def __str__(self):
+        (fa, ra, sa), (fb, rb, sb) = self.a, self.b
+        return f"[{self.kind}] {fa}:{ra} \"{sa}\" <-> {fb}:{rb} \"{sb}\""
+
+
+class _Node:
+    __slots__ = ("children", "terminals", "files")
+
+    def __init__(self):
+        self.children = {}
+        self.terminals = []  # propriétaires (fichier, règle, spec) d'une phrase finissant ici
+        self.files = set()  # fichiers dont une phrase passe par ce noeud
+
+
+# -----------------------------
+# Normalisation des specs
+# -----------------------------
+def expand_phrases(spec, extras, limit=MAX_PHRASES_PER_SPEC):
+    """Phrases normalisées (tuples de mots) d'une spec dragonfly."""
+    from .grammar_complexity import fold_accents, parse_spec
+
+    def expand(node):
+        kind = node[0]
+        if kind == "word":
+            return [(fold_accents(node[1]),)]
+        if kind == "ref":
+            return [(f"<{extras.get(node[1], '?')}>",)]
+        if kind == "opt":
+            return [()] + expand(node[1])
+        if kind == "alt":
+            return [p for child in node[1] for p in expand(child)][:limit]
+        phrases = [()]
+        for child in node[1]:
+            phrases = [a + b for a in phrases for b in expand(child)][:limit]
+        return phrases
+
+    return [p for p in expand(parse_spec(spec)) if p]
+
+
+def _file_phrases(entries):
+    """[(phrase, règle, spec)] des entrées extraites d'un fichier."""
+    from .grammar_complexity import SpecError
+
+    phrases = []
+    for entry in entries:
+        if entry.kind not in ("mapping", "compound", "gramspec"):
+            continue
+        extras = {}
+        for item in filter(None, entry.extras.split(", ")):
+            name, _, description = item.partition(":")
+            extras[name] = description.split("(")[0]
+        try:
+            for phrase in expand_phrases(entry.spec, extras):
+                phrases.append((phrase, entry.rule, entry.spec))
+        except SpecError as e:
+            log.warning(f"[conflicts] spec ignorée: {e}")
+    return phrases
+
+
+# -----------------------------
+# Détecteur
+# -----------------------------
+class ConflictDetector:
+    """Arbre de préfixes des phrases de tous les addons, cache par hash de fichier."""
+
+    def __init__(self, cache_path=None):
+        self.cache_path = Path(cache_path) if cache_path else get_data_dir("cache") / "conflict_specs.pickle"
+        self._files = {}  # chemin -> (sha1, [(phrase, règle, spec)])
+        try:
+            with open(self.cache_path, "rb") as f:
+                version, files = pickle.load(f)
+            if version == CACHE_VERSION:
+                self._files = files
+        except Exception:
+            pass
+
+    def _save(self):
+        try:
+            with open(self.cache_path, "wb") as f:
+                pickle.dump((CACHE_VERSION, self._files), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            log.warning(f"[conflicts] cache non enregistré: {e}")
+
+    def _update(self, files):
+        """Réextrait les fichiers dont le hash a changé ; retourne les chemins à jour."""
+        from .command_catalog import extract_commands
+
+        paths = []
+        changed = False
+        for file in files:
+            path = str(Path(file).resolve())
+            try:
+                data = Path(path).read_bytes()
+            except OSError:
+                continue
+            digest = hashlib.sha1(data).hexdigest()
+            cached = self._files.get(path)
+            if cached is None or cached[0] != digest:
+                try:
+                    entries = extract_commands(data.decode("utf-8"), path)
+                except (SyntaxError, UnicodeDecodeError) as e:
+                    log.warning(f"[conflicts] {Path(path).name} non analysable: {e}")
+                    entries = []
+                self._files[path] = (digest, _file_phrases(entries))
+                changed = True
+            paths.append(path)
+        return paths, changed
+
+    def _build(self, paths):
+        root = _Node()
+        for path in paths:
+            label = _label(path)
+            for phrase, rule, spec in self._files[path][1]:
+                node = root
+                node.files.add(label)
+                for word in phrase:
+                    node = node.children.setdefault(word, _Node())
+                    node.files.add(label)
+                node.terminals.append((label, rule, spec))
+        return root
+
+    def _check(self, root, phrase, owner, found, both_directions):
+        label = owner[0]
+        node = root
+        for depth, word in enumerate(phrase):
+            # Une phrase d'un autre fichier finit ici : elle est préfixe de la nôtre
+            for other in node.terminals:
+                if other[0] != label:
+                    found.append(Conflict("prefix", phrase, other, owner))
+            # Une autre spec continue par une dictée : elle capture la suite
+            # si ses mots après la dictée terminent aussi notre phrase
+            capture = node.children.get(DICTATION)
+            if capture is not None and word != DICTATION:
+                rest = phrase[depth:]
+                for suffix, other in self._phrases_below(capture, label):
+                    if _captures(suffix, rest):
+                        found.append(Conflict("dictation", phrase, other, owner))
+            if both_directions and word == DICTATION:
+                # Notre dictée capture les phrases des autres qui continuent ici
+                suffix = phrase[depth + 1 :]
+                for word_after, child in node.children.items():
+                    if word_after == DICTATION:
+                        continue
+                    for rest, other in self._phrases_below(child, label):
+                        if _captures(suffix, (word_after,) + rest):
+                            found.append(Conflict("dictation", phrase, owner, other))
+            node = node.children.get(word)
+            if node is None:
+                return
+        for other in node.terminals:
+            if other[0] != label:
+                found.append(Conflict("exact", phrase, other, owner))
+        if both_directions:
+            # Notre phrase est le début de phrases des autres
+            for child in node.children.values():
+                for _, other in self._phrases_below(child, label):
+                    found.append(Conflict("prefix", phrase, owner, other))
+
+    @staticmethod
+    def _phrases_below(node, label):
+        """(mots après node, propriétaire) des phrases des autres fichiers sous node."""
+        stack = [(node, ())]
+        while stack:
+            current, path = stack.pop()
+            if current.files == {label}:
+                continue
+            for other in current.terminals:
+                if other[0] != label:
+                    yield path, other
+            for word, child in current.children.items():
+                stack.append((child, path + (word,)))
+
+    @staticmethod
+    def _unique(conflicts):
+        seen = set()
+        unique = []
+        for conflict in conflicts:
+            key = conflict.key()
+            if key not in seen:
+                seen.add(key)
+                unique.append(conflict)
+        return unique
+
+    def scan(self, files=None):
+        """Tous les conflits entre les addons installés."""
+        paths, changed = self._update(collect_installed_files() if files is None else files)
+        if changed:
+            self._save()
+        root = self._build(paths)
+        found = []
+        for path in paths:
+            label = _label(path)
+            for phrase, rule, spec in self._files[path][1]:
+                self._check(root, phrase, (label, rule, spec), found, both_directions=False)
+        return self._unique(found)
+
+    def check_addon(self, addon_dir, files=None):
+        """Conflits entre les fichiers d'un addon (nouvellement installé) et tous les autres."""
+        addon_dir = Path(addon_dir).resolve()
+        new_files = [f for f in addon_dir.glob("*.py") if not f.name.startswith("__")]
+        others = [
+            f for f in (collect_installed_files() if files is None else files)
+            if Path(f).resolve().parent != addon_dir
+        ]
+        new_paths, changed_new = self._update(new_files)
+        other_paths, changed_other = self._update(others)
+        if changed_new or changed_other:
+            self._save()
+        root = self._build(other_paths)
+        found = []
+        for path in new_paths:
+            label = _label(path)
+            for phrase, rule, spec in self._files[path][1]:
+                self._check(root, phrase, (label, rule, spec), found, both_directions=True)
+        return self._unique(found)
+
+
+def summarize(conflicts, examples=3):
+    """Lignes de rapport ; les captures d'une dictée seule "<texte>" sont regroupées."""
+    lines = []
+    captures = {}
+    for conflict in conflicts:
+        if conflict.kind == "dictation" and conflict.a[2].strip().startswith("<") and " " not in conflict.a[2].strip():
+            captures.setdefault((conflict.a, conflict.b[0]), []).append(conflict.b[2])
+            continue
+        lines.append(str(conflict))
+    for (owner, other_file), specs in sorted(captures.items()):
+        sample = ", ".join(f'"{s}"' for s in specs[:examples])
+        lines.append(
+            f"[dictation] {owner[0]}:{owner[1]} \"{owner[2]}\" capture {len(specs)} "
+            f"commande(s) de {other_file} ({sample}{', ...' if len(specs) > examples else ''})"
+        )
+    return lines
+
+
+def check_installed_addon(addon_dir):
+    """Appelé après l'installation d'un addon : journalise ses conflits et retourne leur nombre."""
+    conflicts = ConflictDetector().check_addon(addon_dir)
+    if conflicts:
+        log.warning(f"⚠️ {len(conflicts)} conflit(s) de commandes pour {Path(addon_dir).name}:")
+        for line in summarize(conflicts):
+            log.warning(f"   {line}")
+    else:
+        log.info(f"Aucun conflit de commandes pour {Path(addon_dir).name}")
+    return len(conflicts)
+
+
+def main():
+    """Point d'entrée CLI"""
+    args = sys.argv[1:]
+    if args and args[0] in ("-h", "--help"):
+        print(__doc__.strip().split("Usage:")[1].strip())
+        return
+    detector = ConflictDetector()
+    conflicts = []
+    if args:
+        for addon_dir in args:
+            conflicts += detector.check_addon(addon_dir)
+    else:
+        conflicts = detector.scan()
+    for line in summarize(conflicts):
+        print(line)
+    counts = {}
+    for conflict in conflicts:
+        counts[conflict.kind] = counts.get(conflict.kind, 0) + 1
+    print(f"{len(conflicts)} conflit(s) " + ", ".join(f"{k}: {n}" for k, n in sorted(counts.items())))
+
+
+if __name__ == "__main__":
+    main()
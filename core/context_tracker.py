@@ -0,0 +1,357 @@
+"""
+Suivi de la fenêtre au premier plan
+Met en cache les informations de la fenêtre active (TTL court), se met à jour
+à partir des événements de changement de fenêtre quand ils existent, et
+active/désactive en bloc les grammaires liées à un contexte au lieu de
+réévaluer chaque contexte à chaque énoncé.
+"""
+
+import sys
+import threading
+import time
+
+from .logHandler import log
+
+
+class ForegroundInfo:
+    """Fenêtre au premier plan : exécutable, titre, handle."""
+
+    __slots__ = ("executable", "title", "handle")
+
+    def __init__(self, executable="", title="", handle=None):
+        self.executable = executable or ""
+        self.title = title or ""
+        self.handle = handle
+
+    @property
+    def executable_name(self):
+        """Nom de l'exécutable en minuscules, sans chemin ni « .exe »."""
+        name = self.executable.replace("\\", "/").rsplit("/", 1)[-1].lower()
+        return name[:-4] if name.endswith(".exe") else name
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, ForegroundInfo)
+            and self.handle == other.handle
+            and self.executable == other.executable
+            and self.title == other.title
+        )
+
+    def __hash__(self):
+        return hash((self.handle, self.executable, self.title))
+
+    def __repr__(self):
+        return f"ForegroundInfo({self.executable_name!r}, {self.title!r}, {self.handle!r})"
+
+
+# -----------------------------
+# Sources de fenêtre
+# -----------------------------
+class WindowSource:
+    """Interface : retourne la fenêtre au premier plan."""
+
+    def get_foreground(self) -> ForegroundInfo:
+        raise NotImplementedError
+
+
+class DragonflyWindowSource(WindowSource):
+    """Fenêtre au premier plan via dragonfly `Window.get_foreground()`."""
+
+    def __init__(self):
+        from dragonfly import Window
+
+        self._window_cls = Window
+
+    def get_foreground(self) -> ForegroundInfo:
+        window = self._window_cls.get_foreground()
+        return ForegroundInfo(window.executable, window.title, window.handle)
+
+
+class FakeWindowSource(WindowSource):
+    """Source factice pour les tests : fenêtre fixée à la main, requêtes comptées."""
+
+    def __init__(self, executable="", title="", handle=1):
+        self.info = ForegroundInfo(executable, title, handle)
+        self.queries = 0
+
+    def set_foreground(self, executable, title="", handle=None):
+        if handle is None:
+            handle = (self.info.handle or 0) + 1
+        self.info = ForegroundInfo(executable, title, handle)
+
+    def get_foreground(self) -> ForegroundInfo:
+        self.queries += 1
+        return self.info
+
+
+def app_predicate(*executables):
+    """Prédicat « la fenêtre active est l'un de ces exécutables » (noms sans .exe)."""
+    names = {e.lower() for e in executables}
+    return lambda info: info.executable_name in names
+
+
+# -----------------------------
+# Suivi
+# -----------------------------
+class ContextTracker:
+    """
+    Cache de la fenêtre au premier plan partagé par les addons.
+
+    - `current()` ne réinterroge l'OS qu'après `ttl` secondes, ou jamais tant
+      qu'aucun événement de changement n'est reçu si un hook est actif.
+    - `notify_foreground()` injecte une information déjà connue (ex: début
+      d'énoncé dragonfly) sans appel système.
+    - `bind_grammar()` active/désactive une grammaire quand le contexte change.
+    """
+
+    def __init__(self, source=None, ttl=0.25):
+        self._source = source
+        self.ttl = ttl
+        self._info = None
+        self._fetched_at = 0.0
+        self._events_active = False
+        self._hook_thread = None
+        self._hook_thread_id = None
+        self._dirty = True
+        self._listeners = []
+        self._bindings = []  # [(grammar, predicate, dernier état appliqué)]
+        self._lock = threading.RLock()
+        self.stats = {"queries": 0, "hits": 0, "changes": 0, "toggles": 0}
+
+    @property
+    def source(self):
+        if self._source is None:
+            self._source = DragonflyWindowSource()
+        return self._source
+
+    def current(self) -> ForegroundInfo:
+        """Fenêtre au premier plan (en cache si récente)."""
+        with self._lock:
+            fresh = self._info is not None and (
+                (self._events_active and not self._dirty)
+                or (time.monotonic() - self._fetched_at) < self.ttl
+            )
+            if fresh:
+                self.stats["hits"] += 1
+                return self._info
+        return self.refresh()
+
+    def refresh(self) -> ForegroundInfo:
+        """Réinterroge la source et applique les liaisons si la fenêtre a changé."""
+        try:
+            info = self.source.get_foreground()
+        except Exception as e:
+            log.debug(f"[context] fenêtre au premier plan indisponible: {e}")
+            info = ForegroundInfo()
+        with self._lock:
+            self.stats["queries"] += 1
+        self._update(info)
+        return info
+
+    def notify_foreground(self, executable, title="", handle=None):
+        """Met à jour le cache depuis un événement (aucun appel système)."""
+        self._update(ForegroundInfo(executable, title, handle))
+
+    def invalidate(self):
+        """Marque le cache périmé (ex: hook de changement de fenêtre)."""
+        with self._lock:
+            self._dirty = True
+
+    def _update(self, info):
+        with self._lock:
+            old = self._info
+            self._info = info
+            self._fetched_at = time.monotonic()
+            self._dirty = False
+            if old == info:
+                return
+            self.stats["changes"] += 1
+            listeners = list(self._listeners)
+            self._apply_bindings(info)
+
+        for listener in listeners:
+            try:
+                listener(old, info)
+            except Exception as e:
+                log.error(f"Erreur dans un listener de contexte: {e}")
+
+    # -----------------------------
+    # Listeners / grammaires liées
+    # -----------------------------
+    def add_listener(self, callback):
+        """callback(ancienne_info, nouvelle_info) appelé à chaque changement de fenêtre."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def bind_grammar(self, grammar, predicate):
+        """
+        Active `grammar` seulement quand `predicate(info)` est vrai (appliqué au changement).
+        Une grammaire liée est gérée uniquement par le suivi : ne pas l'activer
+        ou la désactiver ailleurs (unbind_grammar() d'abord).
+        """
+        with self._lock:
+            self._bindings = [b for b in self._bindings if b[0] is not grammar]
+            self._bindings.append([grammar, predicate, None])
+            info = self._info
+        self._apply_bindings(info or self.current())
+
+    def unbind_grammar(self, grammar):
+        with self._lock:
+            self._bindings = [b for b in self._bindings if b[0] is not grammar]
+
+    def forget(self, owned):
+        """Retire les listeners et liaisons pour lesquels `owned(objet)` est vrai ; retourne leur nombre."""
+        with self._lock:
+            listeners = [cb for cb in self._listeners if not owned(cb)]
+            bindings = [b for b in self._bindings if not owned(b[0]) and not owned(b[1])]
+            removed = len(self._listeners) - len(listeners) + len(self._bindings) - len(bindings)
+            self._listeners, self._bindings = listeners, bindings
+        return removed
+
+    def _apply_bindings(self, info):
+        with self._lock:
+            for binding in self._bindings:
+                grammar, predicate, applied = binding
+                try:
+                    wanted = bool(predicate(info))
+                except Exception:
+                    wanted = False
+                if wanted == applied:
+                    continue
+                try:
+                    if wanted:
+                        grammar.enable()
+                    else:
+                        grammar.disable()
+                    binding[2] = wanted
+                    self.stats["toggles"] += 1
+                except Exception as e:
+                    log.error(f"Erreur activation grammaire liée au contexte: {e}")
+
+    # -----------------------------
+    # Événements Windows
+    # -----------------------------
+    def start_event_hook(self):
+        """Écoute EVENT_SYSTEM_FOREGROUND (Windows) ; sinon le TTL reste utilisé."""
+        if sys.platform != "win32" or self._events_active:
+            return False
+        ready = threading.Event()
+        self._hook_thread = threading.Thread(
+            target=self._event_loop, args=(ready,), daemon=True, name="ForegroundHook"
+        )
+        self._hook_thread.start()
+        ready.wait(1.0)
+        return self._events_active
+
+    def stop_event_hook(self):
+        """Arrête la boucle de messages du hook (WM_QUIT) ; le TTL reprend."""
+        thread, thread_id = self._hook_thread, self._hook_thread_id
+        if thread is None:
+            return
+        if thread_id is not None:
+            try:
+                import ctypes
+
+                WM_QUIT = 0x0012
+                ctypes.windll.user32.PostThreadMessageW(thread_id, WM_QUIT, 0, 0)
+            except Exception as e:
+                log.warning(f"[context] arrêt du hook de fenêtre: {e}")
+        thread.join(timeout=1.0)
+        self._hook_thread = None
+        self.invalidate()
+
+    def _event_loop(self, ready):
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            user32 = ctypes.windll.user32
+            self._hook_thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+            EVENT_SYSTEM_FOREGROUND = 0x0003
+            WINEVENT_OUTOFCONTEXT = 0x0000
+            WinEventProc = ctypes.WINFUNCTYPE(
+                None,
+                wintypes.HANDLE,
+                wintypes.DWORD,
+                wintypes.HWND,
+                wintypes.LONG,
+                wintypes.LONG,
+                wintypes.DWORD,
+                wintypes.DWORD,
+            )
+
+            def on_event(*args):
+                self.invalidate()
+
+            self._event_proc = WinEventProc(on_event)  # garder une référence
+            hook = user32.SetWinEventHook(
+                EVENT_SYSTEM_FOREGROUND,
+                EVENT_SYSTEM_FOREGROUND,
+                0,
+                self._event_proc,
+                0,
+                0,
+                WINEVENT_OUTOFCONTEXT,
+            )
+            if not hook:
+                ready.set()
+                return
+            self._events_active = True
+            ready.set()
+            log.info("[context] hook de changement de fenêtre actif")
+
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+            user32.UnhookWinEvent(hook)
+            log.info("[context] hook de changement de fenêtre arrêté")
+        except Exception as e:
+            log.warning(f"[context] hook de fenêtre indisponible: {e}")
+        finally:
+            self._events_active = False
+            self._hook_thread_id = None
+            ready.set()
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats)
+
+
+class ContextTrackingMixin:
+    """
+    Mixin pour une grammaire dragonfly : chaque début d'énoncé transmet la
+    fenêtre active (déjà fournie par le moteur) au suivi partagé.
+
+        class TrackedGrammar(ContextTrackingMixin, Grammar):
+            pass
+    """
+
+    def _process_begin(self, executable, title, handle):
+        get_context_tracker().notify_foreground(executable, title, handle)
+        parent = getattr(super(), "_process_begin", None)
+        if parent:
+            parent(executable, title, handle)
+
+
+_TRACKER = None
+
+
+def get_context_tracker():
+    """Suivi de contexte partagé."""
+    global _TRACKER
+    if _TRACKER is None:
+        _TRACKER = ContextTracker()
+    return _TRACKER
+
+
+def set_context_tracker(tracker):
+    """Remplace le suivi partagé (ex: source factice pour un benchmark)."""
+    global _TRACKER
+    _TRACKER = tracker
+    return tracker
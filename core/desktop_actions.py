@@ -0,0 +1,27 @@
+"""
+Actions de bureau appelables depuis un processus de travail
+Fonctions importables par chemin (ex: "core.desktop_actions:open_notepad_with_text")
+pour être exécutées hors du thread du moteur par le pool d'actions.
+"""
+
+import subprocess
+import tempfile
+
+from .logHandler import log
+
+
+def open_notepad_with_text(text="salut comment ça va, c'est Sendhil"):
+    """Ouvre le Bloc-notes sur un fichier temporaire contenant `text` ; retourne son chemin."""
+    # Use a temp file so Notepad opens a file containing the text.
+    # We write UTF-8 with BOM so Notepad (on Windows) displays accented characters correctly.
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".txt", delete=False, encoding="utf-8"
+    ) as tf:
+        # Write BOM for Notepad to auto-detect UTF-8
+        tf.write("\ufeff")
+        tf.write(text)
+        temp_path = tf.name
+
+    subprocess.Popen(["notepad.exe", temp_path])
+    log.info(f"Notepad launched successfully with file: {temp_path}")
+    return temp_path
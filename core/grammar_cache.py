@@ -0,0 +1,295 @@
+"""
+Cache des grammaires compilées
+Le moteur natlink de dragonfly recompile toutes les règles d'une grammaire
+(NatlinkCompiler.compile_grammar) à chaque Grammar.load() : chaque bascule
+du micro ou rechargement refait le même travail. Le résultat compilé est
+mémorisé sous une clé = hash des définitions de règles (nom, export, import,
+arbre de l'élément : type, paramètres et enfants de chaque nœud), des listes
+et de la version du moteur ; en mémoire (LRU) et, optionnellement, sur
+disque (cache/compiled_grammars/).
+Une grammaire inchangée est rechargée sans compilation.
+
+Usage:
+    python -m core.grammar_cache [stats|clear]
+"""
+
+import hashlib
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from .app_paths import get_data_dir
+from .logHandler import log
+
+CACHE_VERSION = 2
+MEMORY_ENTRIES = 128
+DISK_ENTRIES = 256
+DISK_CACHE = True  # conserver les grammaires compilées entre deux lancements
+
+
+def engine_version():
+    """Versions de dragonfly et de natlink (une grammaire compilée en dépend)."""
+    from importlib.metadata import version
+
+    versions = []
+    for package in ("dragonfly2", "dragonfly"):
+        try:
+            versions.append(f"{package}={version(package)}")
+            break
+        except Exception:
+            continue
+    try:
+        import natlink
+
+        versions.append(f"natlink={getattr(natlink, '__version__', '?')}")
+    except ImportError:
+        pass
+    return ";".join(versions)
+
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _param_text(value):
+    # Valeurs simples seulement : une action ou un objet (repr avec adresse)
+    # rendrait la clé différente à chaque lancement
+    if isinstance(value, _SCALARS):
+        return repr(value)
+    if isinstance(value, (tuple, list)) and all(isinstance(item, _SCALARS) for item in value):
+        return repr(tuple(value))
+    if isinstance(value, dict) and all(isinstance(k, _SCALARS) for k in value):
+        return "{" + ",".join(f"{k!r}:{_param_text(v)}" for k, v in sorted(value.items(), key=repr)) + "}"
+    return type(value).__name__
+
+
+def _element_text(element):
+    """
+    Arbre de l'élément : type, attributs (bornes d'IntegerRef, min/max d'une
+    Repetition, mots d'un Literal, nom d'un RuleRef / ListRef, valeurs d'un
+    Choice...) et enfants, récursivement. gstring() ne suffit pas : deux
+    éléments peuvent l'avoir identique avec des paramètres différents.
+    """
+    parts = []
+    stack = [(element, 0)]
+    while stack:
+        node, depth = stack.pop()
+        kind = type(node)
+        params = []
+        for name, value in sorted(getattr(node, "__dict__", {}).items()):
+            if name == "_children":
+                continue
+            if not isinstance(value, _SCALARS) and isinstance(getattr(value, "name", None), str):
+                value = value.name  # règle d'un RuleRef, liste d'un ListRef : le nom suffit
+            params.append(f"{name}={_param_text(value)}")
+        parts.append(f"{depth}|{kind.__module__}.{kind.__qualname__}({','.join(params)})")
+        children = getattr(node, "children", ()) or ()
+        stack.extend((child, depth + 1) for child in reversed(tuple(children)))
+    return "\n".join(parts)
+
+
+def grammar_key(grammar, version=None):
+    """Hash des définitions de règles et des listes d'une grammaire dragonfly."""
+    digest = hashlib.sha1()
+    digest.update(f"{CACHE_VERSION}|{version if version is not None else engine_version()}".encode())
+    for rule in grammar.rules:
+        digest.update(
+            f"\nrule|{rule.name}|{int(bool(rule.exported))}|{int(bool(getattr(rule, 'imported', False)))}|".encode()
+        )
+        element = getattr(rule, "element", None)
+        if element is not None:
+            digest.update(_element_text(element).encode("utf-8", "replace"))
+    # Seuls les noms des listes sont compilés ; leur contenu est envoyé à part
+    for lst in grammar.lists:
+        digest.update(f"\nlist|{lst.name}".encode())
+    return digest.hexdigest()
+
+
+def _copy(result):
+    # (grammaire compilée, noms de règles) : la liste reste propre à l'appelant
+    if isinstance(result, tuple):
+        return tuple(list(item) if isinstance(item, list) else item for item in result)
+    return result
+
+
+class CompiledGrammarCache:
+    """LRU mémoire + fichiers pickle sur disque ; compte hits / misses."""
+
+    def __init__(self, memory_entries=MEMORY_ENTRIES, disk=DISK_CACHE, disk_entries=DISK_ENTRIES):
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self.disk_dir = None
+        if disk:
+            try:
+                self.disk_dir = get_data_dir("cache") / "compiled_grammars"
+                self.disk_dir.mkdir(exist_ok=True)
+            except OSError as e:
+                log.warning(f"[grammar_cache] cache disque désactivé: {e}")
+                self.disk_dir = None
+        self._entries = OrderedDict()  # clé -> (résultat de compile_grammar, durée de compilation)
+        self._lock = threading.Lock()
+        self._version = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+    @property
+    def version(self):
+        if self._version is None:
+            self._version = engine_version()
+        return self._version
+
+    def _disk_path(self, key):
+        return self.disk_dir / f"{key}.bin"
+
+    def _remember(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.memory_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.saved_seconds += entry[1]
+                return entry
+        if self.disk_dir is not None:
+            try:
+                with open(self._disk_path(key), "rb") as f:
+                    entry = pickle.load(f)
+                with self._lock:
+                    self._remember(key, entry)
+                    self.disk_hits += 1
+                    self.saved_seconds += entry[1]
+                return entry
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                log.warning(f"[grammar_cache] entrée {key[:8]} illisible: {e}")
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, result, duration):
+        entry = (result, duration)
+        with self._lock:
+            self._remember(key, entry)
+        if self.disk_dir is None:
+            return
+        try:
+            path = self._disk_path(key)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(path)
+            self._prune_disk()
+        except Exception as e:
+            log.warning(f"[grammar_cache] entrée non enregistrée: {e}")
+
+    def _prune_disk(self):
+        files = sorted(self.disk_dir.glob("*.bin"), key=lambda p: p.stat().st_mtime)
+        for path in files[: max(len(files) - self.disk_entries, 0)]:
+            path.unlink(missing_ok=True)
+
+    def compile(self, compiler, grammar, compile_function):
+        """Résultat de compile_function(compiler, grammar), depuis le cache si possible."""
+        try:
+            key = grammar_key(grammar, self.version)
+        except Exception as e:
+            log.warning(f"[grammar_cache] clé impossible pour {grammar.name}: {e}")
+            return compile_function(compiler, grammar)
+        entry = self.get(key)
+        if entry is not None:
+            log.debug(f"[grammar_cache] {grammar.name}: compilation évitée")
+            return _copy(entry[0])
+        start = time.perf_counter()
+        result = compile_function(compiler, grammar)
+        self.put(key, result, time.perf_counter() - start)
+        return _copy(result)
+
+    def clear(self, disk=True):
+        with self._lock:
+            self._entries.clear()
+        if disk and self.disk_dir is not None:
+            for path in self.disk_dir.glob("*.bin"):
+                path.unlink(missing_ok=True)
+
+    def get_stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            stats = {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "saved_ms": self.saved_seconds * 1000,
+            }
+        if self.disk_dir is not None:
+            stats["disk_entries"] = sum(1 for _ in self.disk_dir.glob("*.bin"))
+        return stats
+
+    def status_text(self):
+        """Résumé pour le statut du tray."""
+        stats = self.get_stats()
+        return (
+            f"Compiled grammar cache: {stats['hit_rate']:.0%} hit rate "
+            f"({stats['hits']} memory + {stats['disk_hits']} disk hits, {stats['misses']} misses, "
+            f"{stats['saved_ms']:.0f} ms saved)"
+        )
+
+
+_CACHE = None
+
+
+def get_grammar_cache():
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = CompiledGrammarCache()
+    return _CACHE
+
+
+_INSTALLED = False
+
+
+def install_compile_cache():
+    """Fait passer NatlinkCompiler.compile_grammar par le cache (une seule fois)."""
+    global _INSTALLED
+    if _INSTALLED:
+        return
+    try:
+        from dragonfly.engines.backend_natlink.compiler import NatlinkCompiler
+    except ImportError:
+        return
+    _INSTALLED = True
+    cache = get_grammar_cache()
+    original_compile = NatlinkCompiler.compile_grammar
+
+    def compile_grammar(self, grammar):
+        return cache.compile(self, grammar, original_compile)
+
+    NatlinkCompiler.compile_grammar = compile_grammar
+    log.info("[grammar_cache] compilation des grammaires mise en cache")
+
+
+def main():
+    """Point d'entrée CLI"""
+    command = sys.argv[1] if len(sys.argv) > 1 else "stats"
+    cache = get_grammar_cache()
+    if command == "clear":
+        cache.clear()
+        print("Cache des grammaires compilées vidé")
+    elif command == "stats":
+        for name, value in cache.get_stats().items():
+            print(f"{name}: {value}")
+    else:
+        print(__doc__.strip().split("Usage:")[1].strip())
+
+
+if __name__ == "__main__":
+    main()
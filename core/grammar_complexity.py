@@ -0,0 +1,559 @@
+"""
+Analyse de complexité des grammaires et budgets par grammaire
+Chaque règle est compilée comme le fait dragonfly (syntaxe des specs :
+mots, <extra>, [optionnel], (a | b)) pour compter ses expansions, ses
+emplacements de dictée et estimer la taille de la grammaire compilée
+(taille exacte via NatlinkCompiler quand dragonfly est installé).
+Les règles qui dépassent un budget sont signalées et les specs quasi
+identiques (même action) sont regroupées en une forme optionnelle /
+alternative proposée.
+
+Deux sources :
+  - statique (défaut, sans Dragon, utilisable en CI) : sources des addons
+    lues avec core.command_catalog.extract_commands
+  - --live : grammaires dragonfly des modules chargés (LOADED)
+
+Usage:
+    python -m core.grammar_complexity [--live] [--json] [--budget nom=valeur ...] [fichiers...]
+Code de sortie 1 si un budget est dépassé.
+"""
+
+import json
+import re
+import sys
+import unicodedata
+from difflib import SequenceMatcher
+from pathlib import Path
+
+from .app_paths import get_data_dir
+from .logHandler import log
+
+# Budgets par défaut (surchargés par config/grammar_budgets.json puis --budget)
+BUDGETS = {
+    "rule_specs": 40,  # specs d'une MappingRule
+    "rule_expansions": 5000,  # phrases distinctes reconnues par une règle
+    "rule_dictation_slots": 8,  # specs contenant une dictée libre
+    "grammar_active_rules": 20,  # règles exportées d'une grammaire
+    "grammar_compiled_bytes": 64 * 1024,  # taille de la grammaire compilée
+}
+
+# Une suggestion peut générer au plus ce facteur de phrases en plus des specs fusionnées
+SUGGEST_MAX_RATIO = 3
+
+
+def load_budgets(overrides=None):
+    budgets = dict(BUDGETS)
+    path = get_data_dir("config") / "grammar_budgets.json"
+    if path.exists():
+        try:
+            budgets.update(json.loads(path.read_text(encoding="utf-8")))
+        except Exception as e:
+            log.warning(f"[grammar_complexity] {path.name} illisible: {e}")
+    budgets.update(overrides or {})
+    return budgets
+
+
+# -----------------------------
+# Specs dragonfly
+# -----------------------------
+class Extra:
+    """Description d'un extra : type et nombre de valeurs possibles."""
+
+    __slots__ = ("name", "kind", "count")
+
+    def __init__(self, name, kind, count=1):
+        self.name = name
+        self.kind = kind
+        self.count = count
+
+    @property
+    def dictation(self):
+        return self.kind == "Dictation"
+
+
+def parse_extra(description, name="?"):
+    """Extra depuis "IntegerRef(1-21)", "Dictation", "ListRef"... (format du catalogue)."""
+    match = re.match(r"(\w+)(?:\((\d+)-(\d+)\))?", description)
+    kind = match.group(1) if match else description
+    count = 1
+    if match and match.group(2):
+        count = max(int(match.group(3)) - int(match.group(2)), 1)
+    return Extra(name, kind, count)
+
+
+_SPEC_TOKEN_RE = re.compile(r"\s*(<\w+>|[\[\]()|]|[^\s\[\]()|<>]+)")
+
+
+class SpecError(ValueError):
+    pass
+
+
+def parse_spec(spec):
+    """
+    Arbre d'une spec : ("seq", [..]), ("alt", [..]), ("opt", noeud),
+    ("word", mot), ("ref", nom).
+    """
+    tokens = [t for t in _SPEC_TOKEN_RE.findall(spec) if t.strip()]
+    pos = 0
+
+    def alternatives(closing):
+        nonlocal pos
+        options = [sequence(closing)]
+        while pos < len(tokens) and tokens[pos] == "|":
+            pos += 1
+            options.append(sequence(closing))
+        return options[0] if len(options) == 1 else ("alt", options)
+
+    def sequence(closing):
+        nonlocal pos
+        items = []
+        while pos < len(tokens) and tokens[pos] not in ("|", closing):
+            token = tokens[pos]
+            pos += 1
+            if token in ("(", "["):
+                end = ")" if token == "(" else "]"
+                inner = alternatives(end)
+                if pos >= len(tokens) or tokens[pos] != end:
+                    raise SpecError(f"'{end}' manquant dans {spec!r}")
+                pos += 1
+                items.append(inner if token == "(" else ("opt", inner))
+            elif token in (")", "]"):
+                raise SpecError(f"'{token}' inattendu dans {spec!r}")
+            elif token.startswith("<"):
+                items.append(("ref", token[1:-1]))
+            else:
+                items.append(("word", token))
+        return ("seq", items)
+
+    tree = alternatives(None)
+    if pos != len(tokens):
+        raise SpecError(f"'{tokens[pos]}' inattendu dans {spec!r}")
+    return tree
+
+
+def count_expansions(node, extras):
+    kind = node[0]
+    if kind == "seq":
+        total = 1
+        for child in node[1]:
+            total *= count_expansions(child, extras)
+        return total
+    if kind == "alt":
+        return sum(count_expansions(child, extras) for child in node[1])
+    if kind == "opt":
+        return 1 + count_expansions(node[1], extras)
+    if kind == "ref":
+        extra = extras.get(node[1])
+        return extra.count if extra else 1
+    return 1
+
+
+def iter_nodes(node):
+    yield node
+    kind = node[0]
+    if kind in ("seq", "alt"):
+        for child in node[1]:
+            yield from iter_nodes(child)
+    elif kind == "opt":
+        yield from iter_nodes(node[1])
+
+
+def _pad4(n):
+    return (n + 3) & ~3
+
+
+def estimate_compiled_size(rules):
+    """
+    Taille approchée du binaire natlink : en-tête, table des mots (id, taille,
+    texte aligné sur 4 octets), table des règles, et 12 octets par élément
+    (début/fin pour chaque séquence, alternative ou optionnel).
+    """
+    words = set()
+    size = 16
+    for rule in rules:
+        size += 8 + _pad4(len(rule.name.encode("utf-8")) + 1)
+        elements = 0
+        for tree in rule.trees:
+            for node in iter_nodes(tree):
+                if node[0] == "word":
+                    words.add(node[1])
+                    elements += 1
+                elif node[0] == "ref":
+                    elements += 1
+                else:
+                    elements += 2
+        size += 12 * (elements + 2 * max(len(rule.trees) - 1, 0))
+    size += sum(8 + _pad4(len(w.encode("utf-8")) + 1) for w in words)
+    return size
+
+
+# -----------------------------
+# Suggestions de regroupement
+# -----------------------------
+def fold_accents(text):
+    return "".join(
+        c for c in unicodedata.normalize("NFD", text) if unicodedata.category(c) != "Mn"
+    ).lower()
+
+
+class _Pattern:
+    """Spec en construction : unités fixes (mot) ou emplacements {alternatives}."""
+
+    def __init__(self, words):
+        self.units = [w for w in words]
+
+    def expansions(self):
+        total = 1
+        for unit in self.units:
+            if isinstance(unit, list):
+                total *= len(unit)
+        return total
+
+    def _key(self, unit):
+        return unit if isinstance(unit, str) else id(unit)
+
+    @staticmethod
+    def _match(units, words):
+        """`words` est-elle une des phrases produites par `units` ?"""
+        if not units:
+            return not words
+        unit, rest = units[0], units[1:]
+        if isinstance(unit, str):
+            return bool(words) and words[0] == unit and _Pattern._match(rest, words[1:])
+        return any(
+            tuple(words[: len(a)]) == a and _Pattern._match(rest, words[len(a) :]) for a in unit
+        )
+
+    def merged(self, words):
+        """Nouveau motif couvrant aussi `words`, ou None si l'alignement est ambigu."""
+        if self._match(self.units, list(words)):
+            return self
+        keys = [self._key(u) for u in self.units]
+        units = []
+        for op, i1, i2, j1, j2 in SequenceMatcher(None, keys, words, autojunk=False).get_opcodes():
+            part = tuple(words[j1:j2])
+            if op == "equal":
+                units.extend(self.units[i1:i2])
+            elif op == "insert":
+                units.append([part, ()])
+            elif i2 - i1 == 1 and isinstance(self.units[i1], list):
+                slot = list(self.units[i1])
+                if op == "delete":
+                    part = ()
+                if part not in slot:
+                    # "sélectionner le mot" contre (sélectionner | ...) : garder
+                    # l'emplacement et ajouter la fin en optionnel
+                    prefix = next((a for a in slot if a and part[: len(a)] == a), None)
+                    if prefix is not None and len(part) > len(prefix):
+                        units.extend([slot, [part[len(prefix) :], ()]])
+                        continue
+                    slot.append(part)
+                units.append(slot)
+            elif any(isinstance(u, list) for u in self.units[i1:i2]):
+                if self._match(self.units[i1:i2], part):
+                    units.extend(self.units[i1:i2])  # déjà couvert par ces emplacements
+                else:
+                    return None
+            else:
+                units.append([tuple(self.units[i1:i2]), () if op == "delete" else part])
+        pattern = _Pattern([])
+        pattern.units = units
+        return pattern
+
+    def render(self):
+        out = []
+        for unit in self.units:
+            if isinstance(unit, str):
+                out.append(unit)
+                continue
+            options = [" ".join(a) for a in unit if a]
+            body = options[0] if len(options) == 1 else "(" + " | ".join(options) + ")"
+            out.append(f"[{body}]" if () in unit else body)
+        return " ".join(out)
+
+
+def suggest_collapses(specs):
+    """
+    specs: [(spec, action)] d'une règle. Retourne [(specs fusionnées, spec proposée, phrases)].
+    Seules les specs simples (mots et <extras>) de même action et mêmes extras sont fusionnées.
+    """
+    groups = {}
+    for spec, action in specs:
+        if re.search(r"[\[\]()|]", spec):
+            continue
+        refs = tuple(sorted(re.findall(r"<\w+>", spec)))
+        groups.setdefault((action, refs), []).append(spec)
+
+    suggestions = []
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        clusters = []  # [(pattern, [specs])]
+        for spec in members:
+            words = spec.split()
+            for i, (pattern, merged) in enumerate(clusters):
+                candidate = pattern.merged(words)
+                if candidate is not None and candidate.expansions() <= SUGGEST_MAX_RATIO * (len(merged) + 1):
+                    clusters[i] = (candidate, merged + [spec])
+                    break
+            else:
+                clusters.append((_Pattern(words), [spec]))
+        for pattern, merged in clusters:
+            if len(merged) > 1:
+                suggestions.append((merged, pattern.render(), pattern.expansions()))
+    return suggestions
+
+
+def accent_duplicates(specs):
+    """Specs identiques une fois les accents retirés (Dragon les prononce pareil)."""
+    seen = {}
+    for spec, _ in specs:
+        seen.setdefault(fold_accents(spec), []).append(spec)
+    return [group for group in seen.values() if len(group) > 1]
+
+
+# -----------------------------
+# Rapports
+# -----------------------------
+class RuleReport:
+    def __init__(self, name, specs, extras, exported=True):
+        self.name = name
+        self.specs = specs  # [(spec, action)]
+        self.extras = extras  # {nom: Extra}
+        self.exported = exported
+        self.trees = []
+        self.errors = []
+        for spec, _ in specs:
+            try:
+                self.trees.append(parse_spec(spec))
+            except SpecError as e:
+                self.errors.append(str(e))
+        self.expansions = sum(count_expansions(t, extras) for t in self.trees)
+        self.dictation_slots = sum(
+            1
+            for t in self.trees
+            if any(n[0] == "ref" and extras.get(n[1]) and extras[n[1]].dictation for n in iter_nodes(t))
+        )
+        self.violations = []
+        self.suggestions = suggest_collapses(specs)
+        self.duplicates = accent_duplicates(specs)
+
+    def check(self, budgets):
+        self.violations = []
+        for key, value in (
+            ("rule_specs", len(self.specs)),
+            ("rule_expansions", self.expansions),
+            ("rule_dictation_slots", self.dictation_slots),
+        ):
+            if value > budgets[key]:
+                self.violations.append(f"{key}: {value} > {budgets[key]}")
+        return self.violations
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "specs": len(self.specs),
+            "expansions": self.expansions,
+            "dictation_slots": self.dictation_slots,
+            "violations": self.violations,
+            "errors": self.errors,
+            "accent_duplicates": self.duplicates,
+            "suggestions": [
+                {"specs": merged, "spec": spec, "phrases": phrases}
+                for merged, spec, phrases in self.suggestions
+            ],
+        }
+
+
+class GrammarReport:
+    def __init__(self, name, source, rules, compiled_size=None):
+        self.name = name
+        self.source = source
+        self.rules = rules
+        self.compiled_exact = compiled_size is not None
+        self.compiled_size = compiled_size if compiled_size is not None else estimate_compiled_size(rules)
+        self.violations = []
+
+    @property
+    def active_rules(self):
+        return sum(1 for r in self.rules if r.exported)
+
+    def check(self, budgets):
+        self.violations = []
+        if self.active_rules > budgets["grammar_active_rules"]:
+            self.violations.append(
+                f"grammar_active_rules: {self.active_rules} > {budgets['grammar_active_rules']}"
+            )
+        if self.compiled_size > budgets["grammar_compiled_bytes"]:
+            self.violations.append(
+                f"grammar_compiled_bytes: {self.compiled_size} > {budgets['grammar_compiled_bytes']}"
+            )
+        rule_violations = [v for r in self.rules for v in r.check(budgets)]
+        return self.violations + rule_violations
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "source": self.source,
+            "active_rules": self.active_rules,
+            "compiled_size": self.compiled_size,
+            "compiled_exact": self.compiled_exact,
+            "violations": self.violations,
+            "rules": [r.to_dict() for r in self.rules],
+        }
+
+
+def analyze_sources(files=None):
+    """Rapports depuis les sources (sans Dragon) : une grammaire par fichier."""
+    from .command_catalog import extract_commands
+
+    if files is None:
+        from .grammar_loader import collect_grammar_files
+
+        files = collect_grammar_files()
+    reports = []
+    for file in files:
+        file = Path(file)
+        try:
+            entries = extract_commands(file.read_text(encoding="utf-8"), str(file))
+        except (SyntaxError, UnicodeDecodeError) as e:
+            log.warning(f"[grammar_complexity] {file.name} non analysable: {e}")
+            continue
+        rules = {}
+        for entry in entries:
+            if entry.kind not in ("mapping", "compound", "gramspec"):
+                continue
+            specs, extras = rules.setdefault(entry.rule, ([], {}))
+            specs.append((entry.spec, entry.action))
+            for item in filter(None, entry.extras.split(", ")):
+                name, _, description = item.partition(":")
+                extras[name] = parse_extra(description, name)
+        if rules:
+            reports.append(
+                GrammarReport(
+                    file.stem,
+                    str(file),
+                    [RuleReport(name, specs, extras) for name, (specs, extras) in rules.items()],
+                )
+            )
+    return reports
+
+
+def _live_extra(name, element):
+    kind = type(element).__name__
+    count = 1
+    if kind == "IntegerRef":
+        low, high = getattr(element, "_min", None), getattr(element, "_max", None)
+        if low is None:  # l'élément Integer est l'enfant de la référence
+            child = (getattr(element, "children", None) or [None])[0]
+            low, high = getattr(child, "_min", None), getattr(child, "_max", None)
+        if low is not None and high is not None:
+            count = max(high - low, 1)
+    elif kind == "Choice":
+        count = max(len(getattr(element, "_choices", {}) or {}), 1)
+    return Extra(name, kind, count)
+
+
+def _compiled_size(grammar):
+    try:
+        from dragonfly.engines.backend_natlink.compiler import NatlinkCompiler
+
+        compiled = NatlinkCompiler().compile_grammar(grammar)
+        if isinstance(compiled, tuple):
+            compiled = compiled[0]
+        return len(compiled)
+    except Exception:
+        return None
+
+
+def analyze_loaded():
+    """Rapports des grammaires dragonfly des modules chargés (compilation réelle si possible)."""
+    from dragonfly import Grammar
+
+    from .grammar_loader import LOADED
+
+    reports = []
+    for module_name, module in list(LOADED.items()):
+        for attr in list(vars(module).values()):
+            if not isinstance(attr, Grammar):
+                continue
+            rules = []
+            for rule in attr.rules:
+                mapping = getattr(rule, "_mapping", None)
+                if mapping is None:
+                    continue
+                extras = {
+                    name: _live_extra(name, element)
+                    for name, element in (getattr(rule, "_extras", None) or {}).items()
+                }
+                specs = [(spec, repr(action)) for spec, action in mapping.items()]
+                rules.append(
+                    RuleReport(
+                        rule.name,
+                        specs,
+                        extras,
+                        exported=getattr(rule, "exported", True) and getattr(rule, "enabled", True),
+                    )
+                )
+            reports.append(
+                GrammarReport(attr.name, module_name, rules, compiled_size=_compiled_size(attr))
+            )
+    return reports
+
+
+def format_report(report):
+    exact = "" if report.compiled_exact else "~"
+    lines = [
+        f"{report.name} ({report.source})",
+        f"  règles actives: {report.active_rules}, taille compilée: {exact}{report.compiled_size} octets",
+    ]
+    lines += [f"  ⚠️ {v}" for v in report.violations]
+    for rule in report.rules:
+        lines.append(
+            f"  - {rule.name}: {len(rule.specs)} spec(s), {rule.expansions} expansion(s), "
+            f"{rule.dictation_slots} dictée(s)"
+        )
+        lines += [f"      ⚠️ {v}" for v in rule.violations]
+        lines += [f"      ❌ {e}" for e in rule.errors]
+        for group in rule.duplicates:
+            lines.append(f"      doublon sans accents: {' / '.join(group)}")
+        for merged, spec, phrases in rule.suggestions:
+            lines.append(f"      {len(merged)} specs -> \"{spec}\" ({phrases} phrase(s))")
+    return "\n".join(lines)
+
+
+def main():
+    """Point d'entrée CLI"""
+    args = sys.argv[1:]
+    if args and args[0] in ("-h", "--help"):
+        print(__doc__.strip().split("Usage:")[1].strip())
+        return 0
+
+    overrides = {}
+    while "--budget" in args:
+        i = args.index("--budget")
+        name, _, value = args[i + 1].partition("=")
+        if name not in BUDGETS:
+            print(f"Budget inconnu: {name} ({', '.join(BUDGETS)})")
+            return 2
+        overrides[name] = int(value)
+        del args[i : i + 2]
+    as_json = "--json" in args
+    live = "--live" in args
+    args = [a for a in args if a not in ("--json", "--live")]
+
+    budgets = load_budgets(overrides)
+    reports = analyze_loaded() if live else analyze_sources(args or None)
+    violations = [v for report in reports for v in report.check(budgets)]
+
+    if as_json:
+        print(json.dumps([r.to_dict() for r in reports], ensure_ascii=False, indent=2))
+    else:
+        for report in reports:
+            print(format_report(report))
+        print(f"{len(reports)} grammaire(s), {len(violations)} dépassement(s) de budget")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
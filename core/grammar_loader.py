@@ -1,6 +1,15 @@
+import gc
 import os
 import sys
+import importlib
 import importlib.util
+import re
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import ExitStack
+from functools import partial, wraps
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -10,11 +19,59 @@ from .logHandler import log
 
 ADDON_DIR = Path(__file__).parent.parent / "addons"
 LOADED = {}
+# nom -> (modules ajoutés à sys.modules, entrées ajoutées à sys.path) au chargement
+LOADED_STATE = {}
+# nom -> coût du chargement : import_ms, alloc_bytes, grammars, rules
+LOADED_INFO = {}
+# nom -> (mtime du fichier, octets alloués) du dernier import suivi par
+# tracemalloc ; gardé au déchargement pour les imports suivants non suivis
+ALLOC_BYTES = {}
 
+GRAMSPEC_RULE_RE = re.compile(r"<\w+>\s*(?:exported\s*)?=")
 
-def load_grammars():
-    """Load all grammars from addons folder only."""
-    LOADED.clear()
+# Une grammaire à la fois : chaque import / déchargement (et les parcours de
+# LOADED qui appellent le moteur : mic_monitor, hibernation) le prend, et le
+# rend entre deux grammaires pour ne jamais bloquer longtemps le thread wx.
+# Réentrant (reload individuel -> unload + load).
+LOADER_LOCK = threading.RLock()
+
+
+def _locked(function):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with LOADER_LOCK:
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+def _report(progress_callback, done, total, name, ok):
+    """Appelle progress_callback(done, total, name, ok) ; ok=None : en cours."""
+    if progress_callback is None:
+        return
+    try:
+        progress_callback(done, total, name, ok)
+    except Exception as e:
+        log.warning(f"Erreur du callback de progression: {e}")
+
+
+def begin_load():
+    """Hooks (watchdog, cache de compilation) et vérification de Dragon ; False : chargement refusé."""
+    # Chronométrage des actions et callbacks (une seule fois)
+    try:
+        from .watchdog import install_hooks
+
+        install_hooks()
+    except Exception as e:
+        log.warning(f"Watchdog non installé: {e}")
+
+    # Grammaires inchangées rechargées sans recompilation
+    try:
+        from .grammar_cache import install_compile_cache
+
+        install_compile_cache()
+    except Exception as e:
+        log.warning(f"Cache de compilation non installé: {e}")
 
     # Vérifier Dragon avant le chargement des grammaires
     try:
@@ -28,15 +85,73 @@ def load_grammars():
                     "❌ Impossible de charger les grammaires - Dragon NaturallySpeaking requis"
                 )
                 log.error(message)
-                return
+                return False
             log.info("✅ Dragon vérifié - chargement des grammaires autorisé")
     except ImportError:
         # Si les modules de vérification ne sont pas disponibles, continuer
         log.warning(
             "Modules de vérification Dragon non disponibles - chargement normal"
         )
+    return True
+
+
+def load_grammars(progress_callback=None, cancel_event=None):
+    """
+    Load all grammars from addons folder only (celles déjà chargées sont gardées).
+
+    Args:
+        progress_callback: appelé avec (done, total, name, ok) avant (ok=None)
+            et après chaque grammaire
+        cancel_event: threading.Event ; s'il est levé, le chargement
+            s'arrête avant la grammaire suivante
+    """
+    if not begin_load():
+        return
 
     # Collect all grammar files from addons only
+    plan = load_plan()
+
+    # Load grammars with progress updates
+    total_files = len(plan)
+    for i, (file, code) in enumerate(plan):
+        if cancel_event is not None and cancel_event.is_set():
+            log.info(f"Chargement annulé après {i}/{total_files} grammaire(s)")
+            return
+        _report(progress_callback, i, total_files, file.stem, None)
+        ok = load_prepared(file, code)
+        _report(progress_callback, i + 1, total_files, file.stem, ok)
+
+
+def read_grammar(file):
+    """Source d'une grammaire lue et compilée (sans le moteur) ; l'exception en cas d'échec."""
+    try:
+        return compile(file.read_bytes(), str(file), "exec", dont_inherit=True)
+    except (OSError, SyntaxError, ValueError) as e:
+        return e
+
+
+def load_plan(names=None):
+    """
+    [(fichier, code)] des grammaires à charger (toutes, ou celles de `names`).
+    Découverte et lecture seulement : utilisable hors du thread wx.
+    """
+    if names is None:
+        files = collect_grammar_files()
+    else:
+        files = [find_grammar_file(name) or Path(f"{name}.py") for name in names]
+    return [(file, read_grammar(file)) for file in files]
+
+
+@_locked
+def load_prepared(file, code=None):
+    """Importe une grammaire préparée par load_plan() ; True si elle est chargée."""
+    if file.stem in LOADED:
+        return True
+    return _load_grammar_file(file, code)
+
+
+def collect_grammar_files():
+    """Grammar files of every addon folder (with addon.json)."""
     grammar_files = []
 
     # From addons/ folder only
@@ -49,41 +164,197 @@ def load_grammars():
                         if not file.name.startswith("__"):
                             grammar_files.append(file)
 
-    # Load grammars with progress updates
-    total_files = len(grammar_files)
-    if total_files == 0:
-        return
+    return grammar_files
+
+
+def grammars_of(module):
+    """(objet, "dragonfly" | "natlink") des grammaires définies par un module."""
+    kinds = []
+    try:
+        from dragonfly import Grammar
+
+        kinds.append((Grammar, "dragonfly"))
+    except ImportError:
+        pass
+    try:
+        try:
+            from natlinkcore.natlinkutils import GrammarBase
+        except ImportError:
+            from natlinkutils import GrammarBase
+
+        kinds.append((GrammarBase, "natlink"))
+    except ImportError:
+        pass
+    for value in list(vars(module).values()):
+        for cls, kind in kinds:
+            if isinstance(value, cls):
+                yield value, kind
+                break
+
+
+def _rule_count(grammar, kind):
+    if kind == "dragonfly":
+        return len(grammar.rules)
+    spec = getattr(grammar, "gramSpec", "")
+    if isinstance(spec, (list, tuple)):
+        spec = "\n".join(spec)
+    return len(GRAMSPEC_RULE_RE.findall(spec or ""))
+
+
+def _load_info(module, file, elapsed, allocated):
+    grammars = list(grammars_of(module))
+    return {
+        "addon": file.parent.name,
+        "import_ms": elapsed * 1000,
+        "alloc_bytes": allocated,
+        "grammars": len(grammars),
+        "rules": sum(_rule_count(grammar, kind) for grammar, kind in grammars),
+    }
+
+
+def _import_state(file, modules_before, path_before):
+    """Modules de l'addon et entrées de sys.path apparus pendant l'import de `file`."""
+    folder = file.parent.resolve()
+    modules = [file.stem]
+    for name in set(sys.modules) - modules_before:
+        module_file = getattr(sys.modules.get(name), "__file__", None)
+        if name != file.stem and module_file and folder in Path(module_file).resolve().parents:
+            modules.append(name)
+    paths = list((Counter(sys.path) - Counter(path_before)).elements())
+    return modules, paths
+
+
+def _purge(state):
+    """Retire les modules d'un addon de sys.modules et rend à sys.path ses entrées."""
+    modules, paths = state
+    for name in modules:
+        sys.modules.pop(name, None)
+    for entry in paths:
+        try:
+            sys.path.remove(entry)  # première occurrence = celle insérée en tête
+        except ValueError:
+            pass
+        if entry not in sys.path:
+            sys.path_importer_cache.pop(entry, None)
+    importlib.invalidate_caches()
+
+
+def _owned_by(module):
+    """Prédicat : objet défini par l'addon de `module` (valeur du module ou code de son dossier)."""
+    values = {id(value) for value in vars(module).values()}
+    module_file = getattr(module, "__file__", None)
+    folder = Path(module_file).resolve().parent if module_file else None
+
+    def owned(obj):
+        if id(obj) in values:
+            return True
+        code = getattr(getattr(obj, "__func__", obj), "__code__", None)
+        return folder is not None and code is not None and folder in Path(code.co_filename).resolve().parents
 
-    for i, file in enumerate(grammar_files):
-        _load_grammar_file(file)
+    return owned
 
 
-def _load_grammar_file(file):
-    """Load a single grammar file."""
+def _release_registrations(grammar_name, module):
+    """Retire des services partagés ce que l'addon y a enregistré sans teardown()."""
+    owned = _owned_by(module)
+    removed = 0
+    try:
+        from .context_tracker import get_context_tracker
+
+        removed += get_context_tracker().forget(owned)
+    except Exception as e:
+        log.warning(f"Erreur nettoyage du suivi de contexte pour {grammar_name}: {e}")
+    try:
+        from .watchdog import get_watchdog
+
+        listeners = get_watchdog().listeners
+        kept = [listener for listener in listeners if not owned(listener)]
+        removed += len(listeners) - len(kept)
+        listeners[:] = kept
+    except Exception as e:
+        log.warning(f"Erreur nettoyage des listeners watchdog pour {grammar_name}: {e}")
+    if removed:
+        log.info(f"{removed} enregistrement(s) de {grammar_name} retiré(s) des services partagés")
+    return removed
+
+
+def _load_grammar_file(file, code=None):
+    """Load a single grammar file (code : source déjà compilée) ; retourne True si le module est chargé."""
+    if isinstance(code, Exception):
+        log.error(f"Error loading {file.stem}: {code}")
+        return False
+    modules_before = set(sys.modules)
+    path_before = list(sys.path)
+    # Premier import d'un fichier (démarrage) : tracemalloc démarré ici s'il ne
+    # tourne pas, et arrêté ensuite dans ce cas seulement ; son temps inclut le
+    # suivi. Les imports suivants du même fichier sont chronométrés sans suivi
+    # et reprennent la mesure (sauf si reload_memory ou -X tracemalloc tournent).
+    mtime = file.stat().st_mtime_ns if file.exists() else None
+    measured = file.stem in ALLOC_BYTES and ALLOC_BYTES[file.stem][0] == mtime
+    started = not tracemalloc.is_tracing() and not measured
+    if started:
+        tracemalloc.start()
+    tracing = tracemalloc.is_tracing()
+    memory_before = tracemalloc.get_traced_memory()[0] if tracing else 0
+    start = time.perf_counter()
     try:
         spec = importlib.util.spec_from_file_location(file.stem, file)
         module = importlib.util.module_from_spec(spec)
         sys.modules[file.stem] = module
-        spec.loader.exec_module(module)
+        if code is not None:
+            exec(code, module.__dict__)
+        else:
+            spec.loader.exec_module(module)
+        elapsed = time.perf_counter() - start
+        if tracing:
+            ALLOC_BYTES[file.stem] = (mtime, tracemalloc.get_traced_memory()[0] - memory_before)
+        allocated = ALLOC_BYTES[file.stem][1]
         LOADED[file.stem] = module
-        log.info(f"Loaded grammar: {file.stem} ({file.parent.name})")
+        LOADED_STATE[file.stem] = _import_state(file, modules_before, path_before)
+        info = LOADED_INFO[file.stem] = _load_info(module, file, elapsed, allocated)
+        log.info(
+            f"Loaded grammar: {file.stem} ({file.parent.name}) - {info['import_ms']:.0f} ms, "
+            f"{allocated / 1024:.0f} Ko, "
+            f"{info['grammars']} grammaire(s), {info['rules']} règle(s)"
+        )
+        return True
     except Exception as e:
         log.error(f"Error loading {file.stem}: {e}")
+        _purge(_import_state(file, modules_before, path_before))
+        return False
+    finally:
+        if started:
+            tracemalloc.stop()
 
 
-def unload_grammars():
+def unload_grammars(progress_callback=None, cancel_event=None):
     """Unload all grammars with forced Dragonfly cleanup."""
     log.info("🔄 Déchargement complet de toutes les grammaires...")
 
-    for name, mod in list(LOADED.items()):
+    names = list(LOADED)
+    for i, name in enumerate(names):
+        if cancel_event is not None and cancel_event.is_set():
+            log.info(f"Déchargement annulé après {i}/{len(names)} grammaire(s)")
+            return
+        _report(progress_callback, i, len(names), name, None)
         try:
             # Force unload individual grammar using improved method
-            unload_individual_grammar(name)
+            ok = unload_individual_grammar(name, collect=False)
         except Exception as e:
             log.error(f"Error unloading {name}: {e}")
+            ok = False
+        _report(progress_callback, i + 1, len(names), name, ok)
+    finish_unload()
+
 
-    # Clear the loaded dictionary
+@_locked
+def finish_unload():
+    """Fin d'un déchargement complet : restes de LOADED purgés, ramasse-miettes."""
+    for name in list(LOADED):
+        _purge(LOADED_STATE.pop(name, ([name], [])))
+        LOADED_INFO.pop(name, None)
     LOADED.clear()
+    gc.collect()
     log.info("✅ Toutes les grammaires déchargées")
 
 
@@ -108,9 +379,67 @@ def force_unload_all():
     log.info("🛑 DÉCHARGEMENT D'URGENCE TERMINÉ")
 
 
-def reload_grammars():
-    unload_grammars()
-    load_grammars()
+def reload_grammars(progress_callback=None, cancel_event=None):
+    from .reload_memory import get_reload_tracker
+
+    with get_reload_tracker().measure("reload"):
+        unload_grammars(progress_callback, cancel_event)
+        if cancel_event is not None and cancel_event.is_set():
+            return
+        load_grammars(progress_callback, cancel_event)
+
+
+# -----------------------------
+# Opérations pas à pas (onglet Grammaires)
+# -----------------------------
+# Les fonctions *_steps sont appelées hors du thread wx : elles ne font que
+# découvrir et lire les fichiers. Elles retournent (étapes, fin) : chaque
+# étape (nom de grammaire ou None, fonction) s'exécute sur le thread wx, une
+# par tour de boucle ; une étape sans nom qui retourne False arrête
+# l'opération. `fin` (ou None) est appelée en dernier, même après annulation.
+def _load_steps(plan):
+    return [(None, begin_load)] + [(file.stem, partial(load_prepared, file, code)) for file, code in plan]
+
+
+def _unload_steps(names):
+    if names is None:
+        steps = [(name, partial(unload_individual_grammar, name, collect=False)) for name in list(LOADED)]
+        return steps + [(None, finish_unload)]
+    return [(name, partial(unload_individual_grammar, name)) for name in names if name in LOADED]
+
+
+def load_steps(names=None):
+    """Chargement (toutes les grammaires ou `names`) découpé en étapes."""
+    return _load_steps(load_plan(names)), None
+
+
+def unload_steps(names=None):
+    """Déchargement (toutes les grammaires ou `names`) découpé en étapes."""
+    return _unload_steps(names), None
+
+
+def reload_steps(names=None):
+    """Rechargement découpé en étapes, mesuré par reload_memory comme reload_grammars()."""
+    from .reload_memory import get_reload_tracker
+
+    plan = load_plan(names)  # fichiers lus avant le déchargement
+    stack = ExitStack()
+    label = "reload" if names is None else f"reload {', '.join(names)}"
+
+    def begin():
+        stack.enter_context(get_reload_tracker().measure(label))
+
+    return [(None, begin)] + _unload_steps(names) + _load_steps(plan), stack.close
+
+
+def load_info_text(limit=None):
+    """Lignes "nom : import, mémoire, grammaires, règles", les plus lentes d'abord."""
+    rows = sorted(LOADED_INFO.items(), key=lambda item: -item[1]["import_ms"])
+    return [
+        f"{name} ({info['addon']}): {info['import_ms']:.0f} ms, {info['alloc_bytes'] / 1024:.0f} KB, "
+        f"{info['grammars']} grammar(s), {info['rules']} rule(s)"
+        for name, info in rows[:limit]
+    ]
 
 
 def list_grammars():
@@ -148,6 +477,7 @@ def find_grammar_file(grammar_name):
     return None
 
 
+@_locked
 def load_individual_grammar(grammar_name):
     """Load a single grammar by name."""
     try:
@@ -176,8 +506,9 @@ def load_individual_grammar(grammar_name):
         return False
 
 
-def unload_individual_grammar(grammar_name):
-    """Unload a single grammar by name."""
+@_locked
+def unload_individual_grammar(grammar_name, collect=True):
+    """Unload a single grammar by name (module purged; collect: lancer le ramasse-miettes)."""
     try:
         if grammar_name not in LOADED:
             log.warning(f"Grammar '{grammar_name}' is not loaded")
@@ -186,6 +517,16 @@ def unload_individual_grammar(grammar_name):
         # Get the loaded module
         mod = LOADED[grammar_name]
 
+        # Hook de l'addon : retirer ses listeners / liaisons des services partagés
+        teardown = getattr(mod, "teardown", None)
+        if callable(teardown):
+            try:
+                teardown()
+            except Exception as e:
+                log.warning(f"Erreur dans teardown() de {grammar_name}: {e}")
+        # Ce qui reste (addon sans teardown, lambda...) : listeners et liaisons du dossier de l'addon
+        _release_registrations(grammar_name, mod)
+
         # Force unload from Dragonfly/Dragon if the module has grammars
         try:
             # Look for grammar objects in the module
@@ -213,8 +554,30 @@ def unload_individual_grammar(grammar_name):
         except Exception as e:
             log.warning(f"Erreur lors du déchargement forcé de {grammar_name}: {e}")
 
-        # Remove from loaded grammars
+        # Annuler les actions async encore en cours de cet addon
+        try:
+            from .async_runtime import get_async_runtime
+
+            module_file = getattr(mod, "__file__", None)
+            if module_file:
+                get_async_runtime().cancel(Path(module_file).parent.name)
+        except Exception as e:
+            log.warning(f"Erreur annulation des tâches async de {grammar_name}: {e}")
+
+        try:
+            from .hibernation import get_hibernation
+
+            get_hibernation().forget(grammar_name)
+        except Exception:
+            pass
+
+        # Remove from loaded grammars, sys.modules and sys.path
         del LOADED[grammar_name]
+        _purge(LOADED_STATE.pop(grammar_name, ([grammar_name], [])))
+        LOADED_INFO.pop(grammar_name, None)
+        del mod
+        if collect:
+            gc.collect()
         log.info(f"✅ Successfully unloaded individual grammar: {grammar_name}")
         return True
 
@@ -223,15 +586,19 @@ def unload_individual_grammar(grammar_name):
         return False
 
 
+@_locked
 def reload_individual_grammar(grammar_name):
     """Reload a single grammar by name."""
+    from .reload_memory import get_reload_tracker
+
     try:
-        # First unload if loaded
-        if grammar_name in LOADED:
-            unload_individual_grammar(grammar_name)
+        with get_reload_tracker().measure(f"reload {grammar_name}"):
+            # First unload if loaded
+            if grammar_name in LOADED:
+                unload_individual_grammar(grammar_name)
 
-        # Then load again
-        success = load_individual_grammar(grammar_name)
+            # Then load again
+            success = load_individual_grammar(grammar_name)
         if success:
             log.info(f"Successfully reloaded individual grammar: {grammar_name}")
             return True
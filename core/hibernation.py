@@ -0,0 +1,329 @@
+"""
+Mise en veille des grammaires inutilisées
+L'utilisation de chaque addon est suivie par les listeners du watchdog
+(actions dragonfly et gotResults natlink). Un wx.Timer vérifie
+périodiquement les addons dont aucune commande n'a servi depuis
+`idle_minutes` et met leurs grammaires en veille :
+  - mode "unload"  : grammaire déchargée du moteur (Grammar.unload) ;
+    le module reste dans LOADED et la forme compilée dans le cache de
+    core.grammar_cache, le réveil ne recompile rien
+  - mode "disable" : grammaire laissée chargée mais désactivée
+Dans les deux modes, une commande de l'addon en veille n'est plus reconnue
+et ne peut donc pas le réveiller. Le réveil passe par le micro activé, le
+menu du tray, resume() ou la phrase `wake_phrase` (petite grammaire
+chargée par start(), jamais mise en veille) et réactive tout en quelques
+millisecondes. Les règles actives et la mémoire du processus avant / après
+sont journalisées. Désactivé par défaut : à activer en connaissance de cause.
+
+Configuration : config/hibernation.json
+    {"enabled": true, "idle_minutes": 60, "mode": "unload", "exclude": ["addon"],
+     "wake_phrase": "réveille les grammaires"}
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from .app_paths import get_data_dir
+from .grammar_loader import LOADER_LOCK, grammars_of
+from .logHandler import log
+
+DEFAULTS = {
+    "enabled": False,
+    "idle_minutes": 60,
+    "mode": "unload",  # "unload" | "disable"
+    "exclude": [],  # addons jamais mis en veille
+    "wake_phrase": "réveille les grammaires",  # vide : pas de réveil à la voix
+}
+CHECK_INTERVAL = 60  # secondes
+
+
+def load_config():
+    config = dict(DEFAULTS)
+    path = get_data_dir("config") / "hibernation.json"
+    if path.exists():
+        try:
+            config.update(json.loads(path.read_text(encoding="utf-8")))
+        except Exception as e:
+            log.warning(f"[hibernation] {path.name} illisible: {e}")
+    if config["mode"] not in ("unload", "disable"):
+        log.warning(f"[hibernation] mode inconnu '{config['mode']}', 'unload' utilisé")
+        config["mode"] = "unload"
+    return config
+
+
+def _addon_of(module):
+    module_file = getattr(module, "__file__", None)
+    return Path(module_file).parent.name if module_file else getattr(module, "__name__", "?")
+
+
+def _active_rules(grammar, kind):
+    if kind == "natlink":
+        return len(getattr(grammar, "activeRules", None) or ())
+    if not getattr(grammar, "loaded", False) or not getattr(grammar, "enabled", True):
+        return 0
+    active = getattr(grammar, "active_rules", None)
+    if active is not None:
+        return len(active)
+    return sum(1 for rule in grammar.rules if getattr(rule, "exported", False) and getattr(rule, "active", False))
+
+
+def _process_memory_mb():
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+
+class GrammarHibernation:
+    """Suivi d'utilisation par addon, mise en veille et réveil des grammaires."""
+
+    def __init__(self, config=None):
+        self.config = config or load_config()
+        self._last_used = {}  # addon -> time.monotonic() de la dernière commande
+        self._since = time.monotonic()
+        self._hibernated = {}  # nom du module -> (module, [(grammaire, type, était activée)])
+        self._lock = threading.Lock()
+        self._timer = None
+        self._wake_grammar = None
+        self.last_report = None
+
+    # -----------------------------
+    # Suivi d'utilisation
+    # -----------------------------
+    def _on_call(self, addon, rule, duration):
+        # process_begin est appelé pour toutes les grammaires à chaque énoncé
+        if not rule.endswith(".process_begin"):
+            self._last_used[addon] = time.monotonic()
+
+    def touch(self, addon):
+        self._last_used[addon] = time.monotonic()
+
+    def idle_seconds(self, addon, now=None):
+        now = time.monotonic() if now is None else now
+        return now - self._last_used.get(addon, self._since)
+
+    # -----------------------------
+    # Veille / réveil
+    # -----------------------------
+    def snapshot(self):
+        """Grammaires actives, règles actives et mémoire du processus."""
+        from .grammar_loader import LOADED
+
+        grammars = rules = 0
+        for name, module in list(LOADED.items()):
+            if name in self._hibernated:
+                continue
+            for grammar, kind in grammars_of(module):
+                count = _active_rules(grammar, kind)
+                grammars += 1 if count else 0
+                rules += count
+        return {"grammars": grammars, "active_rules": rules, "memory_mb": _process_memory_mb()}
+
+    def _report(self, action, names, before, elapsed):
+        label = {"hibernate": "veille", "resume": "réveil"}[action]
+        after = self.snapshot()
+        self.last_report = {"action": action, "modules": names, "before": before, "after": after, "ms": elapsed * 1000}
+        memory = ""
+        if before["memory_mb"] is not None and after["memory_mb"] is not None:
+            memory = f", mémoire {before['memory_mb']:.1f} -> {after['memory_mb']:.1f} Mo"
+        log.info(
+            f"[hibernation] {label} {len(names)} grammaire(s) en {elapsed * 1000:.1f} ms "
+            f"({', '.join(names)}) : règles actives {before['active_rules']} -> {after['active_rules']}{memory}"
+        )
+
+    def idle_addons(self):
+        from .grammar_loader import LOADED
+
+        now = time.monotonic()
+        limit = self.config["idle_minutes"] * 60
+        addons = set()
+        for name, module in list(LOADED.items()):
+            addon = _addon_of(module)
+            if name in self._hibernated or addon in self.config["exclude"]:
+                continue
+            if self.idle_seconds(addon, now) >= limit:
+                addons.add(addon)
+        return addons
+
+    def hibernate(self, addons):
+        """Met en veille les grammaires des modules chargés des `addons`."""
+        from .grammar_loader import LOADED
+
+        # Verrou du loader d'abord (unload_individual_grammar appelle forget sous ce verrou)
+        with LOADER_LOCK, self._lock:
+            before = self.snapshot()
+            start = time.perf_counter()
+            names = []
+            for name, module in list(LOADED.items()):
+                if name in self._hibernated or _addon_of(module) not in addons:
+                    continue
+                entries = []
+                for grammar, kind in grammars_of(module):
+                    try:
+                        if kind == "natlink":
+                            grammar.deactivateAll()
+                            entries.append((grammar, kind, True))
+                            continue
+                        enabled = getattr(grammar, "enabled", True)
+                        if self.config["mode"] == "unload":
+                            if not getattr(grammar, "loaded", True):
+                                continue
+                            grammar.unload()
+                        else:
+                            grammar.disable()
+                        entries.append((grammar, kind, enabled))
+                    except Exception as e:
+                        log.warning(f"[hibernation] {name}.{getattr(grammar, 'name', '?')} non mis en veille: {e}")
+                if entries:
+                    self._hibernated[name] = (module, entries)
+                    names.append(name)
+            if names:
+                self._report("hibernate", names, before, time.perf_counter() - start)
+            return names
+
+    def resume(self, addons=None):
+        """Réveille les grammaires en veille (toutes, ou celles des `addons`)."""
+        from .grammar_loader import LOADED
+
+        with LOADER_LOCK, self._lock:
+            if not self._hibernated:
+                return []
+            before = self.snapshot()
+            start = time.perf_counter()
+            names = []
+            for name, (module, entries) in list(self._hibernated.items()):
+                addon = _addon_of(module)
+                if addons is not None and addon not in addons:
+                    continue
+                del self._hibernated[name]
+                if LOADED.get(name) is not module:
+                    continue  # module déchargé ou rechargé entre-temps
+                for grammar, kind, enabled in entries:
+                    try:
+                        if kind == "natlink":
+                            grammar.activateAll()
+                        elif self.config["mode"] == "unload":
+                            grammar.load()  # forme compilée servie par core.grammar_cache
+                            if not enabled:
+                                grammar.disable()
+                        elif enabled:
+                            grammar.enable()
+                    except Exception as e:
+                        log.warning(f"[hibernation] {name}.{getattr(grammar, 'name', '?')} non réveillée: {e}")
+                self.touch(addon)
+                names.append(name)
+            if names:
+                self._report("resume", names, before, time.perf_counter() - start)
+            return names
+
+    def forget(self, name):
+        """Le module `name` est déchargé : ne plus garder ses grammaires."""
+        with self._lock:
+            self._hibernated.pop(name, None)
+
+    def is_hibernated(self, name):
+        return name in self._hibernated
+
+    def check_idle(self):
+        if not self.config["enabled"]:
+            return []
+        # Timer wx : ne pas bloquer l'interface pendant un chargement en cours
+        if not LOADER_LOCK.acquire(blocking=False):
+            return []
+        try:
+            addons = self.idle_addons()
+            return self.hibernate(addons) if addons else []
+        finally:
+            LOADER_LOCK.release()
+
+    # -----------------------------
+    # Cycle de vie
+    # -----------------------------
+    def _wake(self):
+        names = self.resume()
+        log.info(f"[hibernation] réveil à la voix : {len(names)} grammaire(s)")
+
+    def _load_wake_grammar(self):
+        phrase = self.config.get("wake_phrase")
+        if not phrase or self._wake_grammar is not None:
+            return
+        try:
+            from dragonfly import Function, Grammar, MappingRule
+        except ImportError:
+            return
+        try:
+            grammar = Grammar("hibernation_wake")
+            grammar.add_rule(MappingRule(name="wake", mapping={phrase: Function(self._wake)}))
+            grammar.load()
+            self._wake_grammar = grammar
+        except Exception as e:
+            log.warning(f"[hibernation] phrase de réveil non chargée: {e}")
+
+    def start(self):
+        """À appeler depuis le thread wx : les appels moteur restent sur ce thread."""
+        from .watchdog import get_watchdog
+
+        if self._on_call not in get_watchdog().listeners:
+            get_watchdog().listeners.append(self._on_call)
+        if self._timer is not None or not self.config["enabled"]:
+            return
+        self._load_wake_grammar()
+        import wx
+
+        hibernation = self
+
+        class _IdleCheck(wx.Timer):
+            def Notify(self):
+                try:
+                    hibernation.check_idle()
+                except Exception as e:
+                    log.error(f"[hibernation] vérification: {e}")
+
+        self._timer = _IdleCheck()
+        self._timer.Start(CHECK_INTERVAL * 1000)
+        log.info(
+            f"[hibernation] veille après {self.config['idle_minutes']} min d'inactivité "
+            f"(mode {self.config['mode']})"
+        )
+
+    def stop(self):
+        if self._timer is not None:
+            self._timer.Stop()
+            self._timer = None
+        if self._wake_grammar is not None:
+            try:
+                self._wake_grammar.unload()
+            except Exception as e:
+                log.warning(f"[hibernation] phrase de réveil non déchargée: {e}")
+            self._wake_grammar = None
+
+    def status_text(self):
+        """Résumé pour le statut du tray."""
+        if not self.config["enabled"]:
+            return "Grammar hibernation: disabled"
+        text = f"Grammar hibernation: {len(self._hibernated)} hibernated"
+        if self._hibernated:
+            text += f" ({', '.join(sorted(self._hibernated))})"
+        report = self.last_report
+        if report:
+            text += (
+                f"\nLast {report['action']}: active rules "
+                f"{report['before']['active_rules']} -> {report['after']['active_rules']}"
+            )
+            if report["before"]["memory_mb"] is not None and report["after"]["memory_mb"] is not None:
+                text += f", memory {report['before']['memory_mb']:.1f} -> {report['after']['memory_mb']:.1f} MB"
+        return text
+
+
+_HIBERNATION = None
+
+
+def get_hibernation():
+    global _HIBERNATION
+    if _HIBERNATION is None:
+        _HIBERNATION = GrammarHibernation()
+    return _HIBERNATION
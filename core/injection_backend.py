@@ -0,0 +1,173 @@
+"""
+Backends d'injection (touches, texte, presse-papiers)
+Toute la sortie du miroir de dictée passe par un backend : dragonfly sous
+Windows, ou un backend d'enregistrement horodaté pour mesurer le pipeline
+(nombre de frappes, latence émise) sous Linux.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from .word_selection import count_keystrokes
+
+
+class InjectionBackend:
+    """Interface de sortie utilisée par les addons d'injection de texte."""
+
+    def key(self, spec: str):
+        """Envoie une spec dragonfly `Key` (ex: "enter:2, tab")."""
+        raise NotImplementedError
+
+    def text(self, text: str):
+        """Tape un morceau de texte."""
+        raise NotImplementedError
+
+    def clipboard_get(self) -> str:
+        raise NotImplementedError
+
+    def clipboard_set(self, text: str):
+        raise NotImplementedError
+
+    def clipboard_sequence(self):
+        """Numéro de séquence du presse-papiers, ou None."""
+        return None
+
+    def sleep(self, seconds: float):
+        if seconds:
+            time.sleep(seconds)
+
+
+class DragonflyBackend(InjectionBackend):
+    """Sortie réelle via dragonfly `Key`/`Text` (actions Key mises en cache par spec)."""
+
+    MAX_ACTIONS = 256
+
+    def __init__(self):
+        from dragonfly import Key, Text
+        from .clipboard_broker import SystemClipboardBackend
+
+        self._key_cls = Key
+        self._text_cls = Text
+        self._clipboard = SystemClipboardBackend()
+        self._actions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key_action(self, spec):
+        with self._lock:
+            action = self._actions.get(spec)
+            if action is None:
+                action = self._key_cls(spec)
+                self._actions[spec] = action
+                if len(self._actions) > self.MAX_ACTIONS:
+                    self._actions.popitem(last=False)
+            else:
+                self._actions.move_to_end(spec)
+            return action
+
+    def key(self, spec: str):
+        self._key_action(spec).execute()
+
+    def text(self, text: str):
+        self._text_cls(text).execute()
+
+    def clipboard_get(self) -> str:
+        return self._clipboard.get_text()
+
+    def clipboard_set(self, text: str):
+        self._clipboard.set_text(text)
+
+    def clipboard_sequence(self):
+        return self._clipboard.get_sequence_number()
+
+
+class RecordingBackend(InjectionBackend):
+    """
+    Backend d'enregistrement pour benchmarks (aucune sortie réelle).
+
+    Chaque touche, morceau de texte et opération presse-papiers est ajouté à
+    `events` sous la forme (horodatage, type, contenu). Le temps est virtuel :
+    `sleep` avance l'horloge sans attendre, et chaque frappe coûte
+    `keystroke_cost` secondes. Un Ctrl+C copie `selection` dans le
+    presse-papiers, comme le ferait l'application cible.
+    """
+
+    def __init__(self, keystroke_cost=0.0, selection=""):
+        self.keystroke_cost = keystroke_cost
+        self.selection = selection
+        self.events = []
+        self.clock = 0.0
+        self._clipboard = ""
+        self._sequence = 1
+
+    def _emit(self, kind, payload, keystrokes=0):
+        self.events.append((self.clock, kind, payload))
+        self.clock += keystrokes * self.keystroke_cost
+
+    def key(self, spec: str):
+        self._emit("key", spec, count_keystrokes([spec]))
+        if "c-c" in [part.strip().split("/")[0] for part in spec.split(",")]:
+            self._clipboard = self.selection
+            self._sequence += 1
+
+    def text(self, text: str):
+        self._emit("text", text, len(text))
+
+    def clipboard_get(self) -> str:
+        self._emit("clipboard_get", None)
+        return self._clipboard
+
+    def clipboard_set(self, text: str):
+        self._emit("clipboard_set", text)
+        self._clipboard = text
+        self._sequence += 1
+
+    def clipboard_sequence(self):
+        return self._sequence
+
+    def sleep(self, seconds: float):
+        self.clock += seconds or 0.0
+
+    def reset(self):
+        self.events = []
+        self.clock = 0.0
+
+    @property
+    def keystrokes(self):
+        total = 0
+        for _, kind, payload in self.events:
+            if kind == "key":
+                total += count_keystrokes([payload])
+            elif kind == "text":
+                total += len(payload)
+        return total
+
+    def summary(self):
+        """Résumé d'un scénario : frappes, événements, opérations presse-papiers, latence."""
+        kinds = [kind for _, kind, _ in self.events]
+        return {
+            "events": len(self.events),
+            "keystrokes": self.keystrokes,
+            "key_events": kinds.count("key"),
+            "text_events": kinds.count("text"),
+            "clipboard_ops": sum(1 for k in kinds if k.startswith("clipboard")),
+            "latency": self.clock,
+        }
+
+
+_BACKEND = None
+
+
+def get_backend():
+    """Backend d'injection courant (dragonfly par défaut)."""
+    global _BACKEND
+    if _BACKEND is None:
+        _BACKEND = DragonflyBackend()
+    return _BACKEND
+
+
+def set_backend(backend):
+    """Remplace le backend d'injection (ex: RecordingBackend pour un benchmark)."""
+    global _BACKEND
+    _BACKEND = backend
+    return backend
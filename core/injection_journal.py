@@ -0,0 +1,91 @@
+"""
+Journal des injections de texte
+Mémorise, par fenêtre au premier plan, ce que la dictée a réellement injecté
+(et l'état de fin avant chaque envoi) pour annuler exactement ou corriger
+en n'envoyant que la différence.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+
+
+class JournalEntry:
+    """Une injection : texte envoyé + état de fin (_prev_*) avant l'envoi."""
+
+    def __init__(self, text, state_before):
+        self.text = text
+        self.state_before = dict(state_before or {})
+        self.timestamp = time.time()
+
+    def __repr__(self):
+        return f"JournalEntry({self.text!r})"
+
+
+class InjectionJournal:
+    """Journal borné : `max_entries` injections par fenêtre, `max_windows` fenêtres."""
+
+    def __init__(self, max_entries=50, max_windows=20):
+        self.max_entries = max_entries
+        self.max_windows = max_windows
+        self._windows = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, window_key, text, state_before):
+        """Ajoute une injection pour la fenêtre donnée."""
+        if not text:
+            return
+        with self._lock:
+            entries = self._windows.get(window_key)
+            if entries is None:
+                entries = deque(maxlen=self.max_entries)
+                self._windows[window_key] = entries
+            self._windows.move_to_end(window_key)
+            entries.append(JournalEntry(text, state_before))
+            while len(self._windows) > self.max_windows:
+                self._windows.popitem(last=False)
+
+    def pop(self, window_key, count=1):
+        """Retire et retourne les `count` dernières injections (la plus récente en premier)."""
+        with self._lock:
+            entries = self._windows.get(window_key)
+            popped = []
+            while entries and len(popped) < count:
+                popped.append(entries.pop())
+            return popped
+
+    def last(self, window_key):
+        """Dernière injection de la fenêtre, ou None."""
+        with self._lock:
+            entries = self._windows.get(window_key)
+            return entries[-1] if entries else None
+
+    def replace_last(self, window_key, text):
+        """Remplace le texte de la dernière injection (après correction)."""
+        with self._lock:
+            entries = self._windows.get(window_key)
+            if entries:
+                entries[-1].text = text
+
+    def entries(self, window_key):
+        with self._lock:
+            return list(self._windows.get(window_key) or ())
+
+    def clear(self, window_key=None):
+        with self._lock:
+            if window_key is None:
+                self._windows.clear()
+            else:
+                self._windows.pop(window_key, None)
+
+
+def diff_suffix(old: str, new: str):
+    """
+    Différence minimale pour passer de `old` à `new` en fin de champ.
+    Retourne (nombre de retours arrière, suffixe à taper).
+    """
+    common = 0
+    limit = min(len(old), len(new))
+    while common < limit and old[common] == new[common]:
+        common += 1
+    return len(old) - common, new[common:]
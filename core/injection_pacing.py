@@ -0,0 +1,375 @@
+"""
+Rythme d'injection calibré par application cible
+Tape une chaîne témoin dans une cible, mesure les caractères perdus ou
+inversés en réduisant le délai, puis mémorise le profil sûr le plus rapide
+par exécutable.
+
+Usage:
+    python -m core.injection_pacing calibrate <executable> --live|--dry-run
+    python -m core.injection_pacing list
+"""
+
+import difflib
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from .app_paths import get_data_dir
+from .logHandler import log
+
+PROBE_TEXT = "Le vif zéphyr jubile, où ça? Ô ciel! l'été 2024 (x+y)=42 — ok."
+
+
+class PacingProfile:
+    """Délais d'injection pour une application (en secondes)."""
+
+    def __init__(
+        self,
+        char_delay=0.01,
+        select_delay=0.006,
+        step_delay=0.004,
+        mode="keys_slow",
+        calibrated=False,
+    ):
+        self.char_delay = char_delay
+        self.select_delay = select_delay
+        self.step_delay = step_delay
+        self.mode = mode
+        self.calibrated = calibrated
+
+    def to_dict(self):
+        return {
+            "char_delay": self.char_delay,
+            "select_delay": self.select_delay,
+            "step_delay": self.step_delay,
+            "mode": self.mode,
+            "calibrated": self.calibrated,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            char_delay=data.get("char_delay", 0.01),
+            select_delay=data.get("select_delay", 0.006),
+            step_delay=data.get("step_delay", 0.004),
+            mode=data.get("mode", "keys_slow"),
+            calibrated=data.get("calibrated", False),
+        )
+
+    def __repr__(self):
+        return (
+            f"PacingProfile(mode={self.mode}, char={self.char_delay * 1000:.1f} ms, "
+            f"select={self.select_delay * 1000:.1f} ms)"
+        )
+
+
+# Valeurs réglées à la main historiquement dans _global_mirror.py
+DEFAULT_PROFILE = PacingProfile()
+
+
+# -----------------------------
+# Cibles de calibration
+# -----------------------------
+class TextSink:
+    """Cible dans laquelle la calibration tape la chaîne témoin."""
+
+    def reset(self):
+        raise NotImplementedError
+
+    def type_text(self, text, char_delay):
+        raise NotImplementedError
+
+    def read_back(self) -> str:
+        raise NotImplementedError
+
+
+class FakeTextSink(TextSink):
+    """
+    Cible simulée (Linux / tests) : perd des caractères sous `drop_below`
+    secondes par caractère et en inverse sous `reorder_below`.
+    Le temps est virtuel : aucune attente réelle.
+    """
+
+    def __init__(self, drop_below=0.003, reorder_below=0.001, error_rate=0.2, seed=0):
+        self.drop_below = drop_below
+        self.reorder_below = reorder_below
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._buffer = []
+        self.virtual_time = 0.0
+
+    def reset(self):
+        self._buffer = []
+
+    def type_text(self, text, char_delay):
+        for ch in text:
+            self.virtual_time += char_delay
+            if char_delay < self.drop_below and self._rng.random() < self.error_rate:
+                continue
+            if (
+                char_delay < self.reorder_below
+                and self._buffer
+                and self._rng.random() < self.error_rate
+            ):
+                self._buffer.insert(len(self._buffer) - 1, ch)
+                continue
+            self._buffer.append(ch)
+
+    def read_back(self) -> str:
+        return "".join(self._buffer)
+
+
+class ForegroundTextSink(TextSink):
+    """
+    Cible réelle : le champ actif de la fenêtre au premier plan.
+    À utiliser sur un champ vide prévu pour l'essai (il est vidé à chaque passe).
+    """
+
+    def __init__(self):
+        from .clipboard_broker import get_clipboard_broker
+        from .injection_backend import get_backend
+        from .key_compiler import compile_keys
+
+        self._backend = get_backend()
+        self._broker = get_clipboard_broker()
+        self._clear = compile_keys("c-a", "backspace")
+        self._select_all = compile_keys("c-a")
+        self._copy = compile_keys("c-c")
+
+    def reset(self):
+        self._clear.execute()
+        time.sleep(0.05)
+
+    def type_text(self, text, char_delay):
+        for ch in text:
+            self._backend.text(ch)
+            self._backend.sleep(char_delay)
+
+    def read_back(self) -> str:
+        time.sleep(0.1)  # laisser la cible traiter la file d'événements
+        self._select_all.execute()
+        return self._broker.copy_selection(self._copy.execute).replace("\r\n", "\n")
+
+
+def measure_errors(expected: str, actual: str):
+    """Retourne (caractères perdus, caractères inversés) entre la chaîne attendue et lue."""
+    matcher = difflib.SequenceMatcher(None, expected, actual, autojunk=False)
+    in_order = sum(block.size for block in matcher.get_matching_blocks())
+    present = sum((Counter(expected) & Counter(actual)).values())
+    return len(expected) - present, present - in_order
+
+
+# -----------------------------
+# Calibration
+# -----------------------------
+class PacingCalibrator:
+    """Réduit le délai par caractère tant que la cible ne perd ni n'inverse rien."""
+
+    def __init__(
+        self,
+        sink,
+        probe=PROBE_TEXT,
+        start_delay=0.02,
+        factor=0.5,
+        floor=0.0005,
+        trials=2,
+        safety=1.5,
+    ):
+        self.sink = sink
+        self.probe = probe
+        self.start_delay = start_delay
+        self.factor = factor
+        self.floor = floor
+        self.trials = trials
+        self.safety = safety
+        self.history = []  # [(délai, perdus, inversés), ...]
+
+    def _run(self, delay):
+        dropped = reordered = 0
+        for _ in range(self.trials):
+            self.sink.reset()
+            self.sink.type_text(self.probe, delay)
+            d, r = measure_errors(self.probe, self.sink.read_back())
+            dropped += d
+            reordered += r
+        self.history.append((delay, dropped, reordered))
+        return dropped == 0 and reordered == 0
+
+    def calibrate(self) -> PacingProfile:
+        delay = self.start_delay
+        fastest_safe = None
+        while True:
+            if not self._run(delay):
+                break
+            fastest_safe = delay
+            if delay == 0:
+                break
+            delay = delay * self.factor
+            if delay < self.floor:
+                delay = 0.0
+
+        if fastest_safe is None:
+            # Même le délai de départ perd des caractères : coller plutôt que taper
+            log.warning("Calibration: aucun délai sûr trouvé - mode presse-papiers")
+            return PacingProfile(
+                char_delay=self.start_delay,
+                select_delay=DEFAULT_PROFILE.select_delay,
+                step_delay=DEFAULT_PROFILE.step_delay,
+                mode="paste",
+                calibrated=True,
+            )
+
+        char_delay = min(fastest_safe * self.safety, self.start_delay)
+        # Les pauses de sélection suivent le même rapport que le délai par caractère
+        ratio = char_delay / DEFAULT_PROFILE.char_delay
+        return PacingProfile(
+            char_delay=char_delay,
+            select_delay=min(max(DEFAULT_PROFILE.select_delay * ratio, 0.001), 0.02),
+            step_delay=min(max(DEFAULT_PROFILE.step_delay * ratio, 0.001), 0.02),
+            mode="keys" if char_delay == 0 else "keys_slow",
+            calibrated=True,
+        )
+
+
+# -----------------------------
+# Cache des profils par exécutable
+# -----------------------------
+def normalize_executable(executable) -> str:
+    name = str(executable or "").replace("\\", "/").rsplit("/", 1)[-1].lower()
+    return name[:-4] if name.endswith(".exe") else name
+
+
+class ProfileCache:
+    """Profils calibrés persistés en JSON, indexés par nom d'exécutable."""
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else get_data_dir("cache") / "injection_profiles.json"
+        self._profiles = {}
+        self._lock = threading.Lock()
+        self._mtime = None  # mtime du fichier lu ; relu s'il change (calibration CLI)
+
+    def _file_mtime(self):
+        try:
+            return self.path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _load(self):
+        mtime = self._file_mtime()
+        if mtime == self._mtime:
+            return
+        self._mtime = mtime
+        if mtime is None:
+            self._profiles = {}
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self._profiles = {
+                exe: PacingProfile.from_dict(p) for exe, p in data.items()
+            }
+        except Exception as e:
+            log.warning(f"Profils d'injection illisibles ({self.path}): {e}")
+
+    def get(self, executable):
+        exe = normalize_executable(executable)
+        with self._lock:
+            self._load()
+            return self._profiles.get(exe)
+
+    def set(self, executable, profile):
+        exe = normalize_executable(executable)
+        with self._lock:
+            self._load()
+            self._profiles[exe] = profile
+            self._save()
+
+    def items(self):
+        with self._lock:
+            self._load()
+            return list(self._profiles.items())
+
+    def _save(self):
+        try:
+            data = {exe: p.to_dict() for exe, p in self._profiles.items()}
+            self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            self._mtime = self._file_mtime()
+        except Exception as e:
+            log.error(f"Impossible d'enregistrer les profils d'injection: {e}")
+
+
+_CACHE = None
+
+
+def get_profile_cache():
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = ProfileCache()
+    return _CACHE
+
+
+def profile_for(executable) -> PacingProfile:
+    """Profil calibré de l'exécutable, ou le profil par défaut."""
+    return get_profile_cache().get(executable) or DEFAULT_PROFILE
+
+
+def calibrate_executable(executable, sink=None, save=None, **kwargs) -> PacingProfile:
+    """
+    Calibre une cible et enregistre le profil obtenu pour `executable`.
+
+    Args:
+        sink: cible de l'essai (ForegroundTextSink par défaut sous Windows,
+            FakeTextSink ailleurs)
+        save: enregistrer le profil ; par défaut seulement si la cible est
+            réelle (un profil simulé ne doit jamais servir à taper pour de vrai)
+    """
+    if sink is None:
+        sink = ForegroundTextSink() if sys.platform == "win32" else FakeTextSink()
+    if save is None:
+        save = not isinstance(sink, FakeTextSink)
+    calibrator = PacingCalibrator(sink, **kwargs)
+    profile = calibrator.calibrate()
+    for delay, dropped, reordered in calibrator.history:
+        log.info(
+            f"Calibration {normalize_executable(executable)}: "
+            f"{delay * 1000:.2f} ms/car -> {dropped} perdu(s), {reordered} inversé(s)"
+        )
+    if save:
+        get_profile_cache().set(executable, profile)
+        log.info(f"Profil enregistré pour {normalize_executable(executable)}: {profile}")
+    else:
+        log.info(f"Profil simulé (non enregistré) pour {normalize_executable(executable)}: {profile}")
+    return profile
+
+
+def main():
+    """Point d'entrée CLI"""
+    usage = __doc__.strip().split("Usage:")[1].strip()
+    live = "--live" in sys.argv
+    dry_run = "--dry-run" in sys.argv
+    if len(sys.argv) > 2 and sys.argv[1] == "calibrate" and live != dry_run:
+        executable = sys.argv[2]
+        if live:
+            if sys.platform != "win32":
+                print("--live nécessite Windows (cible réelle au premier plan)")
+                sys.exit(2)
+            print("Placez le curseur dans un champ vide de la cible (5 s)...")
+            time.sleep(5)
+            profile = calibrate_executable(executable, ForegroundTextSink(), save=True)
+            print(f"{normalize_executable(executable)}: {profile} (enregistré)")
+        else:
+            profile = calibrate_executable(executable, FakeTextSink(), save=False)
+            print(f"{normalize_executable(executable)}: {profile} (simulé, non enregistré)")
+    elif len(sys.argv) > 1 and sys.argv[1] == "list":
+        for exe, profile in get_profile_cache().items():
+            print(f"{exe}: {profile}")
+    else:
+        print(usage)
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
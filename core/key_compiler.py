@@ -0,0 +1,171 @@
+"""
+Compilateur de séquences de touches
+Fusionne les frappes consécutives en une seule spec dragonfly `Key` (avec
+répétitions), met en cache les specs analysées et exécute la séquence en un
+seul appel avec un rythme inter-touches configurable.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+
+# Syntaxe dragonfly : [modificateurs-]touche[/pause_interne][:répétition][/pause_externe]
+_PRESS_RE = re.compile(
+    r"^(?P<key>[^:/,]+?)(?:/(?P<inner>\d+(?:\.\d+)?))?"
+    r"(?::(?P<repeat>\d+))?(?:/(?P<outer>\d+(?:\.\d+)?))?$"
+)
+
+MAX_COMPILED = 256
+_PARSED = {}
+_COMPILED = OrderedDict()
+_lock = threading.Lock()
+
+
+class KeyPress:
+    """Une frappe (éventuellement répétée) d'une spec Key."""
+
+    __slots__ = ("key", "repeat", "inner", "outer", "opaque")
+
+    def __init__(self, key, repeat=1, inner=None, outer=None, opaque=False):
+        self.key = key
+        self.repeat = repeat
+        self.inner = inner
+        self.outer = outer
+        self.opaque = opaque  # ex: "shift:down" — jamais fusionné
+
+    def can_merge(self, other):
+        return (
+            not self.opaque
+            and not other.opaque
+            and self.key == other.key
+            and self.inner == other.inner
+            and self.outer == other.outer
+        )
+
+    def to_spec(self, pause=None):
+        if self.opaque:
+            return self.key
+        inner = self.inner
+        outer = self.outer
+        if pause is not None:
+            # pause en secondes -> centièmes de seconde (unité dragonfly)
+            hundredths = f"{pause * 100:g}"
+            inner = inner if inner is not None else hundredths
+            outer = outer if outer is not None else hundredths
+        spec = self.key
+        if self.repeat > 1 and inner is not None:
+            spec += f"/{inner}"
+        if self.repeat > 1:
+            spec += f":{self.repeat}"
+        if outer is not None:
+            spec += f"/{outer}"
+        return spec
+
+
+def parse_key_spec(spec):
+    """Analyse une spec Key (éventuellement « a, b:2 ») ; le résultat est mis en cache."""
+    parsed = _PARSED.get(spec)
+    if parsed is not None:
+        return parsed
+
+    presses = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        m = _PRESS_RE.match(part)
+        if not m:
+            presses.append(KeyPress(part, opaque=True))
+            continue
+        presses.append(
+            KeyPress(
+                m.group("key").strip(),
+                int(m.group("repeat") or 1),
+                m.group("inner"),
+                m.group("outer"),
+            )
+        )
+    parsed = tuple(presses)
+    _PARSED[spec] = parsed
+    return parsed
+
+
+def merge_presses(presses):
+    """Fusionne les frappes identiques consécutives (« enter, enter » -> « enter:2 »)."""
+    merged = []
+    for press in presses:
+        if merged and merged[-1].can_merge(press):
+            last = merged[-1]
+            merged[-1] = KeyPress(
+                last.key, last.repeat + press.repeat, last.inner, last.outer
+            )
+        else:
+            merged.append(press)
+    return merged
+
+
+class KeySequence:
+    """Séquence compilée : une seule spec Key, une seule action dragonfly."""
+
+    def __init__(self, presses, pause=None):
+        self.presses = tuple(presses)
+        self.pause = pause
+        self.spec = ", ".join(p.to_spec(pause) for p in self.presses)
+        self._action = None
+
+    @property
+    def keystrokes(self):
+        return sum(p.repeat for p in self.presses)
+
+    def as_action(self):
+        """Action dragonfly `Key` (construite une seule fois), utilisable dans un mapping."""
+        if self._action is None:
+            from dragonfly import Key
+
+            self._action = Key(self.spec)
+        return self._action
+
+    def execute(self, data=None):
+        """Envoie la séquence en un seul appel au backend d'injection courant."""
+        if not self.presses:
+            return
+        from .injection_backend import get_backend
+
+        get_backend().key(self.spec)
+
+    def __repr__(self):
+        return f"KeySequence({self.spec!r})"
+
+
+def compile_keys(*specs, pause=None):
+    """
+    Compile des specs Key en une seule séquence exécutée d'un coup.
+
+    Args:
+        *specs: specs dragonfly, ex: "enter", "enter", "c-backspace"
+        pause: pause entre frappes en secondes (None = rythme dragonfly par défaut)
+    """
+    cache_key = (specs, pause)
+    with _lock:
+        sequence = _COMPILED.get(cache_key)
+        if sequence is not None:
+            _COMPILED.move_to_end(cache_key)
+            return sequence
+
+    presses = []
+    for spec in specs:
+        presses.extend(parse_key_spec(spec))
+    sequence = KeySequence(merge_presses(presses), pause)
+
+    with _lock:
+        _COMPILED[cache_key] = sequence
+        while len(_COMPILED) > MAX_COMPILED:
+            _COMPILED.popitem(last=False)
+        if len(_PARSED) > MAX_COMPILED * 4:
+            _PARSED.clear()
+    return sequence
+
+
+def key_macro(*specs, pause=None):
+    """Macro multi-touches déclarée par un addon (compilée une fois, à la déclaration)."""
+    return compile_keys(*specs, pause=pause)
@@ -0,0 +1,399 @@
+"""
+Navigateur indexé du fichier ftnatlink.log
+Le fichier est projeté en mémoire (mmap) : rien n'est chargé en entier, les
+recherches de texte se font avec mmap.find. Un index clairsemé et persistant
+(un enregistrement tous les `stride` octets : position, numéro de ligne,
+horodatage) est complété à chaque rafraîchissement quand le fichier grandit ;
+il sert au saut à une date et au calcul des numéros de ligne.
+
+Usage:
+    python -m core.log_index [fichier] [--since "AAAA-MM-JJ HH:MM:SS"] [--until "..."]
+                             [--level WARNING] [--logger nom] [--grep texte]
+                             [--limit 50] [--stats]
+"""
+
+import hashlib
+import heapq
+import mmap
+import pickle
+import re
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+
+from .app_paths import get_data_dir
+
+INDEX_VERSION = 1
+STRIDE = 64 * 1024  # octets entre deux entrées de l'index
+HEAD_SIZE = 256  # octets comparés pour détecter un fichier remplacé
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# "[2025-01-31 12:00:00] INFO FTNatlink: message" (niveau/logger absents des anciennes lignes)
+HEADER_RE = re.compile(
+    rb"\[(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d)\] (?:(DEBUG|INFO|WARNING|ERROR|CRITICAL) (\S+?): )?"
+)
+
+
+def default_log_path():
+    """Fichier de log de l'application (core/logs en mode script, AppData sinon)."""
+    return get_data_dir("logs") / "ftnatlink.log"
+
+
+class LogRecord:
+    """Un enregistrement du log (lignes de continuation comprises)."""
+
+    __slots__ = ("offset", "time", "level", "logger", "message")
+
+    def __init__(self, offset, time, level, logger, message):
+        self.offset = offset
+        self.time = time
+        self.level = level
+        self.logger = logger
+        self.message = message
+
+    def __str__(self):
+        head = f"[{self.time}]"
+        if self.level:
+            head += f" {self.level} {self.logger}:"
+        return f"{head} {self.message}"
+
+
+class LogIndex:
+    """Index clairsemé persistant d'un fichier de log + recherches sur mmap."""
+
+    def __init__(self, path=None, index_path=None, stride=STRIDE):
+        self.path = Path(path) if path else default_log_path()
+        if index_path is None:
+            key = hashlib.md5(str(self.path.resolve()).encode("utf-8")).hexdigest()[:10]
+            index_path = get_data_dir("cache") / f"log_index_{self.path.stem}_{key}.pickle"
+        self.index_path = Path(index_path)
+        self.stride = stride
+        self._mm = None
+        self._file = None
+        self._reset()
+        self._load()
+
+    # -----------------------------
+    # Index persistant
+    # -----------------------------
+    def _reset(self):
+        self.head = b""
+        self.indexed_to = 0  # fin de la dernière ligne complète indexée
+        self.counted_to = 0  # position jusqu'où les lignes sont comptées
+        self.line_count = 0  # lignes avant counted_to
+        self.offsets = array("q")
+        self.lines = array("q")  # numéro (0-based) de la ligne à chaque position
+        self.times = []  # horodatages "AAAA-MM-JJ HH:MM:SS" (ordre lexicographique = chronologique)
+
+    def _load(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                data = pickle.load(f)
+            if data.get("version") != INDEX_VERSION or data.get("stride") != self.stride:
+                return
+            for key in ("head", "indexed_to", "counted_to", "line_count", "offsets", "lines", "times"):
+                setattr(self, key, data[key])
+        except Exception:
+            self._reset()
+
+    def _save(self):
+        data = {
+            "version": INDEX_VERSION,
+            "stride": self.stride,
+            "path": str(self.path),
+            "head": self.head,
+            "indexed_to": self.indexed_to,
+            "counted_to": self.counted_to,
+            "line_count": self.line_count,
+            "offsets": self.offsets,
+            "lines": self.lines,
+            "times": self.times,
+        }
+        try:
+            tmp = self.index_path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(self.index_path)
+        except Exception:
+            pass  # l'index sera reconstruit au prochain lancement
+
+    # -----------------------------
+    # Projection / mise à jour
+    # -----------------------------
+    def _map(self):
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            size = 0
+        if self._mm is not None and len(self._mm) == size:
+            return self._mm
+        # Les générateurs en cours gardent une référence à l'ancienne projection
+        self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if size == 0:
+            return None
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mm
+
+    def refresh(self):
+        """Indexe la partie ajoutée au fichier depuis le dernier appel ; retourne le nombre d'entrées ajoutées."""
+        mm = self._map()
+        if mm is None:
+            if self.indexed_to:
+                self._reset()
+                self._save()
+            return 0
+
+        size = len(mm)
+        head = mm[:HEAD_SIZE]
+        if size < self.indexed_to or head[: len(self.head)] != self.head:
+            self._reset()  # fichier tronqué ou remplacé
+        self.head = head
+
+        end = mm.rfind(b"\n", self.indexed_to, size) + 1
+        if end <= self.indexed_to:
+            return 0
+
+        added = 0
+        pos = self.indexed_to
+        if self.offsets:
+            pos = max(pos, self.offsets[-1] + self.stride)
+        while pos < end:
+            start = self._record_start(mm, pos, end)
+            if start < 0:
+                break
+            self.line_count += mm[self.counted_to : start].count(b"\n")
+            self.counted_to = start
+            self.offsets.append(start)
+            self.lines.append(self.line_count)
+            self.times.append(HEADER_RE.match(mm, start).group(1).decode("ascii"))
+            added += 1
+            pos = start + self.stride
+
+        self.line_count += mm[self.counted_to : end].count(b"\n")
+        self.counted_to = end
+        self.indexed_to = end
+        self._save()
+        return added
+
+    @staticmethod
+    def _record_start(mm, pos, end):
+        """Premier début d'enregistrement >= pos (avant end), ou -1."""
+        if pos == 0 and HEADER_RE.match(mm, 0):
+            return 0
+        i = max(pos - 1, 0)
+        while True:
+            i = mm.find(b"\n[", i, end)
+            if i < 0 or i + 1 >= end:
+                return -1
+            if HEADER_RE.match(mm, i + 1):
+                return i + 1
+            i += 1
+
+    @staticmethod
+    def _record_containing(mm, pos):
+        """Début de l'enregistrement qui contient la position pos (0 par défaut)."""
+        i = pos
+        while True:
+            i = mm.rfind(b"\n[", 0, i)
+            if i < 0:
+                return 0
+            if HEADER_RE.match(mm, i + 1):
+                return i + 1
+
+    def _read_record(self, mm, start, end):
+        """(LogRecord, fin de l'enregistrement)."""
+        stop = self._record_start(mm, start + 1, end)
+        if stop < 0:
+            stop = end
+        match = HEADER_RE.match(mm, start)
+        if match is None:  # lignes avant le premier horodatage
+            text = mm[start:stop].decode("utf-8", "replace").rstrip("\r\n")
+            return LogRecord(start, "", None, None, text), stop
+        level, logger = match.group(2), match.group(3)
+        return (
+            LogRecord(
+                start,
+                match.group(1).decode("ascii"),
+                level.decode("ascii") if level else None,
+                logger.decode("utf-8", "replace") if logger else None,
+                mm[match.end() : stop].decode("utf-8", "replace").rstrip("\r\n"),
+            ),
+            stop,
+        )
+
+    # -----------------------------
+    # Navigation
+    # -----------------------------
+    def offset_for_time(self, when):
+        """Position du premier enregistrement horodaté >= when ("AAAA-MM-JJ[ HH:MM:SS]")."""
+        mm = self._map()
+        if mm is None:
+            return 0
+        i = bisect_right(self.times, when) - 1
+        pos = self.offsets[i] if i >= 0 else 0
+        end = self.indexed_to
+        while pos < end:
+            record, stop = self._read_record(mm, pos, end)
+            if record.time >= when:
+                return pos
+            pos = stop
+        return end
+
+    def line_of(self, offset):
+        """Numéro de ligne (1-based) d'une position, depuis l'entrée d'index la plus proche."""
+        mm = self._map()
+        i = bisect_right(self.offsets, offset) - 1
+        base, line = (self.offsets[i], self.lines[i]) if i >= 0 else (0, 0)
+        return line + mm[base:offset].count(b"\n") + 1
+
+    def _positions(self, mm, needles, begin, end):
+        """Positions (croissantes) des occurrences de plusieurs motifs."""
+
+        def find_all(needle):
+            pos = begin
+            while True:
+                pos = mm.find(needle, pos, end)
+                if pos < 0:
+                    return
+                yield pos
+                pos += 1
+
+        if len(needles) == 1:
+            return find_all(needles[0])
+        return heapq.merge(*(find_all(n) for n in needles))
+
+    def search(self, text=None, level=None, logger=None, since=None, until=None, start=None):
+        """
+        Génère les enregistrements correspondants, dans l'ordre du fichier.
+
+        Args:
+            text: sous-chaîne recherchée (sensible à la casse)
+            level: niveau minimal (ex: "WARNING")
+            logger: nom du logger (ses enfants "nom.xxx" inclus)
+            since, until: bornes "AAAA-MM-JJ HH:MM:SS" (préfixe accepté)
+            start: position de reprise (offset d'un enregistrement)
+        """
+        self.refresh()
+        mm = self._map()
+        if mm is None:
+            return
+        end = self.indexed_to
+        begin = start if start is not None else (self.offset_for_time(since) if since else 0)
+        levels = LEVELS[LEVELS.index(level) :] if level else None
+
+        if text:
+            needles = [text.encode("utf-8")]
+        elif levels or logger:
+            # Les filtres deviennent des motifs d'en-tête cherchés par mmap.find
+            suffix = f" {logger}".encode("utf-8") if logger else b" "
+            needles = [f"] {name}".encode("ascii") + suffix for name in (levels or LEVELS)]
+        else:
+            needles = None
+
+        if needles is None:
+            pos = begin
+            while pos < end:
+                record, pos = self._read_record(mm, pos, end)
+                if until and record.time[: len(until)] > until:
+                    return
+                yield record
+            return
+
+        last = -1
+        for hit in self._positions(mm, needles, begin, end):
+            if hit < last:
+                continue  # dans l'enregistrement déjà traité
+            record_start = self._record_containing(mm, hit + 1) if hit else 0
+            record, last = self._read_record(mm, record_start, end)
+            if record_start < begin:
+                continue
+            if until and record.time[: len(until)] > until:
+                return
+            if levels and record.level not in levels:
+                continue
+            if logger and not (
+                record.logger == logger or (record.logger or "").startswith(logger + ".")
+            ):
+                continue
+            if text and needles[0] not in mm[record_start:last]:
+                continue
+            yield record
+
+    def get_stats(self):
+        return {
+            "path": str(self.path),
+            "size": len(self._map() or b""),
+            "indexed_to": self.indexed_to,
+            "entries": len(self.offsets),
+            "lines": self.line_count,
+            "first": self.times[0] if self.times else None,
+            "last": self.times[-1] if self.times else None,
+        }
+
+    def close(self):
+        self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def main():
+    """Point d'entrée CLI"""
+    args = sys.argv[1:]
+    if args and args[0] in ("-h", "--help"):
+        print(__doc__.strip().split("Usage:")[1].strip())
+        return
+
+    options = {}
+    for name in ("--since", "--until", "--level", "--logger", "--grep", "--limit"):
+        if name in args:
+            i = args.index(name)
+            options[name[2:]] = args[i + 1]
+            del args[i : i + 2]
+    show_stats = "--stats" in args
+    if show_stats:
+        args.remove("--stats")
+
+    index = LogIndex(args[0] if args else None)
+    start = time.perf_counter()
+    added = index.refresh()
+    stats = index.get_stats()
+    if show_stats:
+        print(
+            f"{stats['path']}: {stats['size'] / (1024 * 1024):.1f} Mo, {stats['lines']} lignes, "
+            f"{stats['entries']} entrée(s) d'index (+{added} en "
+            f"{(time.perf_counter() - start) * 1000:.0f} ms), {stats['first']} -> {stats['last']}"
+        )
+        return
+
+    level = options.get("level")
+    if level:
+        level = level.upper()
+        if level not in LEVELS:
+            print(f"Niveau inconnu: {level} ({', '.join(LEVELS)})")
+            return
+    limit = int(options.get("limit", 50))
+    count = 0
+    for record in index.search(
+        text=options.get("grep"),
+        level=level,
+        logger=options.get("logger"),
+        since=options.get("since"),
+        until=options.get("until"),
+    ):
+        print(f"{index.line_of(record.offset)}: {record}")
+        count += 1
+        if count >= limit:
+            print(f"... (--limit {limit})")
+            break
+
+
+if __name__ == "__main__":
+    main()
@@ -67,7 +67,13 @@ def setup_logging(log_level=logging.INFO):
     try:
         file_handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
         file_handler.setLevel(log_level)
-        file_handler.setFormatter(formatter)
+        # Niveau et logger dans le fichier, pour les filtres de core.log_index
+        file_handler.setFormatter(
+            logging.Formatter(
+                fmt="[%(asctime)s] %(levelname)s %(name)s: %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
+        )
         root_logger.addHandler(file_handler)
 
         # Log startup info
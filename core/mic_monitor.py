@@ -8,6 +8,10 @@ import time
 import wx
 from .logHandler import log
 from .dragon_config import REQUIRE_MIC_ON, DRAGON_MIC_OFF_ERROR
+from .watchdog import get_watchdog
+
+# Délai avant de réessayer quand une autre opération tient LOADER_LOCK
+LOADER_RETRY_MS = 200
 
 
 class MicEventHandler:
@@ -70,7 +74,10 @@ class MicEventHandler:
                     self.mic_state = current_state
                     for listener in self.listeners:
                         try:
-                            listener(old_state, current_state)
+                            with get_watchdog().watch(
+                                "mic", getattr(listener, "__qualname__", "listener")
+                            ):
+                                listener(old_state, current_state)
                         except Exception as e:
                             log.error(f"Error in mic state listener: {e}")
                 return current_state
@@ -180,7 +187,11 @@ class DragonMicMonitor:
                     # Notifier tous les listeners
                     for listener in self.listeners:
                         try:
-                            wx.CallAfter(listener, new_mic_state, old_state)
+                            wx.CallAfter(
+                                get_watchdog().wrap(listener, "mic"),
+                                new_mic_state,
+                                old_state,
+                            )
                         except Exception as e:
                             log.error(f"Erreur lors de la notification listener: {e}")
 
@@ -360,6 +371,14 @@ class MicStateManager:
         if not self.grammars_active:
             self._activate_grammars()
 
+        # Réveiller les grammaires mises en veille
+        try:
+            from .hibernation import get_hibernation
+
+            get_hibernation().resume()
+        except Exception as e:
+            log.warning(f"Réveil des grammaires impossible: {e}")
+
     def _handle_mic_off(self):
         """Gérer la désactivation du micro Dragon."""
         log.info("🔴 Micro Dragon désactivé - pause des grammaires")
@@ -387,12 +406,19 @@ class MicStateManager:
         """Active les grammaires FTNatlink."""
         try:
             # Réactiver les grammaires chargées
-            from core import LOADED
+            from core.grammar_loader import LOADED, LOADER_LOCK
 
-            for name, module in LOADED.items():
-                if hasattr(module, "load") and callable(module.load):
-                    module.load()
-                    log.info(f"Grammaire réactivée: {name}")
+            # Pas d'attente sur le thread wx : réessayer après l'opération en cours
+            if not LOADER_LOCK.acquire(blocking=False):
+                wx.CallLater(LOADER_RETRY_MS, self._activate_grammars)
+                return
+            try:
+                for name, module in list(LOADED.items()):
+                    if hasattr(module, "load") and callable(module.load):
+                        module.load()
+                        log.info(f"Grammaire réactivée: {name}")
+            finally:
+                LOADER_LOCK.release()
 
             self.grammars_active = True
             log.info(f"✅ {len(LOADED)} grammaire(s) activée(s)")
@@ -404,12 +430,19 @@ class MicStateManager:
         """Désactive les grammaires FTNatlink."""
         try:
             # Désactiver les grammaires chargées
-            from core import LOADED
+            from core.grammar_loader import LOADED, LOADER_LOCK
 
-            for name, module in LOADED.items():
-                if hasattr(module, "unload") and callable(module.unload):
-                    module.unload()
-                    log.info(f"Grammaire désactivée: {name}")
+            # Pas d'attente sur le thread wx : réessayer après l'opération en cours
+            if not LOADER_LOCK.acquire(blocking=False):
+                wx.CallLater(LOADER_RETRY_MS, self._deactivate_grammars)
+                return
+            try:
+                for name, module in list(LOADED.items()):
+                    if hasattr(module, "unload") and callable(module.unload):
+                        module.unload()
+                        log.info(f"Grammaire désactivée: {name}")
+            finally:
+                LOADER_LOCK.release()
 
             self.grammars_active = False
             log.info(f"⏸️ {len(LOADED)} grammaire(s) désactivée(s)")
@@ -0,0 +1,191 @@
+"""
+Suivi de la mémoire retenue par les rechargements de grammaires
+Autour d'un rechargement (reload_grammars / reload_individual_grammar), deux
+instantanés tracemalloc sont comparés après un ramasse-miettes. Chaque
+allocation restante est attribuée à l'addon du premier cadre de sa pile
+situé dans un dossier d'addon ; le reste va dans "(autres)". Un cycle
+qui libère bien tout reste proche de 0 ; un addon qui grossit à chaque
+rechargement est signalé, même lentement (quelques Ko par cycle : un
+listener jamais retiré suffit).
+
+tracemalloc ralentit les allocations : le suivi est désactivé par défaut
+(TRACE_RELOADS, enable() ou la CLI).
+
+Usage:
+    python -m core.reload_memory [cycles] [grammaire]
+"""
+
+import gc
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+from .logHandler import log
+
+TRACE_RELOADS = False
+TRACE_FRAMES = 16
+GROWTH_THRESHOLD = 4 * 1024  # octets retenus par cycle au-delà desquels un addon grossit
+GROWTH_CYCLES = 3  # cycles consécutifs en croissance avant l'avertissement
+STEADY_CYCLES = 6  # croissance lente : tous positifs sur ces cycles, total > GROWTH_THRESHOLD
+OTHERS = "(autres)"
+
+
+class ReloadMemoryTracker:
+    """Différence tracemalloc par addon autour des rechargements."""
+
+    def __init__(self, frames=TRACE_FRAMES):
+        self.frames = frames
+        self.history = {}  # addon -> [octets retenus à chaque cycle]
+        self.last_report = None
+        self._started = False  # tracemalloc démarré par nous (à arrêter dans disable)
+        self._addon_of_file = {}
+        self._lock = threading.RLock()
+
+    @property
+    def enabled(self):
+        return tracemalloc.is_tracing()
+
+    def enable(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+            log.info(f"[reload_memory] tracemalloc démarré ({self.frames} cadres)")
+
+    def disable(self):
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def _addon_of(self, filename):
+        addon = self._addon_of_file.get(filename)
+        if addon is None:
+            from .grammar_loader import ADDON_DIR
+
+            try:
+                addon = Path(filename).resolve().relative_to(ADDON_DIR.resolve()).parts[0]
+            except (ValueError, IndexError, OSError):
+                addon = ""
+            self._addon_of_file[filename] = addon
+        return addon
+
+    def _snapshot(self):
+        gc.collect()
+        return tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<unknown>"),
+            )
+        )
+
+    def attribute(self, before, after):
+        """Octets retenus par addon entre deux instantanés."""
+        retained = {}
+        for stat in after.compare_to(before, "traceback"):
+            if not stat.size_diff:
+                continue
+            owner = OTHERS
+            # Cadres du plus ancien au plus récent : le plus récent dans un addon gagne
+            for frame in reversed(stat.traceback):
+                addon = self._addon_of(frame.filename)
+                if addon:
+                    owner = addon
+                    break
+            retained[owner] = retained.get(owner, 0) + stat.size_diff
+        return retained
+
+    @contextmanager
+    def measure(self, label):
+        """`with tracker.measure("reload"):` ; rapport (dict addon -> octets) rempli à la sortie."""
+        if not self.enabled:
+            yield {}
+            return
+        with self._lock:
+            before = self._snapshot()
+            report = {}
+            try:
+                yield report
+            finally:
+                report.update(self.attribute(before, self._snapshot()))
+                self._record(label, report)
+
+    def _record(self, label, report):
+        self.last_report = (label, report)
+        for addon, size in report.items():
+            self.history.setdefault(addon, []).append(size)
+        parts = ", ".join(
+            f"{addon} {size / 1024:+.1f} Ko" for addon, size in sorted(report.items(), key=lambda kv: -abs(kv[1]))
+        )
+        log.info(f"[reload_memory] {label}: {sum(report.values()) / 1024:+.1f} Ko retenus ({parts or 'rien'})")
+        for addon in self.growing():
+            log.warning(
+                f"[reload_memory] {addon} grossit à chaque rechargement "
+                f"({self.history[addon][-1] / 1024:+.1f} Ko au dernier)"
+            )
+
+    def growing(self):
+        """
+        Addons qui grossissent : plus de GROWTH_THRESHOLD retenus à chacun des
+        GROWTH_CYCLES derniers cycles, ou croissance à chacun des STEADY_CYCLES
+        derniers cycles pour plus de GROWTH_THRESHOLD au total.
+        """
+        found = []
+        for addon, sizes in self.history.items():
+            if addon == OTHERS:
+                continue
+            recent, steady = sizes[-GROWTH_CYCLES:], sizes[-STEADY_CYCLES:]
+            if len(recent) == GROWTH_CYCLES and all(size > GROWTH_THRESHOLD for size in recent):
+                found.append(addon)
+            elif len(steady) == STEADY_CYCLES and all(size > 0 for size in steady) and sum(steady) > GROWTH_THRESHOLD:
+                found.append(addon)
+        return found
+
+    def get_stats(self):
+        return {
+            addon: {"cycles": len(sizes), "last": sizes[-1], "total": sum(sizes)}
+            for addon, sizes in self.history.items()
+        }
+
+
+_TRACKER = None
+
+
+def get_reload_tracker():
+    global _TRACKER
+    if _TRACKER is None:
+        _TRACKER = ReloadMemoryTracker()
+        if TRACE_RELOADS:
+            _TRACKER.enable()
+    return _TRACKER
+
+
+def main():
+    """Point d'entrée CLI : enchaîne des rechargements et affiche la mémoire retenue."""
+    args = sys.argv[1:]
+    if args and args[0] in ("-h", "--help"):
+        print(__doc__.strip().split("Usage:")[1].strip())
+        return
+    from .grammar_loader import load_grammars, load_individual_grammar, reload_grammars, reload_individual_grammar
+
+    cycles = int(args[0]) if args else 5
+    grammar = args[1] if len(args) > 1 else None
+    tracker = get_reload_tracker()
+    tracker.enable()
+    if grammar:
+        load_individual_grammar(grammar)
+    else:
+        load_grammars()
+    for _ in range(cycles):
+        if grammar:
+            reload_individual_grammar(grammar)
+        else:
+            reload_grammars()
+    for addon, stats in sorted(tracker.get_stats().items()):
+        print(f"{addon:30} {stats['cycles']:3} cycle(s)  dernier {stats['last'] / 1024:+9.1f} Ko  total {stats['total'] / 1024:+9.1f} Ko")
+    growing = tracker.growing()
+    print(f"En croissance: {', '.join(growing)}" if growing else "Rechargements stables")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Pipeline de mise en forme de la dictée
+Nettoyage des espaces, commandes inline (retours, tabulations), espace
+automatique et majuscules, avec un état de fin explicite : le même code sert
+au miroir de dictée (texte injecté au fil de l'eau) et au formatage hors
+ligne de transcriptions.
+"""
+
+import re
+
+from .vocabulary import builtin_automaton
+
+SENT_END_CHARS = ".!?…"
+LEADING_PUNCT = set(",.;:!?)]}%»\"'")
+
+# Nettoyage (précompilé : appelé une fois par énoncé)
+_SPACE_BEFORE = (" ,", " .", " ;", " :", " !", " ?", " )")
+_MISSING_SPACE_RE = re.compile(r"([,;:!?])(?!\s)")
+_MISSING_SPACE_SENT_RE = re.compile(r"([\.?!…])(?!\s)")
+_APOSTROPHE_RE = re.compile(r"'\s+([a-zà-öø-ÿ])")
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+_ALPHA_RE = re.compile(r"[^\W\d_]")
+_CAP_AFTER_RE = re.compile(r'([\.!\?…]\s+[«"(\[]*\s*)([a-zà-öø-ÿ])')
+
+
+class TailState:
+    """Comment se termine le texte déjà émis (espace, retour, fin de phrase...)."""
+
+    __slots__ = (
+        "ended_with_space",
+        "ended_with_newline",
+        "ended_sentence",
+        "last_char",
+        "has_injected_once",
+        "force_capital_next",
+    )
+
+    def __init__(self):
+        self.ended_with_space = True
+        self.ended_with_newline = False
+        self.ended_sentence = True
+        self.last_char = ""  # dernier caractère non-blanc émis
+        self.has_injected_once = False
+        self.force_capital_next = True  # majuscule forcée sur la toute première dictée
+
+    def to_dict(self) -> dict:
+        return {
+            "prev_ended_with_space": self.ended_with_space,
+            "prev_ended_with_newline": self.ended_with_newline,
+            "prev_ended_sentence": self.ended_sentence,
+            "prev_last_char": self.last_char,
+            "has_injected_once": self.has_injected_once,
+            "force_capital_next": self.force_capital_next,
+        }
+
+    def restore(self, state: dict):
+        self.ended_with_space = state["prev_ended_with_space"]
+        self.ended_with_newline = state["prev_ended_with_newline"]
+        self.ended_sentence = state["prev_ended_sentence"]
+        self.last_char = state["prev_last_char"]
+        self.has_injected_once = state["has_injected_once"]
+        self.force_capital_next = state["force_capital_next"]
+
+
+def clean_text(s: str) -> str:
+    """Corrige les espaces autour de la ponctuation et les apostrophes."""
+    # Espaces mal placés autour de ponctuation
+    for bad in _SPACE_BEFORE:
+        if bad in s:
+            s = s.replace(bad, bad[1:])
+    s = s.replace("( ", "(")
+    # Ajoute espace manquant après ponctuation si collée
+    s = _MISSING_SPACE_RE.sub(r"\1 ", s)
+    s = _MISSING_SPACE_SENT_RE.sub(r"\1 ", s)
+    # Fix apostrophe (jamais d'espace après ')
+    s = _APOSTROPHE_RE.sub(r"'\1", s)
+    # Réduit espaces multiples
+    return _MULTI_SPACE_RE.sub(" ", s)
+
+
+def apply_commands(s: str) -> str:
+    """Remplace les commandes inline (« nouvelle ligne », « tabulation »...) par leur caractère."""
+    return builtin_automaton().apply(s)
+
+
+def _first_alpha_index(s: str) -> int:
+    for i, ch in enumerate(s):
+        if ch.isalpha():
+            return i
+    return -1
+
+
+def _cap_after(m):
+    return m.group(1) + m.group(2).upper()
+
+
+def capitalize_sentences(s: str, state: TailState) -> str:
+    """Majuscule en début de phrase/ligne (selon l'état de fin) et après . ! ? …"""
+    if (
+        state.force_capital_next
+        or state.ended_sentence
+        or state.ended_with_newline
+        or not state.has_injected_once
+    ):
+        i = _first_alpha_index(s)
+        if i >= 0:
+            s = s[:i] + s[i].upper() + s[i + 1 :]
+    return _CAP_AFTER_RE.sub(_cap_after, s)
+
+
+def update_tail_state(state: TailState, text: str):
+    """Mémorise comment se termine le dernier envoi."""
+    if not text:
+        return
+    last_char = text[-1]
+    state.ended_with_newline = last_char == "\n"
+    state.ended_with_space = last_char.isspace()
+
+    stripped = text.rstrip()
+    state.last_char = stripped[-1] if stripped else ""
+    state.ended_sentence = state.last_char in SENT_END_CHARS
+
+    # Une lettre émise : plus de majuscule forcée la prochaine fois
+    if _ALPHA_RE.search(text):
+        state.force_capital_next = False
+
+
+def format_utterance(
+    s: str,
+    state: TailState,
+    space_fix=True,
+    prepend_space=True,
+    auto_capitalize=True,
+    vocabulary=None,
+) -> str:
+    """
+    Met en forme un énoncé selon l'état de fin (l'état n'est pas modifié).
+    `vocabulary` : automate de remplacements (commandes intégrées par défaut).
+    """
+    # 1) commandes inline + vocabulaire utilisateur en une passe, puis nettoyage
+    s = (vocabulary or builtin_automaton()).apply(s)
+    if space_fix:
+        s = clean_text(s)
+
+    # 2) espace auto sans lecture du champ
+    if prepend_space and s:
+        wants_space = (
+            not s[0].isspace()
+            and s[0] not in LEADING_PUNCT
+            and state.has_injected_once
+            and not state.ended_with_space
+            and not state.ended_with_newline
+        )
+        if wants_space:
+            # s est déjà nettoyé et ne commence ni par un blanc ni par une
+            # ponctuation : l'espace ajouté ne demande pas de second nettoyage
+            s = " " + s
+
+    # 3) majuscule auto (début, après fin de phrase, après retour, ou forcée)
+    if auto_capitalize:
+        s = capitalize_sentences(s, state)
+    return s
+
+
+def emit(s: str, state: TailState, **options) -> str:
+    """Met en forme un énoncé puis avance l'état de fin comme s'il avait été émis."""
+    s = format_utterance(s, state, **options)
+    update_tail_state(state, s)
+    state.has_injected_once = True
+    return s
@@ -0,0 +1,153 @@
+"""
+Formatage hors ligne de transcriptions Dragon
+Fait passer un fichier de transcription (un énoncé par ligne) dans le même
+pipeline que le miroir de dictée, en flux : lecture ligne à ligne, état de fin
+conservé d'un énoncé à l'autre, écriture par blocs. Plusieurs documents
+indépendants sont répartis sur les cœurs avec un pool de processus.
+
+Usage:
+    python -m core.transcript_formatter <fichier...> [-o <dossier>] [--workers N]
+    python -m core.transcript_formatter - < transcript.txt > formatted.txt
+"""
+
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from .text_pipeline import TailState, emit
+from .vocabulary import get_vocabulary
+
+WRITE_BATCH = 256  # énoncés mis en forme par écriture
+
+
+def format_stream(lines, state=None, **options):
+    """
+    Générateur : met en forme chaque énoncé (une ligne) et produit le texte émis.
+    L'état de fin (`state`) avance au fil des énoncés, comme dans le miroir.
+    """
+    if state is None:
+        state = TailState()
+    for line in lines:
+        utterance = line.strip()
+        if utterance:
+            yield emit(utterance, state, **options)
+
+
+def format_to(lines, out, state=None, **options):
+    """Écrit le texte mis en forme dans `out` par blocs ; retourne le nombre de caractères écrits."""
+    written = 0
+    batch = []
+    for piece in format_stream(lines, state, **options):
+        batch.append(piece)
+        if len(batch) >= WRITE_BATCH:
+            chunk = "".join(batch)
+            out.write(chunk)
+            written += len(chunk)
+            batch = []
+    if batch:
+        chunk = "".join(batch)
+        out.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def output_path(source, out_dir=None):
+    source = Path(source)
+    directory = Path(out_dir) if out_dir else source.parent
+    return directory / f"{source.stem}.formatted{source.suffix or '.txt'}"
+
+
+def format_file(source, destination=None):
+    """Formate un document ; retourne (source, destination, octets lus, secondes)."""
+    source = Path(source)
+    destination = Path(destination) if destination else output_path(source)
+    start = time.perf_counter()
+    with open(source, "r", encoding="utf-8", errors="replace") as src, open(
+        destination, "w", encoding="utf-8", newline=""
+    ) as dst:
+        # Vocabulaire utilisateur relu depuis sa forme compilée dans chaque processus
+        format_to(src, dst, vocabulary=get_vocabulary().automaton())
+    return str(source), str(destination), source.stat().st_size, time.perf_counter() - start
+
+
+def format_files(sources, out_dir=None, workers=None):
+    """
+    Formate des documents indépendants en parallèle (un processus par document).
+
+    Yields:
+        (source, destination, octets lus, secondes) au fur et à mesure
+    """
+    sources = [Path(s) for s in sources]
+    if out_dir:
+        Path(out_dir).mkdir(parents=True, exist_ok=True)
+    if workers is None:
+        workers = min(len(sources), os.cpu_count() or 1)
+
+    if workers <= 1 or len(sources) <= 1:
+        for source in sources:
+            yield format_file(source, output_path(source, out_dir))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(format_file, source, output_path(source, out_dir))
+            for source in sources
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _counted(lines, counter):
+    for line in lines:
+        counter[0] += len(line.encode("utf-8"))
+        yield line
+
+
+def _mb_per_s(size, seconds):
+    return (size / (1024 * 1024)) / seconds if seconds > 0 else float("inf")
+
+
+def main():
+    """Point d'entrée CLI"""
+    args = sys.argv[1:]
+    if not args or args[0] in ("-h", "--help"):
+        print(__doc__.strip().split("Usage:")[1].strip())
+        return
+
+    out_dir = None
+    workers = None
+    if "-o" in args:
+        i = args.index("-o")
+        out_dir = args[i + 1]
+        del args[i : i + 2]
+    if "--workers" in args:
+        i = args.index("--workers")
+        workers = int(args[i + 1])
+        del args[i : i + 2]
+
+    if args == ["-"]:
+        # Flux stdin -> stdout, sans charger le document en mémoire
+        stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace")
+        counter = [0]
+        start = time.perf_counter()
+        format_to(
+            _counted(stdin, counter), sys.stdout, vocabulary=get_vocabulary().automaton()
+        )
+        seconds = time.perf_counter() - start
+        print(f"{counter[0]} octets, {_mb_per_s(counter[0], seconds):.2f} MB/s", file=sys.stderr)
+        return
+
+    start = time.perf_counter()
+    total = 0
+    for source, destination, size, seconds in format_files(args, out_dir, workers):
+        total += size
+        print(f"{source} -> {destination}: {size / 1024:.1f} Ko, {_mb_per_s(size, seconds):.2f} MB/s")
+    elapsed = time.perf_counter() - start
+    print(f"Total: {len(args)} document(s), {total / (1024 * 1024):.2f} Mo, {_mb_per_s(total, elapsed):.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
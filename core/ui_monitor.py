@@ -0,0 +1,160 @@
+"""
+Détecteur de blocages du thread wx
+Un wx.Timer bat à intervalle fixe sur le thread principal ; un thread de fond
+compare l'heure du dernier battement à une horloge monotone. Quand la boucle
+d'événements ne répond plus depuis `threshold` secondes, la pile du thread
+principal est écrite dans logs/slow_actions.log. Le retard de chaque
+battement alimente un histogramme affiché dans le statut du tray.
+"""
+
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+
+from .logHandler import log
+from .watchdog import get_slow_logger
+
+STALL_THRESHOLD = 0.5  # secondes
+HEARTBEAT_INTERVAL = 0.1
+STACK_DEPTH = 15
+
+# Bornes supérieures des classes de l'histogramme (ms) ; la dernière est ouverte
+BUCKETS_MS = (16, 50, 100, 250, 500, 1000, 2000)
+
+
+class LatencyHistogram:
+    """Histogramme des retards de la boucle d'événements."""
+
+    def __init__(self, bounds=BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.max_ms = 0.0
+
+    def add(self, lag_ms):
+        for i, bound in enumerate(self.bounds):
+            if lag_ms < bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        if lag_ms > self.max_ms:
+            self.max_ms = lag_ms
+
+    @property
+    def total(self):
+        return sum(self.counts)
+
+    def labels(self):
+        lower = 0
+        for bound in self.bounds:
+            yield f"{lower}-{bound} ms"
+            lower = bound
+        yield f">= {lower} ms"
+
+    def summary(self):
+        """Texte multi-lignes pour le statut du tray."""
+        lines = [
+            f"  {label:<14} {count}"
+            for label, count in zip(self.labels(), self.counts)
+            if count
+        ]
+        lines.append(f"  max: {self.max_ms:.0f} ms")
+        return "\n".join(lines)
+
+
+class UIStallDetector:
+    """Battement wx.Timer + surveillance depuis un thread de fond."""
+
+    def __init__(self, interval=HEARTBEAT_INTERVAL, threshold=STALL_THRESHOLD):
+        self.interval = interval
+        self.threshold = threshold
+        self.histogram = LatencyHistogram()
+        self.stalls = 0
+        self._last_beat = None
+        self._reported = False
+        self._main_thread = None
+        self._timer = None
+        self._stop = threading.Event()
+        self._watcher = None
+
+    def start(self):
+        """À appeler depuis le thread wx, une fois la boucle d'événements lancée."""
+        if self._timer is not None:
+            return
+        import wx
+
+        detector = self
+
+        class _Heartbeat(wx.Timer):
+            def Notify(self):
+                detector._beat()
+
+        self._main_thread = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._timer = _Heartbeat()
+        self._timer.Start(int(self.interval * 1000))
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, daemon=True, name="UIStallWatcher")
+        self._watcher.start()
+        log.info(
+            f"[ui_monitor] battement {self.interval * 1000:.0f} ms, "
+            f"seuil de blocage {self.threshold * 1000:.0f} ms"
+        )
+
+    def stop(self):
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.Stop()
+            self._timer = None
+
+    def _beat(self):
+        now = time.monotonic()
+        lag = max(0.0, now - self._last_beat - self.interval)
+        self._last_beat = now
+        self.histogram.add(lag * 1000)
+        if self._reported:
+            self._reported = False
+            log.warning(f"[ui_monitor] boucle wx débloquée après {lag * 1000:.0f} ms")
+
+    def _watch(self):
+        while not self._stop.wait(self.interval / 2):
+            last = self._last_beat
+            if last is None or self._reported:
+                continue
+            blocked = time.monotonic() - last - self.interval
+            if blocked > self.threshold:
+                self._reported = True
+                self.stalls += 1
+                self._dump_main_stack(blocked)
+
+    def _dump_main_stack(self, blocked):
+        frame = sys._current_frames().get(self._main_thread)
+        lines = [f"ui / boucle wx bloquée depuis {blocked * 1000:.0f} ms"]
+        if frame is not None:
+            lines.extend(
+                f"    {Path(f.filename).name}:{f.lineno} {f.name}: {(f.line or '').strip()}"
+                for f in traceback.extract_stack(frame)[-STACK_DEPTH:]
+            )
+        log.warning(f"[ui_monitor] boucle wx bloquée ({blocked * 1000:.0f} ms) - pile dans slow_actions.log")
+        get_slow_logger().info("\n".join(lines))
+
+    def status_text(self):
+        """Résumé pour le statut du tray."""
+        if self._timer is None:
+            return "UI loop monitor: not running"
+        return (
+            f"UI loop latency ({self.histogram.total} beats, {self.stalls} stall(s)):\n"
+            f"{self.histogram.summary()}"
+        )
+
+
+_DETECTOR = None
+
+
+def get_ui_monitor():
+    global _DETECTOR
+    if _DETECTOR is None:
+        _DETECTOR = UIStallDetector()
+    return _DETECTOR
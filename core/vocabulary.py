@@ -0,0 +1,343 @@
+"""
+Vocabulaire utilisateur : remplacements parole -> texte en une seule passe
+Les commandes inline intégrées (« nouvelle ligne », « tabulation »...) et les
+remplacements de l'utilisateur (abréviations, noms de produits, symboles comme
+« virgule » -> « , ») sont compilés en un automate Aho-Corasick : le coût par
+énoncé dépend de la longueur du texte, pas du nombre de règles.
+
+Fichier utilisateur (core/config/vocabulary.txt, une règle par ligne) :
+    # parole = remplacement
+    virgule = ,
+    ftn = FTNatlink
+    retour chariot = \\n
+
+Une parole contenant des majuscules n'est reconnue qu'avec cette casse exacte ;
+sinon la casse est ignorée. La forme compilée est mise en cache et le fichier
+est relu automatiquement quand il change.
+
+Usage:
+    python -m core.vocabulary compile
+    python -m core.vocabulary apply "<texte>"
+"""
+
+import pickle
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+
+from .app_paths import get_data_dir
+from .logHandler import log
+
+FORMAT_VERSION = 1
+
+# Commandes inline historiques de _global_mirror.py
+BUILTIN_REPLACEMENTS = [
+    ("à la ligne", "\n"),
+    ("a la ligne", "\n"),
+    ("aller à la ligne", "\n"),
+    ("retour", "\n"),
+    ("retour à la ligne", "\n"),
+    ("retour ligne", "\n"),
+    ("nouvelle ligne", "\n"),
+    ("nouvel ligne", "\n"),
+    ("ligne suivante", "\n"),
+    ("saut de ligne", "\n"),
+    ("nouveau paragraphe", "\n\n"),
+    ("tabulation", "\t"),
+]
+
+_WS_RE = re.compile(r"\s+")
+_IRREGULAR_WS_RE = re.compile(r"\s{2,}|[^\S ]")
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "_"
+
+
+def _normalize_key(spoken):
+    return _WS_RE.sub(" ", spoken.strip())
+
+
+def _fold(text):
+    """
+    Forme de recherche : minuscules, blancs consécutifs réduits à un espace.
+    Retourne (forme, positions) où positions[i] est l'indice d'origine de
+    forme[i] (None si la forme est alignée sur le texte).
+    """
+    low = text.lower()
+    if len(low) == len(text) and not _IRREGULAR_WS_RE.search(text):
+        return low, None  # cas courant : alignement direct
+
+    chars = []
+    positions = []
+    in_space = False
+    for i, ch in enumerate(text):
+        if ch.isspace():
+            if in_space:
+                continue
+            in_space = True
+            chars.append(" ")
+        else:
+            in_space = False
+            lowered = ch.lower()
+            chars.append(lowered if len(lowered) == 1 else ch)
+        positions.append(i)
+    return "".join(chars), positions
+
+
+class PhraseAutomaton:
+    """
+    Automate Aho-Corasick sur des paroles (mots entiers), remplacement en une passe.
+    Les correspondances retenues sont les plus à gauche puis les plus longues.
+    """
+
+    def __init__(self, entries=()):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        self._entries = []  # [(clé, longueur, remplacement, casse exacte)]
+        self._index = {}  # (clé, casse exacte) -> indice dans _entries
+        for spoken, replacement in entries:
+            self._add(spoken, replacement)
+        self._build()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _add(self, spoken, replacement):
+        key = _normalize_key(spoken)
+        if not key:
+            return
+        exact = key != key.lower()
+        existing = self._index.get((key, exact))
+        if existing is not None:
+            # Une règle ultérieure (ex: fichier utilisateur) remplace la précédente
+            k, length, _, ex = self._entries[existing]
+            self._entries[existing] = (k, length, replacement, ex)
+            return
+        index = len(self._entries)
+        self._entries.append((key, len(key), replacement, exact))
+        self._index[(key, exact)] = index
+
+        state = 0
+        for ch in key.lower():
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][ch] = nxt
+            state = nxt
+        self._out[state].append(index)
+
+    def _build(self):
+        # Liens d'échec en largeur ; les sorties héritent de celles du lien d'échec
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def apply(self, text):
+        """Remplace toutes les paroles connues de `text` en un seul parcours."""
+        if not text or not self._entries:
+            return text
+        folded, positions = _fold(text)
+        goto, fail, out, entries = self._goto, self._fail, self._out, self._entries
+        size = len(folded)
+
+        best = {}  # début d'origine -> (fin d'origine, indice de règle)
+        state = 0
+        for j, ch in enumerate(folded):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            for index in out[state]:
+                key, length, _, exact = entries[index]
+                i = j - length + 1
+                # Limites de mot (seulement si la parole commence/finit par un mot)
+                if i > 0 and _is_word_char(key[0]) and _is_word_char(folded[i - 1]):
+                    continue
+                if j + 1 < size and _is_word_char(key[-1]) and _is_word_char(folded[j + 1]):
+                    continue
+                start = positions[i] if positions else i
+                end = (positions[j] if positions else j) + 1
+                if exact and _normalize_key(text[start:end]) != key:
+                    continue
+                current = best.get(start)
+                if current is None or end > current[0]:
+                    best[start] = (end, index)
+
+        if not best:
+            return text
+        parts = []
+        last = 0
+        for start in sorted(best):
+            if start < last:
+                continue  # chevauche une correspondance déjà retenue
+            end, index = best[start]
+            parts.append(text[last:start])
+            parts.append(self._with_case(text[start:end], entries[index]))
+            last = end
+        parts.append(text[last:])
+        return "".join(parts)
+
+    @staticmethod
+    def _with_case(matched, entry):
+        replacement = entry[2]
+        # Parole dictée avec majuscule (début de phrase) : le remplacement la garde
+        if (
+            not entry[3]
+            and replacement[:1].islower()
+            and matched[:1].isupper()
+        ):
+            return replacement[0].upper() + replacement[1:]
+        return replacement
+
+
+# -----------------------------
+# Fichier utilisateur
+# -----------------------------
+def parse_vocabulary(lines):
+    """Lit des lignes « parole = remplacement » (\\n, \\t et \\s sont interprétés)."""
+    entries = []
+    for number, raw in enumerate(lines, 1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        if "=" not in line:
+            log.warning(f"Vocabulaire: ligne {number} ignorée (pas de « = »): {line}")
+            continue
+        spoken, replacement = line.split("=", 1)
+        replacement = (
+            replacement.strip()
+            .replace("\\n", "\n")
+            .replace("\\t", "\t")
+            .replace("\\s", " ")
+        )
+        entries.append((spoken, replacement))
+    return entries
+
+
+_BUILTIN = None
+
+
+def builtin_automaton():
+    """Automate des seules commandes inline intégrées."""
+    global _BUILTIN
+    if _BUILTIN is None:
+        _BUILTIN = PhraseAutomaton(BUILTIN_REPLACEMENTS)
+    return _BUILTIN
+
+
+class UserVocabulary:
+    """
+    Vocabulaire utilisateur compilé, persisté et rechargé à chaud.
+
+    `automaton()` vérifie au plus toutes les `check_interval` secondes si le
+    fichier a changé ; la forme compilée est relue depuis le cache pickle tant
+    que le fichier source n'a pas bougé.
+    """
+
+    def __init__(self, path=None, cache_path=None, check_interval=1.0):
+        self.path = Path(path) if path else get_data_dir("config") / "vocabulary.txt"
+        self.cache_path = (
+            Path(cache_path) if cache_path else get_data_dir("cache") / "vocabulary.pickle"
+        )
+        self.check_interval = check_interval
+        self._automaton = None
+        self._signature = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _source_signature(self):
+        try:
+            stat = self.path.stat()
+            return (FORMAT_VERSION, str(self.path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return (FORMAT_VERSION, str(self.path), None, None)
+
+    def automaton(self):
+        now = time.monotonic()
+        if self._automaton is not None and now - self._checked_at < self.check_interval:
+            return self._automaton
+        with self._lock:
+            self._checked_at = now
+            signature = self._source_signature()
+            if self._automaton is None or signature != self._signature:
+                self._automaton = self._load(signature)
+                self._signature = signature
+            return self._automaton
+
+    def _load(self, signature):
+        if signature[2] is None:
+            return builtin_automaton()  # pas de fichier utilisateur
+
+        try:
+            with open(self.cache_path, "rb") as f:
+                cached_signature, automaton = pickle.load(f)
+            if cached_signature == signature:
+                return automaton
+        except Exception:
+            pass
+
+        start = time.perf_counter()
+        try:
+            lines = self.path.read_text(encoding="utf-8-sig").splitlines()
+        except Exception as e:
+            log.error(f"Vocabulaire illisible ({self.path}): {e}")
+            return builtin_automaton()
+        automaton = PhraseAutomaton(BUILTIN_REPLACEMENTS + parse_vocabulary(lines))
+        log.info(
+            f"Vocabulaire compilé: {len(automaton)} règle(s) en "
+            f"{(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+        try:
+            with open(self.cache_path, "wb") as f:
+                pickle.dump((signature, automaton), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            log.warning(f"Vocabulaire: cache compilé non enregistré: {e}")
+        return automaton
+
+    def apply(self, text):
+        return self.automaton().apply(text)
+
+
+_VOCABULARY = None
+
+
+def get_vocabulary():
+    """Vocabulaire utilisateur partagé."""
+    global _VOCABULARY
+    if _VOCABULARY is None:
+        _VOCABULARY = UserVocabulary()
+    return _VOCABULARY
+
+
+def main():
+    """Point d'entrée CLI"""
+    vocabulary = get_vocabulary()
+    if len(sys.argv) > 1 and sys.argv[1] == "compile":
+        automaton = vocabulary.automaton()
+        print(f"{vocabulary.path}: {len(automaton)} règle(s)")
+    elif len(sys.argv) > 2 and sys.argv[1] == "apply":
+        print(repr(vocabulary.apply(" ".join(sys.argv[2:]))))
+    else:
+        print('Usage: python -m core.vocabulary [compile|apply "<texte>"]')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""
+Chien de garde des actions lentes
+Chronomètre chaque action de grammaire et chaque callback du moteur. Quand un
+appel dépasse le seuil, un thread de surveillance échantillonne la pile du
+thread qui l'exécute (pendant qu'il est encore bloqué) et un rapport compact
+(addon, règle, durée, pile) est écrit dans logs/slow_actions.log.
+Les compteurs par règle restent en mémoire ; le chemin rapide ne coûte que
+deux lectures d'horloge et quelques accès dictionnaire.
+"""
+
+import logging
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+
+from .app_paths import get_data_dir
+from .logHandler import log
+
+SLOW_THRESHOLD = 0.25  # secondes
+SAMPLE_INTERVAL = 0.05
+STACK_DEPTH = 12
+
+
+class _Call:
+    __slots__ = ("key", "start", "depth", "stack")
+
+    def __init__(self, key, start):
+        self.key = key
+        self.start = start
+        self.depth = 1
+        self.stack = None
+
+
+class RuleStats:
+    __slots__ = ("calls", "slow", "total", "max")
+
+    def __init__(self):
+        self.calls = 0
+        self.slow = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "slow": self.slow,
+            "avg_ms": (self.total / self.calls * 1000) if self.calls else 0.0,
+            "max_ms": self.max * 1000,
+        }
+
+
+def get_slow_logger():
+    logger = logging.getLogger("FTNatlink.slow_actions")
+    if not logger.handlers:
+        try:
+            path = get_data_dir("logs") / "slow_actions.log"
+            handler = logging.FileHandler(path, mode="a", encoding="utf-8")
+            handler.setFormatter(
+                logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+            )
+            logger.addHandler(handler)
+        except Exception as e:
+            log.warning(f"[watchdog] slow_actions.log indisponible: {e}")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False  # rapport complet ici, une ligne dans le log principal
+    return logger
+
+
+def addon_of_module(module_name):
+    """Nom de l'addon (dossier) d'un module chargé, sinon le nom du module."""
+    module = sys.modules.get(module_name)
+    module_file = getattr(module, "__file__", None)
+    if module_file:
+        return Path(module_file).parent.name
+    return module_name or "?"
+
+
+class Watchdog:
+    """
+    Chronométrage des appels (le plus externe seulement par thread) et
+    échantillonnage de pile des appels qui dépassent `threshold`.
+    """
+
+    def __init__(self, threshold=SLOW_THRESHOLD, sample_interval=SAMPLE_INTERVAL):
+        self.threshold = threshold
+        self.sample_interval = sample_interval
+        self._active = {}  # id de thread -> _Call en cours
+        self._stats = {}  # (addon, règle) -> RuleStats
+        self._lock = threading.Lock()
+        self._monitor = None
+        self._logger = None
+        self.listeners = []  # callback(addon, règle, durée) à chaque appel terminé
+
+    # -----------------------------
+    # Chemin rapide
+    # -----------------------------
+    def begin(self, addon, rule):
+        tid = threading.get_ident()
+        call = self._active.get(tid)
+        if call is not None:
+            call.depth += 1  # appel imbriqué : seul l'appel externe est mesuré
+            return
+        self._active[tid] = _Call((addon, rule), time.perf_counter())
+        if self._monitor is None:
+            self._start_monitor()
+
+    def end(self):
+        tid = threading.get_ident()
+        call = self._active.get(tid)
+        if call is None:
+            return
+        call.depth -= 1
+        if call.depth:
+            return
+        del self._active[tid]
+        duration = time.perf_counter() - call.start
+
+        stats = self._stats.get(call.key)
+        if stats is None:
+            stats = self._stats.setdefault(call.key, RuleStats())
+        stats.calls += 1
+        stats.total += duration
+        if duration > stats.max:
+            stats.max = duration
+        if duration > self.threshold:
+            stats.slow += 1
+            self._report(call, duration)
+        for listener in self.listeners:
+            try:
+                listener(call.key[0], call.key[1], duration)
+            except Exception:
+                pass
+
+    def watch(self, addon, rule):
+        """Contexte chronométré : `with watchdog.watch("addon", "règle"): ...`"""
+        return _Watch(self, addon, rule)
+
+    def wrap(self, function, addon=None, rule=None):
+        """Retourne `function` chronométrée (callbacks moteur, listeners micro...)."""
+        addon = addon or addon_of_module(getattr(function, "__module__", ""))
+        rule = rule or getattr(function, "__qualname__", repr(function))
+
+        def watched(*args, **kwargs):
+            self.begin(addon, rule)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.end()
+
+        watched.__wrapped__ = function
+        watched.__name__ = getattr(function, "__name__", "watched")
+        return watched
+
+    # -----------------------------
+    # Surveillance / rapports
+    # -----------------------------
+    def _start_monitor(self):
+        with self._lock:
+            if self._monitor is not None:
+                return
+            self._monitor = threading.Thread(target=self._sample_loop, daemon=True, name="Watchdog")
+            self._monitor.start()
+
+    def _sample_loop(self):
+        while True:
+            time.sleep(self.sample_interval)
+            now = time.perf_counter()
+            late = [
+                (tid, call)
+                for tid, call in list(self._active.items())
+                if call.stack is None and now - call.start > self.threshold
+            ]
+            if not late:
+                continue
+            frames = sys._current_frames()
+            for tid, call in late:
+                frame = frames.get(tid)
+                if frame is not None:
+                    call.stack = traceback.extract_stack(frame)[-STACK_DEPTH:]
+
+    def _report(self, call, duration):
+        addon, rule = call.key
+        log.warning(f"[watchdog] action lente: {addon} / {rule} ({duration * 1000:.0f} ms)")
+        if self._logger is None:
+            self._logger = get_slow_logger()
+        lines = [f"{addon} / {rule}: {duration * 1000:.0f} ms"]
+        if call.stack:
+            lines.extend(
+                f"    {Path(f.filename).name}:{f.lineno} {f.name}: {(f.line or '').strip()}"
+                for f in call.stack
+            )
+        else:
+            lines.append("    (terminé avant échantillonnage de la pile)")
+        self._logger.info("\n".join(lines))
+
+    def get_stats(self):
+        """{(addon, règle): {calls, slow, avg_ms, max_ms}}"""
+        return {key: stats.to_dict() for key, stats in list(self._stats.items())}
+
+    def reset_stats(self):
+        self._stats = {}
+
+
+class _Watch:
+    __slots__ = ("watchdog", "addon", "rule")
+
+    def __init__(self, watchdog, addon, rule):
+        self.watchdog = watchdog
+        self.addon = addon
+        self.rule = rule
+
+    def __enter__(self):
+        self.watchdog.begin(self.addon, self.rule)
+        return self
+
+    def __exit__(self, *exc):
+        self.watchdog.end()
+        return False
+
+
+_WATCHDOG = None
+
+
+def get_watchdog():
+    global _WATCHDOG
+    if _WATCHDOG is None:
+        _WATCHDOG = Watchdog()
+    return _WATCHDOG
+
+
+# -----------------------------
+# Instrumentation du moteur
+# -----------------------------
+_INSTALLED = False
+
+
+def _action_key(data):
+    rule = data.get("_rule") if isinstance(data, dict) else None
+    if rule is None:
+        return None
+    addon = addon_of_module(type(rule).__module__)
+    return addon, getattr(rule, "name", type(rule).__name__)
+
+
+def install_hooks():
+    """
+    Chronomètre toutes les actions dragonfly (ActionBase.execute), le début
+    d'énoncé des grammaires dragonfly et les gotResults des grammaires natlink.
+    """
+    global _INSTALLED
+    if _INSTALLED:
+        return
+    _INSTALLED = True
+    watchdog = get_watchdog()
+
+    try:
+        from dragonfly.actions.action_base import ActionBase
+
+        original_execute = ActionBase.execute
+
+        def execute(self, data=None):
+            key = _action_key(data) or ("?", type(self).__name__)
+            watchdog.begin(*key)
+            try:
+                return original_execute(self, data)
+            finally:
+                watchdog.end()
+
+        ActionBase.execute = execute
+
+        from dragonfly import Grammar
+
+        original_begin = Grammar.process_begin
+
+        def process_begin(self, executable, title, handle):
+            watchdog.begin(addon_of_module(type(self).__module__), f"{self.name}.process_begin")
+            try:
+                return original_begin(self, executable, title, handle)
+            finally:
+                watchdog.end()
+
+        Grammar.process_begin = process_begin
+        log.info("[watchdog] actions dragonfly chronométrées")
+    except ImportError:
+        pass
+
+    try:
+        try:
+            from natlinkcore import natlinkutils
+        except ImportError:
+            import natlinkutils
+
+        original_results = natlinkutils.GrammarBase.resultsCallback
+
+        def resultsCallback(self, wordsAndNums, resObj):
+            watchdog.begin(addon_of_module(type(self).__module__), f"{type(self).__name__}.gotResults")
+            try:
+                return original_results(self, wordsAndNums, resObj)
+            finally:
+                watchdog.end()
+
+        natlinkutils.GrammarBase.resultsCallback = resultsCallback
+        log.info("[watchdog] callbacks natlink chronométrés")
+    except Exception:
+        pass
@@ -0,0 +1,136 @@
+"""
+Vocabulaire de sélection récolté dans la dictée
+Garde, par fenêtre, les derniers mots injectés (bornés, sans doublons) et
+les publie dans une liste dragonfly utilisée comme `<cible>` des commandes
+de sélection : la reconnaissance cherche alors dans un petit vocabulaire
+fermé au lieu d'une dictée libre. La liste n'est mise à jour que par
+différence (rien si inchangée, un seul `extend` pour des ajouts). Les mots
+les plus anciens sont évincés par lots (au-delà de `max_words`, retour à
+`max_words - evict_batch`) : le remplacement complet de la liste, seul moyen
+de retirer des mots en une mise à jour moteur, reste rare.
+"""
+
+import threading
+from collections import OrderedDict
+
+from .word_selection import word_spans
+
+
+class MemoryWordList(list):
+    """Liste en mémoire avec l'API de mise à jour d'une `dragonfly.List` (tests, Linux)."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.updates = 0
+
+    def set(self, other):
+        self[:] = other
+        self.updates += 1
+
+    def extend(self, other):
+        super().extend(other)
+        self.updates += 1
+
+
+def harvest_words(text, min_length=2):
+    """Mots prononçables de `text` (minuscules, sans élision ni chiffres), dans l'ordre."""
+    words = []
+    for word, _, _ in word_spans(text or ""):
+        if "'" in word or "’" in word:
+            continue  # "l'été" : seul "été" (sous-mot émis séparément) est une cible
+        word = word.strip("-").lower()
+        if len(word) >= min_length and not any(ch.isdigit() for ch in word):
+            words.append(word)
+    return words
+
+
+class WordHarvest:
+    """
+    Mots récemment injectés par fenêtre, publiés dans `target` pour la
+    fenêtre active.
+
+    Args:
+        target: liste à tenir à jour (ex: `dragonfly.List("cibles")`)
+        max_words: nombre de mots conservés par fenêtre (les plus récents)
+        max_windows: nombre de fenêtres mémorisées
+        evict_batch: mots évincés d'un coup quand `max_words` est dépassé
+            (par défaut 10 % de max_words)
+    """
+
+    def __init__(self, target=None, max_words=200, max_windows=20, evict_batch=None):
+        self.target = target if target is not None else MemoryWordList()
+        self.max_words = max_words
+        self.max_windows = max_windows
+        if evict_batch is None:
+            evict_batch = max(1, max_words // 10)
+        self.low_water = max(max_words - evict_batch, 0)
+        self._windows = OrderedDict()  # clé fenêtre -> OrderedDict(mot -> None)
+        self._active = None
+        self._published = set()
+        self._lock = threading.Lock()
+        self.stats = {"harvested": 0, "updates": 0, "skipped": 0, "full_sets": 0}
+
+    def _words_for(self, window_key):
+        words = self._windows.get(window_key)
+        if words is None:
+            words = self._windows[window_key] = OrderedDict()
+            while len(self._windows) > self.max_windows:
+                self._windows.popitem(last=False)
+        else:
+            self._windows.move_to_end(window_key)
+        return words
+
+    def harvest(self, window_key, text):
+        """Ajoute les mots de `text` au vocabulaire de la fenêtre et met la liste à jour."""
+        new_words = harvest_words(text)
+        if not new_words:
+            return
+        with self._lock:
+            words = self._words_for(window_key)
+            for word in new_words:
+                words[word] = None
+                words.move_to_end(word)
+            if len(words) > self.max_words:
+                while len(words) > self.low_water:
+                    words.popitem(last=False)
+            self.stats["harvested"] += len(new_words)
+            if self._active is None:
+                self._active = window_key
+            if window_key == self._active:
+                self._publish(words)
+
+    def activate(self, window_key):
+        """Publie le vocabulaire de la fenêtre devenue active."""
+        with self._lock:
+            if window_key == self._active:
+                return
+            self._active = window_key
+            words = self._windows.get(window_key)
+            self._publish(words if words is not None else ())
+
+    def words(self, window_key=None):
+        """Mots connus pour une fenêtre (la fenêtre active par défaut), du plus ancien au plus récent."""
+        with self._lock:
+            key = self._active if window_key is None else window_key
+            return list(self._windows.get(key, ()))
+
+    def clear(self):
+        with self._lock:
+            self._windows.clear()
+            self._publish(())
+
+    def _publish(self, words):
+        wanted = set(words)
+        added = [w for w in words if w not in self._published]
+        removed = self._published - wanted
+        if not added and not removed:
+            self.stats["skipped"] += 1
+            return
+        if removed:
+            # Éviction par lot ou changement de fenêtre : une seule mise à jour moteur
+            self.target.set(list(words))
+            self.stats["full_sets"] += 1
+        else:
+            self.target.extend(added)
+        self._published = wanted
+        self.stats["updates"] += 1
@@ -0,0 +1,149 @@
+"""
+Sélection de mot en un seul aller-retour
+Sélectionne une fenêtre de N mots, la copie une fois, localise la cible
+localement puis calcule les déplacements minimaux du curseur.
+"""
+
+import re
+import time
+import unicodedata
+
+from .key_compiler import parse_key_spec
+
+_WORD_RE = re.compile(r"[\w'’-]+")
+_STRIP_RE = re.compile(r"[^\w'’-]+")
+
+
+def fold_word(s: str) -> str:
+    """Forme de comparaison: minuscules, sans accents ni ponctuation périphérique."""
+    if not s:
+        return ""
+    s = unicodedata.normalize("NFD", s.strip().lower())
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    s = _STRIP_RE.sub("", s)
+    return s.strip("-'’")
+
+
+def word_spans(text: str):
+    """Retourne les mots de `text` avec leurs positions [(mot, début, fin), ...]."""
+    spans = []
+    for m in _WORD_RE.finditer(text):
+        start, end = m.start(), m.end()
+        # Apostrophes/tirets en bordure ne font pas partie du mot
+        while start < end and text[start] in "'’-":
+            start += 1
+        while end > start and text[end - 1] in "'’-":
+            end -= 1
+        if start >= end:
+            continue
+        spans.append((text[start:end], start, end))
+        # Élision ("l'été") : le mot après l'apostrophe est aussi une cible
+        cut = max(text.rfind("'", start, end), text.rfind("’", start, end))
+        if cut >= 0 and cut + 1 < end:
+            spans.append((text[cut + 1 : end], cut + 1, end))
+    return spans
+
+
+def find_nearest(text: str, target: str, cursor: int):
+    """
+    Cherche l'occurrence de `target` la plus proche de `cursor` dans `text`.
+    La comparaison ignore casse et accents ; une correspondance exacte
+    (accents compris) l'emporte à distance égale.
+    Retourne (début, fin) ou None.
+    """
+    folded = fold_word(target)
+    if not folded:
+        return None
+    exact = target.strip().lower()
+
+    best = None
+    best_key = None
+    for word, start, end in word_spans(text):
+        if fold_word(word) != folded:
+            continue
+        distance = min(abs(cursor - start), abs(cursor - end))
+        key = (distance, 0 if word.lower() == exact else 1)
+        if best_key is None or key < best_key:
+            best, best_key = (start, end), key
+    return best
+
+
+class SelectionPlan:
+    """Séquence de touches calculée pour sélectionner une cible dans la fenêtre copiée."""
+
+    def __init__(self, keys, span=None):
+        self.keys = keys  # specs dragonfly Key, ex: ["left", "right:5", "s-right:4"]
+        self.span = span  # (début, fin) dans la fenêtre, None si introuvable
+
+    @property
+    def found(self):
+        return self.span is not None
+
+
+def plan_selection(window_text: str, target: str, direction: str) -> SelectionPlan:
+    """
+    Planifie la sélection de `target` dans `window_text`.
+
+    La fenêtre vient d'être sélectionnée avec cs-left:N (direction "left",
+    curseur d'origine à la fin) ou cs-right:N (direction "right", curseur
+    d'origine au début). On réduit la sélection du côté le plus proche de la
+    cible, puis on déplace/sélectionne au caractère près.
+    """
+    text = window_text.replace("\r\n", "\n")
+    if not text:
+        # Aucune sélection obtenue (début/fin de champ) : rien à replier
+        return SelectionPlan([])
+    length = len(text)
+    cursor = length if direction == "left" else 0
+    restore = "right" if direction == "left" else "left"
+
+    span = find_nearest(text, target, cursor)
+    if span is None:
+        # Rien trouvé : replier la sélection sur le curseur d'origine
+        return SelectionPlan([restore])
+
+    start, end = span
+    if start <= length - end:
+        keys = ["left"]
+        if start:
+            keys.append(f"right:{start}")
+        keys.append(f"s-right:{end - start}")
+    else:
+        keys = ["right"]
+        if length - end:
+            keys.append(f"left:{length - end}")
+        keys.append(f"s-left:{end - start}")
+    return SelectionPlan(keys, span)
+
+
+def count_keystrokes(specs) -> int:
+    """Nombre de frappes d'une liste de specs Key (les répétitions ":N" comptent N fois)."""
+    # Même analyse que key_compiler : touche[/pause_interne][:répétition][/pause_externe]
+    return sum(press.repeat for spec in specs for press in parse_key_spec(spec))
+
+
+class SelectionReport:
+    """Mesures d'une sélection : trouvée ?, frappes envoyées, durée."""
+
+    def __init__(self, target, direction):
+        self.target = target
+        self.direction = direction
+        self.found = False
+        self.keystrokes = 0
+        self.elapsed_ms = 0.0
+        self._start = time.perf_counter()
+
+    def add_keys(self, specs):
+        self.keystrokes += count_keystrokes(specs)
+
+    def finish(self, found):
+        self.found = found
+        self.elapsed_ms = (time.perf_counter() - self._start) * 1000.0
+        return self
+
+    def __str__(self):
+        status = "trouvé" if self.found else "introuvable"
+        return (
+            f"'{self.target}' ({self.direction}): {status}, "
+            f"{self.keystrokes} touches, {self.elapsed_ms:.1f} ms"
+        )
@@ -4,6 +4,7 @@ Main frame window for the Natlink Grammar Manager
 
 import wx
 import sys
+from datetime import datetime
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -11,7 +12,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from .tabs.grammars_tab import create_grammars_tab
 from .tabs.addons_tab import create_addons_tab
+from .tabs.commands_tab import create_commands_tab
 from .tabs.log_tab import create_log_tab
+from .tabs.log_file_tab import create_log_file_tab
 from core.logHandler import log
 
 
@@ -27,12 +30,16 @@ class GrammarManagerFrame(wx.Frame):
         # Create tabs
         self.grammars_panel = create_grammars_tab(self.notebook, self)
         self.addons_panel = create_addons_tab(self.notebook, self)
+        self.commands_panel = create_commands_tab(self.notebook, self)
         self.log_panel = create_log_tab(self.notebook, self)
+        self.log_file_panel = create_log_file_tab(self.notebook, self)
 
         # Add tabs to notebook
         self.notebook.AddPage(self.grammars_panel, "📋 Grammars")
         self.notebook.AddPage(self.addons_panel, "📦 Addons")
+        self.notebook.AddPage(self.commands_panel, "🎤 Commands")
         self.notebook.AddPage(self.log_panel, "📄 Log")
+        self.notebook.AddPage(self.log_file_panel, "🔎 Log File")
 
         # Main sizer
         sizer = wx.BoxSizer(wx.VERTICAL)
@@ -54,11 +61,8 @@ class GrammarManagerFrame(wx.Frame):
         """Add message to log with timestamp"""
         # Log to centralized logging system (which includes timestamp)
         log.info(text)
-        # Also display in GUI (the centralized logging will handle timestamp formatting)
-        if hasattr(self, "log"):
-            # Get current time for GUI display
-            from datetime import datetime
-
+        # Also display in GUI: enqueue only, the Log tab's timer flushes in batches
+        # (safe from worker threads, no CallAfter per line)
+        if hasattr(self, "log_buffer"):
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            formatted_text = f"[{timestamp}] {text}"
-            self.log.AppendText(formatted_text + "\n")
+            self.log_buffer.push(f"[{timestamp}] {text}")
@@ -4,6 +4,14 @@ Tab modules for the Natlink GUI
 
 from .grammars_tab import create_grammars_tab
 from .addons_tab import create_addons_tab
+from .commands_tab import create_commands_tab
 from .log_tab import create_log_tab
+from .log_file_tab import create_log_file_tab
 
-__all__ = ['create_grammars_tab', 'create_addons_tab', 'create_log_tab']
+__all__ = [
+    'create_grammars_tab',
+    'create_addons_tab',
+    'create_commands_tab',
+    'create_log_tab',
+    'create_log_file_tab',
+]
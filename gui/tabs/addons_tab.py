@@ -89,6 +89,10 @@ def on_install(event, frame):
                     f"Addon installé avec succès : {result['name']} v{result['version']}"
                 )
                 frame.log_msg(f"Installé {result['files_installed']} fichiers Python")
+                if result.get("conflicts"):
+                    frame.log_msg(
+                        f"⚠️ {result['conflicts']} conflit(s) de commandes (voir le log)"
+                    )
             else:
                 frame.log_msg("Addon installé avec succès !")
 
@@ -0,0 +1,131 @@
+"""
+Voice commands catalog tab: search every addon command without loading grammars
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import wx
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.command_catalog import get_command_catalog
+from core.logHandler import log
+
+SEARCH_DELAY_MS = 150  # regroupe les frappes avant de lancer la recherche
+MAX_RESULTS = 1000
+
+COLUMNS = (
+    ("Commande", "spec", 260),
+    ("Addon", "addon", 120),
+    ("Grammaire", "grammar", 120),
+    ("Règle", "rule", 110),
+    ("Extras", "extras", 150),
+    ("Action", "action", 250),
+)
+
+
+class CommandsListCtrl(wx.ListCtrl):
+    """Virtual list of catalog rows."""
+
+    def __init__(self, parent):
+        super().__init__(
+            parent, style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_SINGLE_SEL
+        )
+        self.rows = []
+        for i, (label, _, width) in enumerate(COLUMNS):
+            self.InsertColumn(i, label, width=width)
+        self.SetItemCount(0)
+
+    def OnGetItemText(self, item, column):
+        try:
+            return str(self.rows[item][COLUMNS[column][1]] or "")
+        except IndexError:
+            return ""
+
+    def set_rows(self, rows):
+        self.rows = rows
+        self.SetItemCount(len(rows))
+        self.Refresh()
+
+
+def create_commands_tab(parent, frame):
+    """Create the Commands catalog tab"""
+    panel = wx.Panel(parent)
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="CommandCatalog")
+    pending = {"timer": None}
+
+    # Title
+    title = wx.StaticText(panel, label="Commandes Vocales")
+    title_font = title.GetFont()
+    title_font.PointSize += 2
+    title_font = title_font.Bold()
+    title.SetFont(title_font)
+
+    search = wx.SearchCtrl(panel)
+    search.ShowCancelButton(True)
+    search.SetDescriptiveText("Rechercher une commande, une règle, un addon...")
+    update_btn = wx.Button(panel, label="Actualiser")
+    frame.commands_list = CommandsListCtrl(panel)
+    status = wx.StaticText(panel, label="Analyse des addons...")
+
+    def run(function, done):
+        def finished(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                log.error(f"Catalogue de commandes: {e}")
+                result = e
+            wx.CallAfter(done, result)
+
+        executor.submit(function).add_done_callback(finished)
+
+    def show_rows(rows):
+        if isinstance(rows, Exception):
+            status.SetLabel(f"Erreur: {rows}")
+            return
+        frame.commands_list.set_rows(rows)
+        stats = get_command_catalog().get_stats()
+        status.SetLabel(
+            f"{len(rows)} résultat(s) sur {stats['commands']} commande(s) "
+            f"({stats['files']} fichier(s))"
+        )
+
+    def do_search():
+        pending["timer"] = None
+        text = search.GetValue()
+        catalog = get_command_catalog()
+        run(lambda: catalog.search(text, limit=MAX_RESULTS), show_rows)
+
+    def on_text(event):
+        # Une seule recherche par rafale de frappes
+        if pending["timer"] is not None:
+            pending["timer"].Stop()
+        pending["timer"] = wx.CallLater(SEARCH_DELAY_MS, do_search)
+
+    def refresh_catalog():
+        catalog = get_command_catalog()
+        run(catalog.update, lambda result: do_search())
+
+    search.Bind(wx.EVT_TEXT, on_text)
+    search.Bind(wx.EVT_SEARCHCTRL_CANCEL_BTN, lambda e: search.SetValue(""))
+    update_btn.Bind(wx.EVT_BUTTON, lambda e: refresh_catalog())
+
+    top_sizer = wx.BoxSizer(wx.HORIZONTAL)
+    top_sizer.Add(search, 1, wx.EXPAND | wx.RIGHT, 5)
+    top_sizer.Add(update_btn, 0)
+
+    # Layout
+    sizer = wx.BoxSizer(wx.VERTICAL)
+    sizer.Add(title, 0, wx.ALL, 10)
+    sizer.Add(top_sizer, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 5)
+    sizer.Add(frame.commands_list, 1, wx.EXPAND | wx.ALL, 5)
+    sizer.Add(status, 0, wx.ALL, 5)
+
+    panel.SetSizer(sizer)
+
+    # Incremental scan (only changed files are parsed), then show everything
+    refresh_catalog()
+    return panel
@@ -5,6 +5,9 @@ Grammars management tab with split-view interface
 import wx
 import json
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -12,15 +15,257 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from core.grammar_loader import (
     list_grammars,
-    load_grammars,
-    unload_grammars,
-    reload_grammars,
+    load_steps,
+    unload_steps,
+    reload_steps,
 )
 from core.logHandler import log
 
 GRAMMAR_DIR = Path(__file__).parent.parent.parent / "grammars"
 ADDON_DIR = Path(__file__).parent.parent.parent / "addons"
 
+STATUS_COLOURS = {
+    "Chargée": wx.Colour(0, 150, 0),
+    "Non chargée": wx.Colour(150, 150, 0),
+    "En cours...": wx.Colour(0, 90, 180),
+    "Échec": wx.Colour(200, 0, 0),
+}
+
+# Colonnes de la liste ; les colonnes de coût viennent de LOADED_INFO
+GRAMMAR_COLUMNS = (
+    ("Grammaire", 190),
+    ("Statut", 110),
+    ("Import (ms)", 85),
+    ("Mémoire (Ko)", 95),
+    ("Grammaires", 80),
+    ("Règles", 60),
+)
+METRIC_COLUMNS = {
+    2: ("import_ms", lambda v: f"{v:.0f}"),
+    3: ("alloc_bytes", lambda v: f"{v / 1024:.0f}"),
+    4: ("grammars", str),
+    5: ("rules", str),
+}
+
+DETAILS_CACHE_SIZE = 64
+
+
+class GrammarDetailsCache:
+    """
+    Détails des grammaires (source, métadonnées addon, commandes) indexés par
+    (chemin, mtime du fichier, mtime de addon.json) avec éviction LRU.
+    Un succès ne coûte que deux stat() ; un échec est lu dans un thread de
+    fond et le résultat renvoyé au thread wx par wx.CallAfter.
+    """
+
+    def __init__(self, max_entries=DETAILS_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # clé -> détails
+        self._paths = {}  # nom de grammaire -> Path
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="GrammarDetails"
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(path):
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return None
+        try:
+            addon_mtime = (path.parent / "addon.json").stat().st_mtime_ns
+        except OSError:
+            addon_mtime = None
+        return (str(path), mtime, addon_mtime)
+
+    def get(self, grammar_stem):
+        """Cached details or None (fast, safe on the wx thread)."""
+        path = self._paths.get(grammar_stem)
+        key = self._key(path) if path is not None else None
+        with self._lock:
+            details = self._entries.get(key) if key is not None else None
+            if details is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return details
+
+    def load(self, grammar_stem):
+        """Locate and read a grammar, store and return its details."""
+        path = self._paths.get(grammar_stem)
+        if path is None or not path.exists():
+            path = find_grammar_file(grammar_stem)
+        if path is None:
+            self._paths.pop(grammar_stem, None)
+            return {
+                "file": None,
+                "text": (
+                    f"Grammar file not found: {grammar_stem}\n\n"
+                    f"Searched in:\n"
+                    f"  • grammars/{grammar_stem}.py\n"
+                    f"  • grammars/*/{grammar_stem}.py\n"
+                    f"  • addons/*/{grammar_stem}.py"
+                ),
+            }
+        self._paths[grammar_stem] = path
+
+        key = self._key(path)
+        with self._lock:
+            details = self._entries.get(key)
+            if details is not None:
+                self._entries.move_to_end(key)
+                return details
+        details = read_grammar_details(path)
+        with self._lock:
+            self._entries[key] = details
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return details
+
+    def request(self, grammar_stem, callback):
+        """Load in the background, then call callback(name, details) on the wx thread."""
+
+        def done(future):
+            try:
+                details = future.result()
+            except Exception as e:
+                details = {"file": None, "text": f"Error reading grammar:\n{e}"}
+            wx.CallAfter(callback, grammar_stem, details)
+
+        self._executor.submit(self.load, grammar_stem).add_done_callback(done)
+
+    def prefetch(self, grammar_names):
+        """Warm the cache (most recent names kept if over the limit)."""
+        for name in list(grammar_names)[-self.max_entries :]:
+            self._executor.submit(self.load, name)
+
+
+class GrammarTaskRunner:
+    """
+    Exécute les opérations de chargement/déchargement sans figer l'interface.
+    Une seule opération tourne à la fois ; les suivantes attendent dans une
+    file où un doublon (même opération, même grammaire) est fusionné avec
+    celle déjà prévue ou en cours. Un thread de fond ne fait que découvrir et
+    lire les fichiers (fonctions *_steps du loader) ; les imports et les
+    appels au moteur restent sur le thread wx, une grammaire par wx.CallAfter :
+    la jauge, le bouton Annuler, le micro et le tray sont servis entre deux.
+    """
+
+    def __init__(self, frame):
+        self.frame = frame
+        self._lock = threading.Lock()
+        self._queue = []  # [(clé, libellé, planificateur, args)]
+        self._current = None
+        self._cancel = threading.Event()
+
+    @property
+    def busy(self):
+        return self._current is not None
+
+    def submit(self, key, label, planner, *args):
+        """Planifie `planner(*args)` -> (étapes, fin) du loader ; False si fusionnée."""
+        with self._lock:
+            if key == self._current or any(item[0] == key for item in self._queue):
+                coalesced = True
+            else:
+                coalesced = False
+                self._queue.append((key, label, planner, args))
+                start = self._current is None
+        if coalesced:
+            self.frame.log_msg(f"{label} : déjà en cours ou prévu, demande ignorée")
+            return False
+        if start:
+            self._start_next()
+        else:
+            self.frame.log_msg(f"{label} : en attente de l'opération en cours")
+        return True
+
+    def cancel(self):
+        """Vide la file et interrompt l'opération en cours avant la grammaire suivante."""
+        with self._lock:
+            dropped = len(self._queue)
+            self._queue = []
+            running = self._current is not None
+        if running:
+            self._cancel.set()
+            self.frame.log_msg(
+                f"Annulation demandée ({dropped} opération(s) en attente abandonnée(s))"
+            )
+
+    def _start_next(self):
+        with self._lock:
+            if not self._queue:
+                self._current = None
+                return
+            key, label, planner, args = self._queue.pop(0)
+            self._current = key
+        self._cancel.clear()
+        _set_busy(self.frame, label)
+        threading.Thread(
+            target=self._plan,
+            args=(label, planner, args),
+            daemon=True,
+            name="GrammarTask",
+        ).start()
+
+    def _plan(self, label, planner, args):
+        # Thread de fond : découverte et lecture des fichiers seulement
+        try:
+            steps, finish = planner(*args)
+        except Exception as e:
+            log.error(f"{label} a échoué: {e}")
+            wx.CallAfter(self._finished, label, e, None, 0)
+            return
+        total = sum(1 for name, _ in steps if name)
+        wx.CallAfter(self._step, label, steps, finish, 0, 0, total, 0)
+
+    def _step(self, label, steps, finish, index, done, total, failures):
+        # Thread wx : une étape (une grammaire) par appel
+        if self._cancel.is_set() or index >= len(steps):
+            self._finished(label, None, finish, failures)
+            return
+        name, function = steps[index]
+        if name:
+            _on_progress(self.frame, done, total, name, "En cours...")
+        try:
+            ok = function()
+        except Exception as e:
+            log.error(f"{label} : {name or 'préparation'} a échoué: {e}")
+            ok = False
+        if name:
+            from core import LOADED
+
+            done += 1
+            failures += ok is False
+            status = "Échec" if ok is False else ("Chargée" if name in LOADED else "Non chargée")
+            _on_progress(self.frame, done, total, name, status)
+        elif ok is False:
+            self._finished(label, RuntimeError("préparation refusée"), finish, failures)
+            return
+        wx.CallAfter(self._step, label, steps, finish, index + 1, done, total, failures)
+
+    def _finished(self, label, error, finish, failures):
+        if finish is not None:
+            try:
+                finish()
+            except Exception as e:
+                log.error(f"{label} : fin d'opération: {e}")
+        if error is not None:
+            self.frame.log_msg(f"{label} : erreur ({error})")
+        elif self._cancel.is_set():
+            self.frame.log_msg(f"{label} : annulé")
+        elif failures:
+            self.frame.log_msg(f"{label} : terminé, {failures} échec(s)")
+        else:
+            self.frame.log_msg(f"{label} : terminé")
+        _set_idle(self.frame)
+        refresh_statuses(self.frame)
+        self._start_next()
+
 
 def find_grammar_file(grammar_name):
     """Find grammar file in any of the three locations."""
@@ -71,8 +316,22 @@ def create_grammars_tab(parent, frame):
     left_title.SetFont(left_title_font)
 
     # Grammar list
-    frame.grammar_list = wx.ListBox(left_panel, style=wx.LB_SINGLE)
-    frame.grammar_list.Bind(wx.EVT_LISTBOX, lambda e: on_grammar_selected(e, frame))
+    frame.grammar_list = wx.ListCtrl(
+        left_panel, style=wx.LC_REPORT | wx.LC_SINGLE_SEL
+    )
+    for i, (label, width) in enumerate(GRAMMAR_COLUMNS):
+        frame.grammar_list.InsertColumn(i, label, width=width)
+    frame.grammar_sort = (0, False)  # (colonne, décroissant)
+    frame.grammar_names = []
+    frame.grammar_list.Bind(
+        wx.EVT_LIST_COL_CLICK, lambda e: on_column_click(e, frame)
+    )
+    frame.grammar_list.Bind(
+        wx.EVT_LIST_ITEM_SELECTED, lambda e: on_grammar_selected(e, frame)
+    )
+    frame.grammar_list.Bind(
+        wx.EVT_LIST_ITEM_DESELECTED, lambda e: on_grammar_selected(e, frame)
+    )
 
     # Buttons
     list_btn = wx.Button(left_panel, label="Actualiser")
@@ -92,11 +351,30 @@ def create_grammars_tab(parent, frame):
     button_sizer.Add(load_btn, 0, wx.EXPAND)
     button_sizer.Add(reload_btn, 0, wx.EXPAND)
     button_sizer.Add(unload_btn, 0, wx.EXPAND)
+    frame.grammar_action_buttons = [load_btn, reload_btn, unload_btn]
+
+    # Progress of the background operation
+    frame.grammar_task_label = wx.StaticText(left_panel, label="")
+    frame.grammar_gauge = wx.Gauge(left_panel, range=100)
+    frame.grammar_cancel_btn = wx.Button(left_panel, label="Annuler")
+    frame.grammar_cancel_btn.Enable(False)
+    frame.grammar_cancel_btn.Bind(
+        wx.EVT_BUTTON, lambda e: frame.grammar_tasks.cancel()
+    )
+    frame.grammar_tasks = GrammarTaskRunner(frame)
+    frame.grammar_failed = set()
+    frame.grammar_details_cache = GrammarDetailsCache()
+
+    progress_sizer = wx.BoxSizer(wx.HORIZONTAL)
+    progress_sizer.Add(frame.grammar_gauge, 1, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+    progress_sizer.Add(frame.grammar_cancel_btn, 0)
 
     left_sizer = wx.BoxSizer(wx.VERTICAL)
     left_sizer.Add(left_title, 0, wx.ALL, 10)
     left_sizer.Add(frame.grammar_list, 1, wx.EXPAND | wx.ALL, 5)
     left_sizer.Add(button_sizer, 0, wx.EXPAND | wx.ALL, 5)
+    left_sizer.Add(frame.grammar_task_label, 0, wx.LEFT | wx.RIGHT | wx.TOP, 5)
+    left_sizer.Add(progress_sizer, 0, wx.EXPAND | wx.ALL, 5)
 
     left_panel.SetSizer(left_sizer)
 
@@ -194,22 +472,136 @@ def create_grammars_tab(parent, frame):
     return panel
 
 
+def _grammar_status(frame, name):
+    from core import LOADED
+
+    if name in frame.grammar_failed:
+        return "Échec"
+    return "Chargée" if name in LOADED else "Non chargée"
+
+
+def _sorted_grammars(frame, grammars):
+    from core import LOADED_INFO
+
+    column, descending = frame.grammar_sort
+    if column == 0:
+        return sorted(grammars, key=str.lower, reverse=descending)
+    if column == 1:
+        return sorted(grammars, key=lambda name: (_grammar_status(frame, name), name.lower()), reverse=descending)
+    # Grammaires non chargées (sans mesure) toujours en bas
+    key = METRIC_COLUMNS[column][0]
+    measured = sorted(
+        (name for name in grammars if name in LOADED_INFO),
+        key=lambda name: LOADED_INFO[name][key],
+        reverse=descending,
+    )
+    return measured + sorted((name for name in grammars if name not in LOADED_INFO), key=str.lower)
+
+
+def populate_grammar_list(frame, grammars):
+    """Fill the list with one row per grammar, its load status and its load cost."""
+    column, descending = frame.grammar_sort
+    frame.grammar_names = list(grammars)
+    frame.grammar_list.DeleteAllItems()
+    frame.grammar_rows = {}
+    if not grammars:
+        frame.grammar_list.InsertItem(0, "(No grammars found)")
+        return
+    for g in _sorted_grammars(frame, grammars):
+        index = frame.grammar_list.InsertItem(frame.grammar_list.GetItemCount(), g)
+        frame.grammar_rows[g] = index
+        set_grammar_status(frame, g, _grammar_status(frame, g))
+        set_grammar_metrics(frame, g)
+    if hasattr(frame.grammar_list, "ShowSortIndicator"):
+        frame.grammar_list.ShowSortIndicator(column, not descending)
+    frame.grammar_details_cache.prefetch(grammars)
+
+
+def set_grammar_metrics(frame, grammar_name):
+    """Import time, allocations, grammar and rule counts measured at load."""
+    from core import LOADED_INFO
+
+    index = getattr(frame, "grammar_rows", {}).get(grammar_name)
+    if index is None:
+        return
+    info = LOADED_INFO.get(grammar_name)
+    for column, (key, fmt) in METRIC_COLUMNS.items():
+        frame.grammar_list.SetItem(index, column, fmt(info[key]) if info else "")
+
+
+def on_column_click(event, frame):
+    """Sort by the clicked column ; cost columns start with the heaviest."""
+    column = event.GetColumn()
+    current, descending = frame.grammar_sort
+    frame.grammar_sort = (column, not descending if column == current else column >= 2)
+    selected = getattr(frame, "selected_grammar", None)
+    populate_grammar_list(frame, frame.grammar_names)
+    index = frame.grammar_rows.get(selected)
+    if index is not None:
+        frame.grammar_list.Select(index)
+        frame.grammar_list.EnsureVisible(index)
+
+
+def set_grammar_status(frame, grammar_name, status):
+    index = getattr(frame, "grammar_rows", {}).get(grammar_name)
+    if index is None:
+        return
+    frame.grammar_list.SetItem(index, 1, status)
+    frame.grammar_list.SetItemTextColour(
+        index, STATUS_COLOURS.get(status, wx.Colour(0, 0, 0))
+    )
+
+
+def refresh_statuses(frame):
+    """Re-read LOADED once an operation ends and update rows + details panel."""
+    from core import LOADED
+
+    failed = frame.grammar_failed
+    for name in getattr(frame, "grammar_rows", {}):
+        if name in failed:
+            continue  # garder l'échec visible jusqu'à la prochaine opération sur cette grammaire
+        set_grammar_status(frame, name, "Chargée" if name in LOADED else "Non chargée")
+    for name in getattr(frame, "grammar_rows", {}):
+        set_grammar_metrics(frame, name)
+    if getattr(frame, "selected_grammar", None):
+        update_selected_status(frame)
+
+
+def _on_progress(frame, done, total, name, status):
+    failed = frame.grammar_failed
+    if status == "Échec":
+        failed.add(name)
+    else:
+        failed.discard(name)
+    set_grammar_status(frame, name, status)
+    frame.grammar_gauge.SetRange(max(total, 1))
+    frame.grammar_gauge.SetValue(min(done, total))
+
+
+def _set_busy(frame, label):
+    frame.grammar_task_label.SetLabel(f"{label}...")
+    frame.grammar_gauge.SetValue(0)
+    frame.grammar_cancel_btn.Enable(True)
+    update_selected_status(frame)
+
+
+def _set_idle(frame):
+    frame.grammar_task_label.SetLabel("")
+    frame.grammar_gauge.SetValue(0)
+    frame.grammar_cancel_btn.Enable(False)
+
+
 def auto_refresh_grammars(frame):
     """Automatically refresh the grammar list after app startup"""
     try:
         # Populate the grammar list automatically
         grammars = list_grammars()
+        populate_grammar_list(frame, grammars)
 
         if grammars:
-            frame.grammar_list.Clear()
-            for g in grammars:
-                frame.grammar_list.Append(f"{g}")
-
             frame.log_msg(f"Trouvé {len(grammars)} grammaire(s) dans la liste")
             log.info(f"Auto-refreshed grammar list: {len(grammars)} grammars found")
         else:
-            frame.grammar_list.Clear()
-            frame.grammar_list.Append("(No grammars found)")
             frame.log_msg("Aucune grammaire trouvée dans le dossier grammaires/")
             log.info("Auto-refresh: No grammars found")
 
@@ -222,7 +614,8 @@ def auto_refresh_grammars(frame):
 
 def on_grammar_selected(event, frame):
     """Display details when a grammar is selected"""
-    selection = frame.grammar_list.GetStringSelection()
+    index = frame.grammar_list.GetFirstSelected()
+    selection = frame.grammar_list.GetItemText(index, 0) if index != -1 else ""
     if not selection or selection == "(No grammars found)":
         frame.grammar_name_label.SetLabel("Grammar Details")
         frame.grammar_status_label.SetLabel("Status: Not selected")
@@ -245,39 +638,26 @@ def on_grammar_selected(event, frame):
     frame.selected_grammar = grammar_stem
 
     # Check if grammar is loaded and update status
-    from core import LOADED
-
-    is_loaded = grammar_stem in LOADED
+    update_selected_status(frame)
 
-    if is_loaded:
-        frame.grammar_status_label.SetLabel("Status: Loaded")
-        frame.grammar_status_label.SetForegroundColour(wx.Colour(0, 150, 0))
-
-        # Enable unload and reload, disable load
-        frame.individual_load_btn.Enable(False)
-        frame.individual_unload_btn.Enable(True)
-        frame.individual_reload_btn.Enable(True)
+    # Details come from the cache ; on a miss they are read in the background
+    cache = frame.grammar_details_cache
+    details = cache.get(grammar_stem)
+    if details is not None:
+        frame.grammar_details.SetValue(details["text"])
     else:
-        frame.grammar_status_label.SetLabel("Status: Not loaded")
-        frame.grammar_status_label.SetForegroundColour(wx.Colour(150, 150, 0))
+        frame.grammar_details.SetValue("Chargement des détails...")
+        cache.request(grammar_stem, lambda name, d: _show_details(frame, name, d))
 
-        # Enable load, disable unload and reload
-        frame.individual_load_btn.Enable(True)
-        frame.individual_unload_btn.Enable(False)
-        frame.individual_reload_btn.Enable(False)
 
-    # Find grammar file in any of the three locations
-    grammar_file = find_grammar_file(grammar_stem)
-    if not grammar_file:
-        frame.grammar_details.SetValue(
-            f"Grammar file not found: {grammar_stem}\n\n"
-            f"Searched in:\n"
-            f"  • grammars/{grammar_stem}.py\n"
-            f"  • grammars/*/{grammar_stem}.py\n"
-            f"  • addons/*/{grammar_stem}.py"
-        )
-        return
+def _show_details(frame, grammar_stem, details):
+    # Ignore a late result if the selection moved on meanwhile
+    if getattr(frame, "selected_grammar", None) == grammar_stem:
+        frame.grammar_details.SetValue(details["text"])
+
 
+def read_grammar_details(grammar_file):
+    """Read source, addon metadata and voice commands of a grammar file (worker thread)."""
     # Get the grammar name with extension for addon search
     grammar_name = grammar_file.name
 
@@ -287,6 +667,7 @@ def on_grammar_selected(event, frame):
             content = f.read()
 
         # Extract information
+        commands = []
         details = []
         details.append(f"File: {grammar_file.name}")
         details.append(f"Location: {grammar_file.parent}")
@@ -330,6 +711,7 @@ def on_grammar_selected(event, frame):
                                 details.append("🎤 Voice Commands:")
                                 for key in node.value.keys:
                                     if isinstance(key, ast.Constant):
+                                        commands.append(key.value)
                                         details.append(f'   • "{key.value}"')
                                 details.append("")
                                 break
@@ -390,43 +772,70 @@ def on_grammar_selected(event, frame):
 
             details.append("")
 
-        # Display the details
-        frame.grammar_details.SetValue("\n".join(details))
+        return {
+            "file": grammar_file,
+            "size": len(content),
+            "addon": addon_info,
+            "commands": commands,
+            "text": "\n".join(details),
+        }
 
     except Exception as e:
-        frame.grammar_details.SetValue(f"Error reading grammar:\n{str(e)}")
+        return {"file": grammar_file, "text": f"Error reading grammar:\n{str(e)}"}
+
+
+def update_selected_status(frame):
+    """Status label and individual buttons for the selected grammar."""
+    from core import LOADED
+
+    grammar_stem = getattr(frame, "selected_grammar", None)
+    if not grammar_stem:
+        return
+    is_loaded = grammar_stem in LOADED
+    idle = not frame.grammar_tasks.busy
+
+    if is_loaded:
+        frame.grammar_status_label.SetLabel("Status: Loaded")
+        frame.grammar_status_label.SetForegroundColour(wx.Colour(0, 150, 0))
+    else:
+        frame.grammar_status_label.SetLabel("Status: Not loaded")
+        frame.grammar_status_label.SetForegroundColour(wx.Colour(150, 150, 0))
+
+    # Load when not loaded, unload/reload when loaded ; the buttons stay
+    # clickable during an operation (the request is queued/coalesced)
+    frame.individual_load_btn.Enable(not is_loaded or not idle)
+    frame.individual_unload_btn.Enable(is_loaded or not idle)
+    frame.individual_reload_btn.Enable(is_loaded or not idle)
 
 
 def on_list(event, frame):
     """Refresh the grammar list"""
     grammars = list_grammars()
-    frame.grammar_list.Clear()
+    populate_grammar_list(frame, grammars)
 
     if grammars:
-        for g in grammars:
-            frame.grammar_list.Append(f"{g}")
         frame.log_msg(f"Trouvé {len(grammars)} grammaire(s)")
     else:
-        frame.grammar_list.Append("(No grammars found)")
         frame.log_msg("Aucune grammaire trouvée dans le dossier grammaires/")
 
 
 def on_load(event, frame):
-    """Load all grammars"""
-    load_grammars()
-    frame.log_msg("Grammaires chargées.")
+    """Load all grammars (celles déjà chargées sont gardées)"""
+    frame.grammar_tasks.submit("load_all", "Chargement des grammaires", load_steps)
 
 
 def on_reload(event, frame):
     """Reload all grammars"""
-    reload_grammars()
-    frame.log_msg("Grammaires rechargées.")
+    frame.grammar_tasks.submit(
+        "reload_all", "Rechargement des grammaires", reload_steps
+    )
 
 
 def on_unload(event, frame):
     """Unload all grammars"""
-    unload_grammars()
-    frame.log_msg("Grammaires déchargées.")
+    frame.grammar_tasks.submit(
+        "unload_all", "Déchargement des grammaires", unload_steps
+    )
 
 
 def on_individual_load(event, frame):
@@ -435,31 +844,13 @@ def on_individual_load(event, frame):
         frame.log_msg("Aucune grammaire sélectionnée")
         return
 
-    try:
-        grammar_name = frame.selected_grammar
-        frame.log_msg(f"Chargement de la grammaire : {grammar_name}...")
-
-        # Import individual grammar loading function
-        from core.grammar_loader import load_individual_grammar
-
-        success = load_individual_grammar(grammar_name)
-        if success:
-            frame.log_msg(f"Grammaire chargée avec succès : {grammar_name}")
-
-            # Update status display
-            frame.grammar_status_label.SetLabel("Status: Loaded")
-            frame.grammar_status_label.SetForegroundColour(wx.Colour(0, 150, 0))
-
-            # Update button states
-            frame.individual_load_btn.Enable(False)
-            frame.individual_unload_btn.Enable(True)
-            frame.individual_reload_btn.Enable(True)
-        else:
-            frame.log_msg(f"Échec du chargement de la grammaire : {grammar_name}")
-
-    except Exception as e:
-        log.error(f"Error loading individual grammar: {e}")
-        frame.log_msg(f"Erreur lors du chargement de la grammaire : {e}")
+    grammar_name = frame.selected_grammar
+    frame.grammar_tasks.submit(
+        ("load", grammar_name),
+        f"Chargement de la grammaire {grammar_name}",
+        load_steps,
+        [grammar_name],
+    )
 
 
 def on_individual_unload(event, frame):
@@ -468,31 +859,13 @@ def on_individual_unload(event, frame):
         frame.log_msg("Aucune grammaire sélectionnée")
         return
 
-    try:
-        grammar_name = frame.selected_grammar
-        frame.log_msg(f"Déchargement de la grammaire : {grammar_name}...")
-
-        # Import individual grammar unloading function
-        from core.grammar_loader import unload_individual_grammar
-
-        success = unload_individual_grammar(grammar_name)
-        if success:
-            frame.log_msg(f"Grammaire déchargée avec succès : {grammar_name}")
-
-            # Update status display
-            frame.grammar_status_label.SetLabel("Status: Not loaded")
-            frame.grammar_status_label.SetForegroundColour(wx.Colour(150, 150, 0))
-
-            # Update button states
-            frame.individual_load_btn.Enable(True)
-            frame.individual_unload_btn.Enable(False)
-            frame.individual_reload_btn.Enable(False)
-        else:
-            frame.log_msg(f"Échec du déchargement de la grammaire : {grammar_name}")
-
-    except Exception as e:
-        log.error(f"Error unloading individual grammar: {e}")
-        frame.log_msg(f"Erreur lors du déchargement de la grammaire : {e}")
+    grammar_name = frame.selected_grammar
+    frame.grammar_tasks.submit(
+        ("unload", grammar_name),
+        f"Déchargement de la grammaire {grammar_name}",
+        unload_steps,
+        [grammar_name],
+    )
 
 
 def on_individual_reload(event, frame):
@@ -501,23 +874,10 @@ def on_individual_reload(event, frame):
         frame.log_msg("Aucune grammaire sélectionnée")
         return
 
-    try:
-        grammar_name = frame.selected_grammar
-        frame.log_msg(f"Rechargement de la grammaire : {grammar_name}...")
-
-        # Import individual grammar reloading function
-        from core.grammar_loader import reload_individual_grammar
-
-        success = reload_individual_grammar(grammar_name)
-        if success:
-            frame.log_msg(f"Grammaire rechargée avec succès : {grammar_name}")
-
-            # Status should remain loaded
-            frame.grammar_status_label.SetLabel("Status: Loaded")
-            frame.grammar_status_label.SetForegroundColour(wx.Colour(0, 150, 0))
-        else:
-            frame.log_msg(f"Failed to reload grammar: {grammar_name}")
-
-    except Exception as e:
-        log.error(f"Error reloading individual grammar: {e}")
-        frame.log_msg(f"Error reloading grammar: {e}")
+    grammar_name = frame.selected_grammar
+    frame.grammar_tasks.submit(
+        ("reload", grammar_name),
+        f"Rechargement de la grammaire {grammar_name}",
+        reload_steps,
+        [grammar_name],
+    )
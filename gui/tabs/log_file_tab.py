@@ -0,0 +1,187 @@
+"""
+Log file browser tab: indexed search in ftnatlink.log (see core.log_index)
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+import wx
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.log_index import LEVELS, LogIndex
+from core.logHandler import log
+
+PAGE_SIZE = 500  # résultats lus par clic sur "Rechercher" / "Suite"
+
+
+class LogResultsCtrl(wx.ListCtrl):
+    """Virtual list of LogRecord results."""
+
+    def __init__(self, parent):
+        super().__init__(
+            parent, style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_SINGLE_SEL
+        )
+        self.records = []
+        self.InsertColumn(0, "Heure", width=140)
+        self.InsertColumn(1, "Niveau", width=70)
+        self.InsertColumn(2, "Logger", width=150)
+        self.InsertColumn(3, "Message", width=500)
+        self.SetItemCount(0)
+
+    def OnGetItemText(self, item, column):
+        try:
+            record = self.records[item]
+        except IndexError:
+            return ""
+        if column == 0:
+            return record.time
+        if column == 1:
+            return record.level or ""
+        if column == 2:
+            return record.logger or ""
+        return record.message.replace("\n", " ⏎ ")
+
+    def set_records(self, records):
+        self.records = records
+        self.SetItemCount(len(records))
+        self.Refresh()
+
+
+class LogFileBrowser:
+    """Index + search state of the tab ; all file access runs on one worker thread."""
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.index = None
+        self._results = None  # générateur de la recherche en cours
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LogIndex")
+
+    def _run(self, function, done, *args):
+        def finished(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                log.error(f"Log index: {e}")
+                result = e
+            wx.CallAfter(done, result)
+
+        self._executor.submit(function, *args).add_done_callback(finished)
+
+    def _refresh(self):
+        if self.index is None:
+            self.index = LogIndex()
+        self.index.refresh()
+        return self.index.get_stats()
+
+    def refresh(self):
+        self._run(self._refresh, self._show_stats)
+
+    def _show_stats(self, stats):
+        if isinstance(stats, Exception):
+            self.frame.log_file_status.SetLabel(f"Erreur: {stats}")
+            return
+        self.frame.log_file_status.SetLabel(
+            f"{stats['path']} - {stats['size'] / (1024 * 1024):.1f} Mo, "
+            f"{stats['lines']} lignes ({stats['first'] or '?'} -> {stats['last'] or '?'})"
+        )
+
+    def _search(self, criteria):
+        self._refresh()
+        self._results = self.index.search(**criteria)
+        return list(islice(self._results, PAGE_SIZE))
+
+    def _more(self):
+        if self._results is None:
+            return []
+        return list(islice(self._results, PAGE_SIZE))
+
+    def search(self, criteria):
+        self.frame.log_file_results.set_records([])
+        self.frame.log_file_status.SetLabel("Recherche...")
+        self._run(self._search, lambda page: self._show_page(page, reset=True), criteria)
+
+    def more(self):
+        self._run(self._more, lambda page: self._show_page(page, reset=False))
+
+    def _show_page(self, page, reset):
+        results = self.frame.log_file_results
+        if isinstance(page, Exception):
+            self.frame.log_file_status.SetLabel(f"Erreur: {page}")
+            return
+        records = page if reset else results.records + page
+        results.set_records(records)
+        more = len(page) == PAGE_SIZE
+        self.frame.log_file_more_btn.Enable(more)
+        self.frame.log_file_status.SetLabel(
+            f"{len(records)} résultat(s){' (Suite pour continuer)' if more else ''}"
+        )
+
+
+def create_log_file_tab(parent, frame):
+    """Create the Log File browser tab"""
+    panel = wx.Panel(parent)
+    browser = frame.log_file_browser = LogFileBrowser(frame)
+
+    # Title
+    title = wx.StaticText(panel, label="Log File")
+    title_font = title.GetFont()
+    title_font.PointSize += 2
+    title_font = title_font.Bold()
+    title.SetFont(title_font)
+
+    # Filters
+    since = wx.TextCtrl(panel, size=(140, -1))
+    since.SetHint("AAAA-MM-JJ HH:MM:SS")
+    level = wx.Choice(panel, choices=["(tous)"] + list(LEVELS))
+    level.SetSelection(0)
+    logger = wx.TextCtrl(panel, size=(120, -1))
+    text = wx.TextCtrl(panel, style=wx.TE_PROCESS_ENTER)
+    search_btn = wx.Button(panel, label="Rechercher")
+    frame.log_file_more_btn = wx.Button(panel, label="Suite")
+    frame.log_file_more_btn.Enable(False)
+
+    def on_search(event):
+        criteria = {
+            "since": since.GetValue().strip() or None,
+            "level": level.GetStringSelection() if level.GetSelection() > 0 else None,
+            "logger": logger.GetValue().strip() or None,
+            "text": text.GetValue() or None,
+        }
+        browser.search(criteria)
+
+    search_btn.Bind(wx.EVT_BUTTON, on_search)
+    text.Bind(wx.EVT_TEXT_ENTER, on_search)
+    frame.log_file_more_btn.Bind(wx.EVT_BUTTON, lambda e: browser.more())
+
+    filter_sizer = wx.BoxSizer(wx.HORIZONTAL)
+    for label, control in (
+        ("Depuis", since),
+        ("Niveau min.", level),
+        ("Logger", logger),
+        ("Texte", text),
+    ):
+        filter_sizer.Add(wx.StaticText(panel, label=label), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 3)
+        filter_sizer.Add(control, 1 if control is text else 0, wx.RIGHT, 8)
+    filter_sizer.Add(search_btn, 0, wx.RIGHT, 3)
+    filter_sizer.Add(frame.log_file_more_btn, 0)
+
+    # Results
+    frame.log_file_results = LogResultsCtrl(panel)
+    frame.log_file_status = wx.StaticText(panel, label="Indexation...")
+
+    # Layout
+    sizer = wx.BoxSizer(wx.VERTICAL)
+    sizer.Add(title, 0, wx.ALL, 10)
+    sizer.Add(filter_sizer, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 5)
+    sizer.Add(frame.log_file_results, 1, wx.EXPAND | wx.ALL, 5)
+    sizer.Add(frame.log_file_status, 0, wx.ALL, 5)
+
+    panel.SetSizer(sizer)
+
+    # Build / extend the index in the background
+    browser.refresh()
+    return panel
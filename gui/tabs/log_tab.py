@@ -1,33 +1,138 @@
 """
 Activity log tab for displaying application messages
+
+Messages are appended to a lock-free queue (any thread), moved in batches
+into a fixed-capacity ring buffer by a wx.Timer, and shown by a virtual
+list control that only renders the visible rows.
 """
 
+import collections
+
 import wx
 
+LOG_CAPACITY = 5000  # lignes conservées
+FLUSH_INTERVAL_MS = 150
+
+
+class LogRingBuffer:
+    """Tampon circulaire de capacité fixe, indexable en O(1) du plus ancien au plus récent."""
+
+    def __init__(self, capacity=LOG_CAPACITY):
+        self.capacity = capacity
+        self._items = [None] * capacity
+        self._start = 0
+        self._count = 0
+        # File d'attente des producteurs : deque.append est atomique, aucun verrou
+        self.pending = collections.deque(maxlen=capacity)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._items[(self._start + index) % self.capacity]
+
+    def push(self, line):
+        """Enqueue a line (safe from any thread)."""
+        self.pending.append(line)
+
+    def flush(self):
+        """Move pending lines into the ring (wx thread); return how many were added."""
+        added = 0
+        while True:
+            try:
+                line = self.pending.popleft()
+            except IndexError:
+                break
+            end = (self._start + self._count) % self.capacity
+            self._items[end] = line
+            if self._count < self.capacity:
+                self._count += 1
+            else:
+                self._start = (self._start + 1) % self.capacity
+            added += 1
+        return added
+
+    def clear(self):
+        self.pending.clear()
+        self._items = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+
+
+class LogListCtrl(wx.ListCtrl):
+    """Virtual list: rows are read from the ring buffer on demand."""
+
+    def __init__(self, parent, buffer):
+        super().__init__(
+            parent,
+            style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_NO_HEADER | wx.LC_SINGLE_SEL,
+        )
+        self.buffer = buffer
+        self.InsertColumn(0, "Message")
+        self.SetItemCount(0)
+        self.Bind(wx.EVT_SIZE, self._on_size)
+
+    def OnGetItemText(self, item, column):
+        try:
+            return self.buffer[item]
+        except IndexError:
+            return ""
+
+    def _on_size(self, event):
+        self.SetColumnWidth(0, self.GetClientSize().width)
+        event.Skip()
+
+    def refresh_rows(self):
+        """Flush pending lines and keep the view pinned to the end if it was there."""
+        old_count = self.GetItemCount()
+        if not self.buffer.flush():
+            return
+        at_end = old_count == 0 or (
+            self.GetTopItem() + self.GetCountPerPage() >= old_count
+        )
+        count = len(self.buffer)
+        self.SetItemCount(count)
+        if at_end:
+            self.EnsureVisible(count - 1)
+        self.Refresh()
+
+    def clear(self):
+        self.buffer.clear()
+        self.SetItemCount(0)
+        self.Refresh()
+
 
 def create_log_tab(parent, frame):
     """Create the Log output tab"""
     panel = wx.Panel(parent)
-    
+
     # Title
     title = wx.StaticText(panel, label="Activity Log")
     title_font = title.GetFont()
     title_font.PointSize += 2
     title_font = title_font.Bold()
     title.SetFont(title_font)
-    
-    # Log text area
-    frame.log = wx.TextCtrl(panel, style=wx.TE_MULTILINE|wx.TE_READONLY|wx.TE_WORDWRAP)
-    
+
+    # Log list (virtual, bounded)
+    frame.log_buffer = LogRingBuffer()
+    frame.log = LogListCtrl(panel, frame.log_buffer)
+
+    # Batched flush to the control
+    frame.log_timer = wx.Timer(panel)
+    panel.Bind(wx.EVT_TIMER, lambda e: frame.log.refresh_rows(), frame.log_timer)
+    frame.log_timer.Start(FLUSH_INTERVAL_MS)
+
     # Clear button
     clear_btn = wx.Button(panel, label="🗑️ Clear Log")
-    clear_btn.Bind(wx.EVT_BUTTON, lambda e: frame.log.Clear())
-    
+    clear_btn.Bind(wx.EVT_BUTTON, lambda e: frame.log.clear())
+
     # Layout
     sizer = wx.BoxSizer(wx.VERTICAL)
     sizer.Add(title, 0, wx.ALL, 10)
     sizer.Add(frame.log, 1, wx.EXPAND|wx.ALL, 5)
     sizer.Add(clear_btn, 0, wx.CENTER|wx.ALL, 5)
-    
+
     panel.SetSizer(sizer)
     return panel
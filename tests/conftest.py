@@ -0,0 +1,8 @@
+"""
+Configuration pytest : le dossier du projet est importable (core, gui...)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,71 @@
+"""
+Tests des délais du pool d'actions (pool factice, aucun processus lancé)
+"""
+
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from core.action_pool import ActionAborted, ActionPool, ActionTimeout
+
+
+class FakePool:
+    def __init__(self):
+        self.terminated = False
+
+    def terminate(self):
+        self.terminated = True
+
+
+def test_hung_call_kills_its_pool_at_once():
+    action_pool = ActionPool()
+    hung_pool, other_pool = FakePool(), FakePool()
+    action_pool._pool = hung_pool
+    hung, sibling, elsewhere = Future(), Future(), Future()
+    action_pool._pending = {
+        0: (hung, "lente", 0.0, 1.0, hung_pool),
+        1: (sibling, "voisine", 0.5, 10.0, hung_pool),
+        2: (elsewhere, "ailleurs", 0.5, 10.0, other_pool),
+    }
+
+    action_pool._check_deadlines(2.0)
+
+    assert hung_pool.terminated and not other_pool.terminated
+    assert action_pool._pool is None
+    with pytest.raises(ActionTimeout):
+        hung.result(0)
+    with pytest.raises(ActionAborted):
+        sibling.result(0)
+    assert not elsewhere.done()
+    assert action_pool.pending_count() == 1
+    stats = action_pool.get_stats()
+    assert stats["lente"]["timeouts"] == 1
+    assert stats["voisine"]["errors"] == 1
+
+
+def test_first_submit_does_not_start_processes_on_caller_thread(monkeypatch):
+    action_pool = ActionPool()
+    release = threading.Event()
+    created_on = []
+    calls = []
+
+    class StartingPool(FakePool):
+        def apply_async(self, func, args, callback=None, error_callback=None):
+            calls.append(args[0])
+            # Comme multiprocessing : résultat rendu par un autre thread
+            threading.Thread(target=callback, args=(("ok", 0.0),)).start()
+
+    def create_pool():
+        created_on.append(threading.current_thread().name)
+        release.wait(5)
+        return StartingPool()
+
+    monkeypatch.setattr(action_pool, "_create_pool", create_pool)
+    future = action_pool.submit("module:fonction")
+    assert not future.done() and action_pool.pending_count() == 1
+    release.set()
+    assert future.result(5) == "ok"
+    assert created_on == ["ActionPoolStarter"]
+    assert calls == ["module:fonction"]
+    action_pool.shutdown()
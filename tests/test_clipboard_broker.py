@@ -0,0 +1,58 @@
+"""
+Tests du courtier de presse-papiers (presse-papiers en mémoire)
+"""
+
+from core.clipboard_broker import ClipboardBroker, MemoryClipboardBackend
+
+
+def make_broker(text="utilisateur", with_sequence=True):
+    backend = MemoryClipboardBackend(text, with_sequence=with_sequence)
+    return backend, ClipboardBroker(backend, quiet_period=60, sleep=lambda s: None)
+
+
+def test_burst_saves_once_and_restores():
+    backend, broker = make_broker()
+    pasted = []
+    for text in ("un", "deux", "trois"):
+        broker.paste(text, lambda: pasted.append(backend.text))
+    assert pasted == ["un", "deux", "trois"]
+    assert backend.reads == 1  # contenu utilisateur lu une seule fois
+    broker.restore_now()
+    assert backend.text == "utilisateur"
+    assert broker.get_stats()["restores"] == 1
+
+
+def test_repeated_paste_skips_write():
+    backend, broker = make_broker()
+    broker.paste("même", lambda: None)
+    broker.paste("même", lambda: None)
+    assert backend.writes == 1
+    assert broker.get_stats()["skipped_writes"] == 1
+    broker.restore_now()
+
+
+def test_user_copy_during_burst_is_not_overwritten():
+    backend, broker = make_broker()
+    broker.paste("injecté", lambda: None)
+    backend.set_text("copié par l'utilisateur")
+    broker.restore_now()
+    assert backend.text == "copié par l'utilisateur"
+    assert broker.get_stats()["skipped_restores"] == 1
+
+
+def test_copy_selection_reads_new_content():
+    backend, broker = make_broker()
+    assert broker.copy_selection(lambda: backend.set_text("sélection")) == "sélection"
+    # Sélection vide : la séquence ne change pas, pas de relecture
+    reads = backend.reads
+    assert broker.copy_selection(lambda: None) == ""
+    assert backend.reads == reads
+    broker.restore_now()
+    assert backend.text == "utilisateur"
+
+
+def test_restore_without_sequence_numbers():
+    backend, broker = make_broker(with_sequence=False)
+    broker.paste("injecté", lambda: None)
+    broker.restore_now()
+    assert backend.text == "utilisateur"
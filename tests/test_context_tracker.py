@@ -0,0 +1,104 @@
+"""
+Tests du suivi de la fenêtre au premier plan (source factice)
+"""
+
+import sys
+
+import pytest
+
+from core.context_tracker import ContextTracker, FakeWindowSource, app_predicate
+
+
+class FakeGrammar:
+    def __init__(self):
+        self.enabled = None
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+
+def test_current_is_cached_for_ttl():
+    source = FakeWindowSource("C:\\Apps\\chrome.exe", "page", 1)
+    tracker = ContextTracker(source, ttl=60)
+    assert tracker.current().executable_name == "chrome"
+    tracker.current()
+    tracker.current()
+    assert source.queries == 1
+    assert tracker.get_stats()["hits"] == 2
+
+
+def test_zero_ttl_queries_every_time():
+    source = FakeWindowSource("notepad.exe")
+    tracker = ContextTracker(source, ttl=0)
+    tracker.current()
+    tracker.current()
+    assert source.queries == 2
+
+
+def test_notify_foreground_updates_without_query():
+    source = FakeWindowSource("notepad.exe")
+    tracker = ContextTracker(source, ttl=60)
+    tracker.notify_foreground("firefox.exe", "x", 7)
+    assert tracker.current().executable_name == "firefox"
+    assert source.queries == 0
+
+
+def test_listeners_called_on_change_only_and_removable():
+    source = FakeWindowSource("notepad.exe")
+    tracker = ContextTracker(source, ttl=0)
+    changes = []
+
+    def listener(old, new):
+        changes.append(new.executable_name)
+
+    tracker.add_listener(listener)
+    tracker.refresh()
+    tracker.refresh()
+    source.set_foreground("chrome.exe")
+    tracker.refresh()
+    assert changes == ["notepad", "chrome"]
+
+    tracker.remove_listener(listener)
+    source.set_foreground("notepad.exe")
+    tracker.refresh()
+    assert changes == ["notepad", "chrome"]
+
+
+def test_bound_grammar_toggles_on_window_change():
+    source = FakeWindowSource("chrome.exe")
+    tracker = ContextTracker(source, ttl=0)
+    grammar = FakeGrammar()
+    tracker.bind_grammar(grammar, app_predicate("chrome", "firefox"))
+    assert grammar.enabled is True
+
+    source.set_foreground("notepad.exe")
+    tracker.refresh()
+    assert grammar.enabled is False
+
+    tracker.unbind_grammar(grammar)
+    source.set_foreground("firefox.exe")
+    tracker.refresh()
+    assert grammar.enabled is False
+    assert tracker.get_stats()["toggles"] == 2
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="hook réel sous Windows")
+def test_event_hook_is_noop_off_windows():
+    tracker = ContextTracker(FakeWindowSource("notepad.exe"))
+    assert tracker.start_event_hook() is False
+    tracker.stop_event_hook()
+
+
+def test_forget_drops_owned_listeners_and_bindings():
+    tracker = ContextTracker(FakeWindowSource("notepad.exe"), ttl=0)
+    grammar = FakeGrammar()
+    kept, dropped = (lambda old, new: None), (lambda old, new: None)
+    tracker.add_listener(kept)
+    tracker.add_listener(dropped)
+    tracker.bind_grammar(grammar, app_predicate("notepad"))
+    assert tracker.forget(lambda obj: obj is dropped or obj is grammar) == 2
+    assert tracker._listeners == [kept]
+    assert tracker._bindings == []
@@ -0,0 +1,61 @@
+"""
+Tests de la clé du cache de grammaires compilées (éléments factices)
+"""
+
+from core.grammar_cache import grammar_key
+
+
+class Element:
+    def __init__(self, *children, **params):
+        self._children = children
+        for name, value in params.items():
+            setattr(self, "_" + name, value)
+
+    @property
+    def children(self):
+        return self._children
+
+    def gstring(self):
+        return "<n>"  # identique quels que soient les paramètres
+
+
+class IntegerRef(Element):
+    pass
+
+
+class Named:
+    def __init__(self, name):
+        self.name = name
+
+
+class Rule:
+    def __init__(self, name, element):
+        self.name = name
+        self.element = element
+        self.exported = True
+
+
+class Grammar:
+    def __init__(self, *rules):
+        self.rules = rules
+        self.lists = ()
+
+
+def key(element):
+    return grammar_key(Grammar(Rule("r", element)), version="test")
+
+
+def test_key_changes_with_element_parameters():
+    assert key(Element(IntegerRef(min=1, max=10))) != key(Element(IntegerRef(min=1, max=20)))
+    assert key(Element(IntegerRef(min=1, max=10))) == key(Element(IntegerRef(min=1, max=10)))
+
+
+def test_key_uses_names_of_referenced_objects():
+    assert key(Element(list=Named("a"))) != key(Element(list=Named("b")))
+    # Objet sans nom (action) : seul son type compte, la clé reste stable
+    assert key(Element(value=object())) == key(Element(value=object()))
+
+
+def test_key_changes_with_tree_shape():
+    leaf = dict(words=("bonjour",))
+    assert key(Element(Element(Element(**leaf)))) != key(Element(Element(), Element(**leaf)))
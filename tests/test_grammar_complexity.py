@@ -0,0 +1,48 @@
+"""
+Tests du code de sortie de l'analyse de complexité (sources statiques)
+"""
+
+import sys
+
+import pytest
+
+from core import grammar_complexity
+
+SOURCE = '''
+from dragonfly import Grammar, Key, MappingRule
+
+
+class EditRule(MappingRule):
+    mapping = {
+        "copie": Key("c-c"),
+        "colle": Key("c-v"),
+        "coupe": Key("c-x"),
+        "annule [tout]": Key("c-z"),
+    }
+'''
+
+
+@pytest.fixture
+def grammar_file(tmp_path):
+    path = tmp_path / "edit_grammar.py"
+    path.write_text(SOURCE, encoding="utf-8")
+    return path
+
+
+def run(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["grammar_complexity", *args])
+    return grammar_complexity.main()
+
+
+def test_within_budget_exits_zero(monkeypatch, grammar_file, capsys):
+    assert run(monkeypatch, str(grammar_file)) == 0
+    assert "0 dépassement(s)" in capsys.readouterr().out
+
+
+def test_exceeded_budget_exits_one(monkeypatch, grammar_file, capsys):
+    assert run(monkeypatch, "--budget", "rule_specs=2", str(grammar_file)) == 1
+    assert "1 dépassement(s)" in capsys.readouterr().out
+
+
+def test_unknown_budget_exits_two(monkeypatch, grammar_file):
+    assert run(monkeypatch, "--budget", "nope=1", str(grammar_file)) == 2
@@ -0,0 +1,108 @@
+"""
+Tests du nettoyage des enregistrements d'un addon déchargé
+"""
+
+import importlib.util
+import sys
+import tracemalloc
+
+from core import context_tracker
+from core.context_tracker import ContextTracker, FakeWindowSource
+from core.grammar_loader import _release_registrations
+
+
+def test_release_drops_listeners_defined_in_the_addon(tmp_path, monkeypatch):
+    tracker = ContextTracker(FakeWindowSource(), ttl=0)
+    monkeypatch.setattr(context_tracker, "_TRACKER", tracker)
+    addon = tmp_path / "fake_addon"
+    addon.mkdir()
+    (addon / "fake_grammar.py").write_text(
+        "from core.context_tracker import get_context_tracker\n"
+        "get_context_tracker().add_listener(lambda old, new: None)\n",
+        encoding="utf-8",
+    )
+    spec = importlib.util.spec_from_file_location("fake_grammar", addon / "fake_grammar.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    foreign = lambda old, new: None  # noqa: E731
+    tracker.add_listener(foreign)
+
+    assert len(tracker._listeners) == 2
+    assert _release_registrations("fake_grammar", module) == 1
+    assert tracker._listeners == [foreign]
+
+
+def test_load_info_text_slowest_first(monkeypatch):
+    from core import grammar_loader
+
+    monkeypatch.setattr(grammar_loader, "LOADED_INFO", {
+        "a": {"addon": "x", "import_ms": 5.0, "alloc_bytes": 0, "grammars": 1, "rules": 2},
+        "b": {"addon": "x", "import_ms": 9.0, "alloc_bytes": 2048, "grammars": 1, "rules": 3},
+    })
+    assert grammar_loader.load_info_text() == [
+        "b (x): 9 ms, 2 KB, 1 grammar(s), 3 rule(s)",
+        "a (x): 5 ms, 0 KB, 1 grammar(s), 2 rule(s)",
+    ]
+
+
+def test_first_import_is_traced_then_reused(tmp_path, monkeypatch):
+    from core import grammar_loader
+
+    for name in ("LOADED", "LOADED_STATE", "LOADED_INFO", "ALLOC_BYTES"):
+        monkeypatch.setattr(grammar_loader, name, {})
+    file = tmp_path / "traced_grammar.py"
+    file.write_text("DATA = [bytes(1000) for _ in range(100)]\n", encoding="utf-8")
+    assert not tracemalloc.is_tracing()
+    try:
+        assert grammar_loader._load_grammar_file(file)
+        first = grammar_loader.LOADED_INFO["traced_grammar"]["alloc_bytes"]
+        assert first >= 100 * 1000
+        assert not tracemalloc.is_tracing()  # arrêté : démarré par le loader
+
+        grammar_loader.unload_individual_grammar("traced_grammar")
+        assert grammar_loader._load_grammar_file(file)
+        assert grammar_loader.LOADED_INFO["traced_grammar"]["alloc_bytes"] == first
+    finally:
+        sys.modules.pop("traced_grammar", None)
+
+
+def test_import_keeps_a_tracing_it_did_not_start(tmp_path, monkeypatch):
+    from core import grammar_loader
+
+    for name in ("LOADED", "LOADED_STATE", "LOADED_INFO", "ALLOC_BYTES"):
+        monkeypatch.setattr(grammar_loader, name, {})
+    file = tmp_path / "owned_grammar.py"
+    file.write_text("VALUE = 1\n", encoding="utf-8")
+    tracemalloc.start()
+    try:
+        assert grammar_loader._load_grammar_file(file)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+        sys.modules.pop("owned_grammar", None)
+
+
+def test_load_steps_run_one_grammar_at_a_time(tmp_path, monkeypatch):
+    from core import grammar_loader
+
+    for name in ("LOADED", "LOADED_STATE", "LOADED_INFO"):
+        monkeypatch.setattr(grammar_loader, name, {})
+    (tmp_path / "steps_good.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (tmp_path / "steps_bad.py").write_text("def (\n", encoding="utf-8")
+    files = [tmp_path / "steps_good.py", tmp_path / "steps_bad.py"]
+    monkeypatch.setattr(grammar_loader, "collect_grammar_files", lambda: files)
+
+    steps, finish = grammar_loader.load_steps()
+
+    assert finish is None
+    assert [name for name, _ in steps] == [None, "steps_good", "steps_bad"]
+    assert isinstance(grammar_loader.load_plan()[1][1], SyntaxError)
+    try:
+        assert [function() for _, function in steps[1:]] == [True, False]
+        assert grammar_loader.LOADED["steps_good"].VALUE == 1
+        # Charger tout garde ce qui est déjà chargé
+        module = grammar_loader.LOADED["steps_good"]
+        assert steps[1][1]() is True
+        assert grammar_loader.LOADED["steps_good"] is module
+    finally:
+        sys.modules.pop("steps_good", None)
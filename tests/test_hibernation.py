@@ -0,0 +1,41 @@
+"""
+Tests de la mise en veille (grammaires factices)
+"""
+
+import types
+
+from core import grammar_loader, hibernation
+from core.hibernation import DEFAULTS, GrammarHibernation
+
+
+class FakeGrammar:
+    name = "fake"
+    loaded = True
+    enabled = True
+    rules = ()
+
+    def disable(self):
+        self.enabled = False
+
+    def enable(self):
+        self.enabled = True
+
+
+def test_disabled_by_default():
+    assert DEFAULTS["enabled"] is False
+    assert GrammarHibernation(dict(DEFAULTS)).check_idle() == []
+
+
+def test_disable_mode_round_trip(monkeypatch):
+    grammar = FakeGrammar()
+    module = types.ModuleType("fake_grammar")
+    module.__file__ = str(grammar_loader.ADDON_DIR / "fake_addon" / "fake_grammar.py")
+    monkeypatch.setitem(grammar_loader.LOADED, "fake_grammar", module)
+    monkeypatch.setattr(hibernation, "grammars_of", lambda mod: [(grammar, "dragonfly")])
+    config = dict(DEFAULTS, enabled=True, idle_minutes=0, mode="disable")
+    sleeper = GrammarHibernation(config)
+
+    assert sleeper.check_idle() == ["fake_grammar"]
+    assert not grammar.enabled and sleeper.is_hibernated("fake_grammar")
+    assert sleeper.resume() == ["fake_grammar"]
+    assert grammar.enabled and not sleeper.is_hibernated("fake_grammar")
@@ -0,0 +1,43 @@
+"""
+Tests de la calibration du rythme d'injection (cible simulée)
+"""
+
+import os
+
+from core import injection_pacing
+from core.injection_pacing import (
+    FakeTextSink,
+    PacingCalibrator,
+    PacingProfile,
+    ProfileCache,
+    calibrate_executable,
+)
+
+
+def test_calibration_stays_above_drop_threshold():
+    sink = FakeTextSink(drop_below=0.003, reorder_below=0.001)
+    profile = PacingCalibrator(sink).calibrate()
+    assert profile.calibrated
+    assert profile.char_delay >= 0.003
+
+
+def test_simulated_calibration_is_not_saved(tmp_path, monkeypatch):
+    cache = ProfileCache(tmp_path / "profiles.json")
+    monkeypatch.setattr(injection_pacing, "_CACHE", cache)
+    calibrate_executable("notepad.exe", FakeTextSink())
+    assert cache.get("notepad.exe") is None
+    assert not cache.path.exists()
+
+
+def test_profile_cache_reloads_when_file_changes(tmp_path):
+    path = tmp_path / "profiles.json"
+    reader = ProfileCache(path)
+    assert reader.get("notepad.exe") is None
+
+    # Autre processus (CLI de calibration) qui écrit le fichier
+    ProfileCache(path).set("notepad.exe", PacingProfile(char_delay=0.004, calibrated=True))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    profile = reader.get("notepad.exe")
+    assert profile is not None and profile.char_delay == 0.004
@@ -0,0 +1,27 @@
+"""
+Tests de la compilation des specs Key
+"""
+
+from core.key_compiler import compile_keys, parse_key_spec
+
+
+def test_consecutive_presses_are_merged():
+    sequence = compile_keys("enter", "enter", "c-backspace")
+    assert sequence.spec == "enter:2, c-backspace"
+    assert sequence.keystrokes == 3
+
+
+def test_pause_is_written_in_hundredths():
+    sequence = compile_keys("backspace:3", pause=0.005)
+    assert sequence.spec == "backspace/0.5:3/0.5"
+
+
+def test_parse_keeps_repeat_and_pauses():
+    (press,) = parse_key_spec("left/5:4/10")
+    assert (press.key, press.repeat, press.inner, press.outer) == ("left", 4, "5", "10")
+
+
+def test_opaque_press_is_never_merged():
+    sequence = compile_keys("shift:down", "shift:down")
+    assert sequence.spec == "shift:down, shift:down"
+
@@ -0,0 +1,64 @@
+"""
+Tests du navigateur indexé du log (fichier temporaire, petit pas d'index)
+"""
+
+import pytest
+
+from core.log_index import LogIndex
+
+BLOCK = [
+    "[2025-01-{day} 10:00:00] INFO FTNatlink: démarrage",
+    "[2025-01-{day} 10:00:05] DEBUG FTNatlink.grammar: chargement notepad",
+    "[2025-01-{day} 10:01:00] WARNING FTNatlink.grammar: règle lente",
+    "[2025-01-{day} 11:00:00] ERROR FTNatlink: échec de l'injection",
+    "Traceback (most recent call last):",
+    "  ValueError: boom",
+    "[2025-01-{day} 12:00:00] INFO other: message notepad",
+    "[2025-01-{day} 12:30:00] ancienne ligne sans niveau",
+]
+DAYS = 20
+
+
+@pytest.fixture
+def index(tmp_path):
+    path = tmp_path / "ftnatlink.log"
+    lines = [line.format(day=f"{day:02d}") for day in range(1, DAYS + 1) for line in BLOCK]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    log_index = LogIndex(path, tmp_path / "index.pickle", stride=128)
+    yield log_index
+    log_index.close()
+
+
+def test_text_search_includes_continuation_lines(index):
+    records = list(index.search(text="boom"))
+    assert len(records) == DAYS
+    assert records[0].level == "ERROR"
+    assert records[0].message.startswith("échec de l'injection")
+    assert "ValueError: boom" in records[0].message
+
+
+def test_level_and_logger_filters(index):
+    assert {r.level for r in index.search(level="WARNING")} == {"WARNING", "ERROR"}
+    assert len(list(index.search(logger="FTNatlink.grammar"))) == 2 * DAYS
+    # Enfants "FTNatlink.xxx" inclus, "other" et les lignes sans niveau exclus
+    assert len(list(index.search(logger="FTNatlink"))) == 4 * DAYS
+
+
+def test_time_bounds_and_line_numbers(index):
+    records = list(index.search(since="2025-01-05 11", until="2025-01-05 12:00"))
+    assert [r.time for r in records] == ["2025-01-05 11:00:00", "2025-01-05 12:00:00"]
+    assert index.line_of(records[0].offset) == 4 * len(BLOCK) + 4  # 1-based
+    assert index.get_stats()["lines"] == DAYS * len(BLOCK)
+
+
+def test_index_is_persisted_and_extended(index):
+    list(index.search(text="démarrage"))
+    assert index.index_path.exists()
+    with open(index.path, "a", encoding="utf-8") as f:
+        f.write("[2025-02-01 08:00:00] INFO FTNatlink: nouvelle entrée\n")
+    again = LogIndex(index.path, index.index_path, stride=128)
+    try:
+        assert again.indexed_to > 0  # index relu depuis le disque
+        assert [r.message for r in again.search(text="nouvelle entrée")] == ["nouvelle entrée"]
+    finally:
+        again.close()
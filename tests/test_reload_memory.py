@@ -0,0 +1,24 @@
+"""
+Tests de la détection des addons qui grossissent au rechargement
+"""
+
+from core.reload_memory import OTHERS, ReloadMemoryTracker
+
+
+def tracker_with(history):
+    tracker = ReloadMemoryTracker()
+    tracker.history = history
+    return tracker
+
+
+def test_listener_sized_leak_is_reported():
+    assert tracker_with({"notepad_addon": [13_800] * 3}).growing() == ["notepad_addon"]
+
+
+def test_slow_steady_growth_is_reported():
+    tracker = tracker_with({"slow": [1_000] * 5, "slower": [1_000] * 6, OTHERS: [50_000] * 6})
+    assert tracker.growing() == ["slower"]
+
+
+def test_stable_reloads_are_not_reported():
+    assert tracker_with({"stable": [20_000, -19_000, 300, -200, 100, 0]}).growing() == []
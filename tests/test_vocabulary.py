@@ -0,0 +1,44 @@
+"""
+Tests de l'automate de vocabulaire et du fichier utilisateur
+"""
+
+import os
+
+from core.vocabulary import PhraseAutomaton, UserVocabulary, parse_vocabulary
+
+
+def test_leftmost_longest_whole_words():
+    automaton = PhraseAutomaton([("retour", "\n"), ("retour à la ligne", "\n"), ("ftn", "FTNatlink")])
+    assert automaton.apply("fin retour à la ligne suite") == "fin \n suite"
+    assert automaton.apply("retournement ftn") == "retournement FTNatlink"
+
+
+def test_case_and_whitespace_folding():
+    automaton = PhraseAutomaton([("nouvelle ligne", "\n"), ("Python", "🐍"), ("virgule", ",")])
+    assert automaton.apply("a  Nouvelle\tLigne b") == "a  \n b"
+    assert automaton.apply("python Python") == "python 🐍"
+    automaton = PhraseAutomaton([("point final", "fin.")])
+    assert automaton.apply("Point final") == "Fin."
+
+
+def test_later_rule_overrides_earlier():
+    automaton = PhraseAutomaton([("ftn", "a"), ("ftn", "b")])
+    assert len(automaton) == 1
+    assert automaton.apply("ftn") == "b"
+
+
+def test_parse_vocabulary_escapes():
+    lines = ["# commentaire", "", "sans egal", "tab = \\t", "espace = \\s", " ftn = FTNatlink "]
+    assert parse_vocabulary(lines) == [("tab ", "\t"), ("espace ", " "), ("ftn ", "FTNatlink")]
+
+
+def test_user_file_is_compiled_cached_and_reloaded(tmp_path):
+    path = tmp_path / "vocabulary.txt"
+    path.write_text("ftn = FTNatlink\n", encoding="utf-8")
+    vocabulary = UserVocabulary(path, tmp_path / "vocabulary.pickle", check_interval=0)
+    assert vocabulary.apply("ftn à la ligne") == "FTNatlink \n"
+    assert (tmp_path / "vocabulary.pickle").exists()
+
+    path.write_text("ftn = autre chose\n", encoding="utf-8")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+    assert vocabulary.apply("ftn") == "autre chose"
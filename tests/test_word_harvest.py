@@ -0,0 +1,44 @@
+"""
+Tests du vocabulaire récolté (liste en mémoire à la place de dragonfly.List)
+"""
+
+from core.word_harvest import MemoryWordList, WordHarvest, harvest_words
+
+
+def test_harvest_words_skips_elisions_and_digits():
+    assert harvest_words("L'été 2024, il-y-a un Mot") == ["été", "il-y-a", "un", "mot"]
+
+
+def test_additions_are_published_with_extend():
+    target = MemoryWordList()
+    harvest = WordHarvest(target, max_words=10)
+    harvest.harvest("w1", "alpha beta")
+    harvest.harvest("w1", "gamma")
+    harvest.harvest("w1", "beta")
+    assert sorted(target) == ["alpha", "beta", "gamma"]
+    assert target.updates == 2
+    assert harvest.stats["full_sets"] == 0
+    assert harvest.stats["skipped"] == 1
+
+
+def test_eviction_is_batched_past_the_cap():
+    target = MemoryWordList()
+    harvest = WordHarvest(target, max_words=20, evict_batch=5)
+    for i in range(100):
+        harvest.harvest("w1", f"mot{chr(97 + i % 26)}{chr(97 + i // 26)}")
+    # 100 mots, un seul par énoncé : un set par lot de 5 évictions, pas à chaque mot
+    assert harvest.stats["full_sets"] == (100 - 20) // 6 + 1
+    assert 15 <= len(target) <= 20
+    assert sorted(target) == sorted(harvest.words("w1"))
+
+
+def test_activate_swaps_window_vocabulary():
+    target = MemoryWordList()
+    harvest = WordHarvest(target)
+    harvest.harvest("w1", "alpha")
+    harvest.harvest("w2", "beta")
+    assert list(target) == ["alpha"]
+    harvest.activate("w2")
+    assert list(target) == ["beta"]
+    harvest.activate("w3")
+    assert list(target) == []
@@ -0,0 +1,17 @@
+"""
+Tests du comptage des frappes des specs Key
+"""
+
+from core.key_compiler import compile_keys
+from core.word_selection import count_keystrokes
+
+
+def test_count_keystrokes_plain_specs():
+    assert count_keystrokes(["left", "right:3", "s-right:2"]) == 6
+    assert count_keystrokes(["a, b:2"]) == 3
+
+
+def test_count_keystrokes_paced_specs():
+    spec = compile_keys("backspace:3", pause=0.005).spec
+    assert count_keystrokes([spec]) == 3
+    assert count_keystrokes(["c-backspace/1:2/3", "enter/20"]) == 3
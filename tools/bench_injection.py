@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark du pipeline d'injection du miroir de dictée (sans Windows)
+Rejoue des scénarios sur le backend d'enregistrement et affiche, par
+scénario, le nombre de frappes, d'opérations presse-papiers et la latence émise.
+
+Usage:
+    python tools/bench_injection.py [--keystroke-cost 0.001]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.injection_backend import RecordingBackend, set_backend
+from core.context_tracker import ContextTracker, FakeWindowSource, set_context_tracker
+
+UTTERANCES = [
+    "bonjour à tous",
+    "voici le compte rendu de la réunion .",
+    "nouvelle ligne premier point",
+    "le budget est validé , le planning aussi",
+    "nouveau paragraphe conclusion",
+]
+
+
+def _reset_mirror(gm):
+    gm._restore_tail_state(
+        {
+            "prev_ended_with_space": True,
+            "prev_ended_with_newline": False,
+            "prev_ended_sentence": True,
+            "prev_last_char": "",
+            "has_injected_once": False,
+            "force_capital_next": True,
+        }
+    )
+    gm._JOURNAL.clear()
+
+
+def run_scenarios(keystroke_cost=0.0):
+    """Exécute les scénarios et retourne {nom: résumé du backend d'enregistrement}."""
+    backend = set_backend(RecordingBackend(keystroke_cost=keystroke_cost))
+    set_context_tracker(ContextTracker(FakeWindowSource("notepad.exe", "bench")))
+
+    from addons.notepad_addon import _global_mirror as gm
+
+    scenarios = {}
+
+    def scenario(name, fn, mode=None):
+        _reset_mirror(gm)
+        previous_mode = gm.INJECTION_MODE
+        if mode:
+            gm.INJECTION_MODE = mode
+        backend.reset()
+        try:
+            fn()
+        finally:
+            gm.INJECTION_MODE = previous_mode
+        gm._BROKER.restore_now()
+        scenarios[name] = backend.summary()
+
+    def dictate():
+        for utterance in UTTERANCES:
+            gm.mirror_text(utterance)
+
+    scenario("dictée keys_slow", dictate, "keys_slow")
+    scenario("dictée keys", dictate, "keys")
+    scenario("dictée paste", dictate, "paste")
+
+    def select_found():
+        backend.selection = "le budget est validé, le planning aussi"
+        gm._select_word_left("budget")
+
+    def select_miss():
+        backend.selection = "le budget est validé, le planning aussi"
+        gm._select_word_left("réunion")
+
+    scenario("sélection trouvée", select_found)
+    scenario("sélection manquée", select_miss)
+
+    def undo_three():
+        dictate()
+        backend.reset()
+        gm.undo_dictation(3)
+
+    scenario("annuler 3 dictées", undo_three, "keys")
+
+    def correction():
+        gm.mirror_text("le budget est validé")
+        backend.reset()
+        gm.correct_dictation("le budget est reporté")
+
+    scenario("correction", correction, "keys")
+    return scenarios
+
+
+def main():
+    cost = 0.0
+    if "--keystroke-cost" in sys.argv:
+        cost = float(sys.argv[sys.argv.index("--keystroke-cost") + 1])
+
+    results = run_scenarios(cost)
+    print(f"{'Scénario':<22} {'frappes':>8} {'événements':>11} {'presse-p.':>10} {'latence':>10}")
+    print("-" * 65)
+    for name, summary in results.items():
+        print(
+            f"{name:<22} {summary['keystrokes']:>8} {summary['events']:>11} "
+            f"{summary['clipboard_ops']:>10} {summary['latency'] * 1000:>8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()